@@ -0,0 +1 @@
+__all__ = ["synthetic_frames", "vision_benchmarks"]
\ No newline at end of file
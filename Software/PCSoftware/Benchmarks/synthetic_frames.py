@@ -0,0 +1,95 @@
+import numpy as np
+
+from Emulator.emulator_os import draw_frame
+from Emulator.SoftwareDrivers.ConfigFiles.config import pipetteModel
+
+BASE_SIZE = 750 # Size of the emulator frames, positions are scaled from it
+SEED = 0 # Seed of the frame noise
+
+class syntheticScene():
+    """
+    Deterministic sequence of emulated frames. The pipette advances towards
+    a stationary cell until the cell is aspirated, drawn by the emulator
+    model at any resolution, with optional Gaussian noise.
+    """
+    def __init__(self, size = BASE_SIZE, noise = 0, frames = 60,
+    seed = SEED):
+        """
+        Initialise the scene.
+
+        Args:
+            size (int, optional): Width and height of the frames.
+            noise (float, optional): Standard deviation of the Gaussian noise
+            added to the frames. Defaults to 0 (no noise).
+            frames (int, optional): Number of frames in the sequence.
+            seed (int, optional): Seed of the frame noise.
+        """
+        self.size = size
+        self.noise = noise
+        self.frames = frames
+        self.seed = seed
+
+        # Positions of the emulator model are given in 750px frames
+        self.scale = size/BASE_SIZE
+        self.yPipette = [-pipetteModel['pipetteHeight'],
+            pipetteModel['pipetteHeight']]
+        self.cell = [450, 300]
+
+    def pipette_origin(self, n):
+        """
+        Position of the pipette tip in a frame of the sequence (in 750px
+        frames).
+
+        Args:
+            n (int): Number of the frame (from 0).
+
+        Returns:
+            int, int: X and Y position of the pipette tip.
+        """
+        return 150 + int(300*n/max(self.frames - 1, 1)), 300
+
+    def frame(self, n):
+        """
+        Draw a frame of the sequence.
+
+        Args:
+            n (int): Number of the frame (from 0).
+
+        Returns:
+            numpy.ndarray: The frame.
+        """
+        xOrigin, yOrigin = self.pipette_origin(n)
+        s = self.scale
+        frame = draw_frame(0, [int(s*y) for y in self.yPipette],
+            int(s*xOrigin), int(s*yOrigin),
+            [[int(s*self.cell[0]), int(s*self.cell[1])]], self.size,
+            self.size)
+
+        # Add the same noise to every channel (as in a grayscale microscope)
+        if(self.noise > 0):
+            rng = np.random.default_rng((self.seed, n))
+            noise = self.noise*rng.standard_normal(frame.shape[:2],
+                dtype = np.float32)
+            noisy = frame + noise[:, :, np.newaxis]
+            frame = np.clip(noisy, 0, 255).astype(np.uint8)
+
+        return frame
+
+    def __iter__(self):
+        """
+        Draw the frames of the sequence one at a time (large frames are not
+        all held in memory).
+        """
+        for n in range(self.frames):
+            yield self.frame(n)
+
+    def cell_box(self):
+        """
+        Bounding box of the cell, as selected by a user.
+
+        Returns:
+            List: Cell box [X, Y, W, H] in frame coordinates.
+        """
+        s = self.scale
+        return [int(s*(self.cell[0] - 10)), int(s*(self.cell[1] - 25)),
+            int(s*50), int(s*50)]
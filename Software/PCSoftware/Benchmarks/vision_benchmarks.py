@@ -0,0 +1,257 @@
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+
+import cv2
+import numpy as np
+
+from ComputerVision.image_processing_OS import process_frame
+from ComputerVision.SoftwareDrivers.image_processing_driver import *
+from .synthetic_frames import syntheticScene
+
+SIZES = [750, 1500] # Width and height of the benchmarked frames
+NOISE_LEVELS = [0, 10] # Standard deviation of the frame noise
+NUM_FRAMES = 30 # Number of frames per benchmark
+SENSITIVITY = 20 # Edge threshold of pipette detection
+
+def tracked_pipette(frame):
+    """ Detect the pipette in a frame, to provide the pipette range and
+    centreline the aspiration benchmarks depend on.
+
+    Args:
+        frame (FrameContext): Context of the frame.
+
+    Returns:
+        pipetteTracker: Pipette tracker updated on the frame.
+    """
+    tracker = pipetteTracker()
+    tracker.update_track(frame, SENSITIVITY)
+    return tracker
+
+def bench_pipette_update(scene):
+    """ Time pipetteTracker.update_track on each frame of the scene.
+
+    Returns:
+        List: Time of each frame (ms).
+    """
+    tracker = pipetteTracker()
+    times = []
+    for img in scene:
+        frame = FrameContext(img)
+        start = time.perf_counter()
+        tracker.update_track(frame, SENSITIVITY)
+        times.append(1000*(time.perf_counter() - start))
+    return times
+
+def bench_asp_update(scene):
+    """ Time aspTracker.update_track on each frame of the scene, with a
+    Cell being aspirated at the pipette tip.
+
+    Returns:
+        List: Time of each frame (ms).
+    """
+    times = []
+    for img in scene:
+        frame = FrameContext(img)
+        pipette = tracked_pipette(frame)
+        tracker = aspTracker()
+        tracker.set_track_position(pipette.get_track_range())
+        tracker.set_state(asp_track_state.ACTIVE_ASP_TRACK)
+
+        start = time.perf_counter()
+        tracker.update_track(frame, pipette.get_track_range(),
+            pipette.mu_grad, pipette.mu_offset)
+        times.append(1000*(time.perf_counter() - start))
+    return times
+
+def bench_asp_iter(scene):
+    """ Time aspTracker.asp_iter (from the pipette tip to base) on each frame
+    of the scene.
+
+    Returns:
+        List: Time of each frame (ms).
+    """
+    tracker = aspTracker()
+    times = []
+    for img in scene:
+        frame = FrameContext(img)
+        pipette = tracked_pipette(frame)
+        pipRange = pipette.get_track_range()
+        gray = frame.gray()
+
+        start = time.perf_counter()
+        tracker.asp_iter(gray, [int(pipRange[0] + pipRange[2]/2) - 10, 10],
+            -1, 5, pipette.mu_grad, pipette.mu_offset, 10)
+        times.append(1000*(time.perf_counter() - start))
+    return times
+
+def bench_mosse_update(scene):
+    """ Time MOSSE tracker updates of the Cell over the scene.
+
+    Returns:
+        List: Time of each frame (ms).
+    """
+    tracker = cellTracker()
+    times = []
+    for n, img in enumerate(scene):
+        frame = FrameContext(img)
+        if(n == 0):
+            tracker.create_mosse_track(frame, tuple(scene.cell_box()))
+            continue
+
+        start = time.perf_counter()
+        tracker.update_track(frame)
+        times.append(1000*(time.perf_counter() - start))
+    return times
+
+def bench_end_to_end(scene):
+    """ Time the full per-frame pipeline (tracker manager update and image
+    information) on each frame of the scene, with the Cell selected on the
+    first frame.
+
+    Returns:
+        List: Time of each frame (ms).
+    """
+    manager = trackerManager()
+    times = []
+    for n, img in enumerate(scene):
+        start = time.perf_counter()
+        process_frame(manager, img, SENSITIVITY)
+        times.append(1000*(time.perf_counter() - start))
+
+        if(n == 0):
+            x, y, w, h = scene.cell_box()
+            manager.init_cell_track_at([[x, y], [w, h]])
+    return times
+
+# Benchmarks by name
+BENCHMARKS = {
+    "pipette_update": bench_pipette_update,
+    "asp_update": bench_asp_update,
+    "asp_iter": bench_asp_iter,
+    "mosse_update": bench_mosse_update,
+    "end_to_end": bench_end_to_end,
+}
+
+def summarise(times):
+    """ Summarise the frame times of a benchmark.
+
+    Returns:
+        dict: Number of frames and the mean, percentiles, minimum and maximum
+        time per frame (ms).
+    """
+    times = np.array(times)
+    return dict(frames = len(times), mean_ms = float(times.mean()),
+        p50_ms = float(np.percentile(times, 50)),
+        p95_ms = float(np.percentile(times, 95)),
+        min_ms = float(times.min()), max_ms = float(times.max()))
+
+def environment():
+    """ Description of the environment the benchmarks ran in.
+
+    Returns:
+        dict: Time, versions, platform and git commit.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"],
+            capture_output = True, text = True).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return dict(time = time.strftime("%Y-%m-%dT%H:%M:%S"),
+        python = platform.python_version(), numpy = np.__version__,
+        opencv = cv2.__version__, platform = platform.platform(),
+        commit = commit)
+
+def run_benchmarks(names, sizes, noiseLevels, frames):
+    """ Run benchmarks over synthetic scenes of each size and noise level.
+    A benchmark failing (e.g. MOSSE missing from the OpenCV build) is
+    recorded with its error.
+
+    Args:
+        names (List): Names of the benchmarks to run.
+        sizes (List): Width and height of the frames.
+        noiseLevels (List): Standard deviation of the frame noise.
+        frames (int): Number of frames per benchmark.
+
+    Returns:
+        dict: Environment and the result of each benchmark.
+    """
+    results = []
+    for name in names:
+        for size in sizes:
+            for noise in noiseLevels:
+                scene = syntheticScene(size, noise, frames)
+                result = dict(benchmark = name, size = size, noise = noise)
+                try:
+                    result.update(summarise(BENCHMARKS[name](scene)))
+                except Exception as e:
+                    result['error'] = "%s: %s"%(type(e).__name__, e)
+                results.append(result)
+                print("> %s %dpx noise %g: %s"%(name, size, noise,
+                    result.get('error') or "%.3f ms/frame"%(
+                    result['mean_ms'])), file = sys.stderr)
+
+    return dict(environment = environment(), results = results)
+
+def compare(previous, current):
+    """ Print the change in mean frame time of each benchmark from a previous
+    run.
+
+    Args:
+        previous (dict): Results of the previous run.
+        current (dict): Results of the current run.
+    """
+    key = lambda result: (result['benchmark'], result['size'],
+        result['noise'])
+    old = {key(result): result for result in previous['results']}
+
+    print("Benchmark,Size,Noise,Previous (ms/frame),Current (ms/frame)," +
+        "Speedup")
+    for result in current['results']:
+        before = old.get(key(result))
+        if((before is None) or ('mean_ms' not in before) or
+            ('mean_ms' not in result)):
+            continue
+        print("%s,%d,%g,%.3f,%.3f,%.2f"%(result['benchmark'], result['size'],
+            result['noise'], before['mean_ms'], result['mean_ms'],
+            before['mean_ms']/result['mean_ms']))
+
+def main():
+    """ Command line entry point of the benchmark suite.
+    """
+    parser = argparse.ArgumentParser(description = "Benchmark the computer " +
+        "vision drivers on synthetic emulator frames.")
+    parser.add_argument("--benchmarks", nargs = "+", default = list(BENCHMARKS),
+        choices = list(BENCHMARKS), help = "Benchmarks to run (default all)")
+    parser.add_argument("--sizes", nargs = "+", type = int, default = SIZES,
+        help = "Frame widths and heights (default %s)"%(SIZES))
+    parser.add_argument("--noise", nargs = "+", type = float,
+        default = NOISE_LEVELS, help = "Noise standard deviations " +
+        "(default %s)"%(NOISE_LEVELS))
+    parser.add_argument("--frames", type = int, default = NUM_FRAMES,
+        help = "Frames per benchmark (default %d)"%(NUM_FRAMES))
+    parser.add_argument("--output", help = "JSON file to write the results " +
+        "to (default standard output)")
+    parser.add_argument("--compare", help = "JSON results of a previous run " +
+        "to compare against")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.benchmarks, args.sizes, args.noise,
+        args.frames)
+
+    if(args.output):
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent = 2)
+    else:
+        print(json.dumps(results, indent = 2))
+
+    if(args.compare):
+        with open(args.compare, "r") as previous:
+            compare(json.load(previous), results)
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import os
 import sys
 import math
 
@@ -5,6 +6,10 @@ import cv2
 import numpy as np
 import statistics
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    "..", ".."))
+from ComputerVision.SoftwareDrivers.line_detection_driver import *
+
 FONT_SIZE = 0.4 # Font size used in displaying text
 INITIAL_X = 20 # Minimum X coordinate for iteration
 COMP_DIST = 10 # Pipette tip comparison distance
@@ -67,46 +72,26 @@ def videoMicropipetteIdentification(videoPath, startFrame):
         hough_lines = cv2.HoughLinesP(cannyFrame,1,np.pi/180, 20, None, 30, 5)
         houghLineFrame = np.empty(gray_frame.shape)
 
-        #print("Number of lines is %d"%(len(hough_lines)))
-
-        # Iterate over the lines, noting the frequency of rho
-        lineAngles = dict()
-
+        # Skip frames without lines (no pipette edges to find)
+        if hough_lines is None:
+            continue
 
-        lines = []
+        #print("Number of lines is %d"%(len(hough_lines)))
 
+        # Display the lines in the hough frame
         for line in hough_lines:
-            lines.append(line[0])
-
-        lines = sorted(lines, key=lambda x:x[1])
-        if len(lines) % 2:
-            medianY = lines[int((len(lines) - 1)/2)][1]
-        else:
-            medianY = int((lines[int((len(lines) - 1)/2)][1] + lines[int((len(lines) - 1)/2 + 1)][1])/2) 
-
-        for line in lines:
-            # Display the line in the hough frame
+            line = line[0]
             cv2.line(houghLineFrame, (line[0], line[1]), (line[2], line[3]), 
             (255,255,255), 2)
 
-            if(line[2] - line[0] == 0):
-                continue
-            rho = str(round(float((line[3] - line[1])/(line[2] - line[0])),1))
-
-            if rho in lineAngles.keys():
-                lineAngles[rho] = lineAngles[rho] + 1
-            else:
-                lineAngles[rho] = 1
-
-
-        # Find the most frequent rho in the image
-        maxFrequency = -1
-        max_freq_angle = 0
-        for key in lineAngles.keys():
-            if(maxFrequency < lineAngles[key]):
-                maxFrequency = lineAngles[key]
-                max_freq_angle = float(key)
-
+        # Find the most frequent line gradient and the max/min (Y coordinate)
+        # lines that have the most frequent angle
+        edgeLines = dominant_edge_lines(hough_lines, binTolerance = 1,
+            maxMedianDist = 500, meanY = True)
+        if edgeLines is None:
+            print("No pipette edge lines found - Frame:%d"%(frame_count))
+            continue
+        max_freq_angle, min_line, max_line = edgeLines
 
         # Display the Hough lines in the Hough frame
         if(wait_frame(houghLineFrame.copy(), 
@@ -116,38 +101,12 @@ def videoMicropipetteIdentification(videoPath, startFrame):
         print("Most frequent rate of change is %.2f"%(max_freq_angle))
         culledFrame = gray_frame.copy()
 
-        # Find the max/min (Y coordinate) lines that have the most frequent angle
-        max_line = [None, None, None, None]
-        min_line = [None, None, None, None]
-
-
-
-        for n,line in enumerate(lines):
-
-            if(line[2] - line[0] == 0):
-                continue
-
-            rho = round(float((line[3] - line[1])/(line[2] - line[0])),1)
-            offset = lines[3] - rho * line[2]
-
-            if 500 < abs(line[1] - medianY):
-                continue
-
-            # Ensure the line matches the most frequent angle
-            if abs(rho - max_freq_angle) > 0.1:
-                continue
-
-            cv2.line(culledFrame, (line[0], line[1]), (line[2], line[3]), 
-            (255,255,255), 2)
-
-            muY = (line[3] + line[1])/2
-            # Set to max line if greater Y than current maxline
-            if (None in max_line) or ((max_line[3] + max_line[1])/2 < muY):
-                max_line = line
-
-            # Set to min line if smaller Y than current minline
-            if (None in min_line) or (muY < (min_line[3] + min_line[1])/2):
-                min_line = line
+        # Display the lines that match the most frequent angle
+        lines, bins = quantise_gradients(hough_lines)
+        max_freq_bin = round(max_freq_angle * GRADIENT_BINS_PER_UNIT)
+        for line in lines[np.abs(bins - max_freq_bin) <= 1]:
+            cv2.line(culledFrame, (int(line[0]), int(line[1])), 
+            (int(line[2]), int(line[3])), (255,255,255), 2)
 
         # Display the Hough lines in the Hough frame
         if(wait_frame(culledFrame.copy(), 
@@ -1,9 +1,14 @@
+import os
 import sys
 import math
 
 import cv2
 import numpy as np
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    "..", ".."))
+from ComputerVision.SoftwareDrivers.line_detection_driver import *
+
 FONT_SIZE = 0.4 # Font size used in displaying text
 INITIAL_X = 10 # Minimum X coordinate for iteration
 COMP_DIST = 20 # Pipette tip comparison distance
@@ -180,69 +185,14 @@ def find_pipette_tip(frame, edge_thresh):
     if hough_lines is None:
         return [None, None, None, None]
 
-    # Iterate over the lines, noting the frequency of rho
-    lineAngles = dict()
-    lines = []
-
-    for line in hough_lines:
-        lines.append(line[0])
-
-    lines = sorted(lines, key=lambda x:x[1])
-    if len(lines) % 2:
-        medianY = lines[int((len(lines) - 1)/2)][1]
-    else:
-        medianY = int((lines[int((len(lines) - 1)/2)][1] + lines[int((len(lines) - 1)/2 + 1)][1])/2) 
-
-    for line in lines:
-        
-        if(line[2] - line[0] == 0):
-            continue
-
-        rho = str(round(float((line[3] - line[1])/(line[2] - line[0])),1))
-
-        if rho in lineAngles.keys():
-            lineAngles[rho] = lineAngles[rho] + 1
-        else:
-            lineAngles[rho] = 1
-
-
-    # Find the most frequent rho in the image
-    maxFrequency = -1
-    max_freq_angle = 0
-    for key in lineAngles.keys():
-        if(maxFrequency < lineAngles[key]):
-            maxFrequency = lineAngles[key]
-            max_freq_angle = float(key)
-
-    # Find the max/min (Y coordinate) lines that have the most frequent angle
-    max_line = [None, None, None, None]
-    min_line = [None, None, None, None]
-
-    for n,line in enumerate(lines):
-
-        if(line[2] - line[0] == 0):
-            continue
-
-        rho = round(float((line[3] - line[1])/(line[2] - line[0])),1)
-
-        if 500 < abs(line[1] - medianY):
-            continue
-
-        # Ensure the line matches the most frequent angle
-        if abs(rho - max_freq_angle) > 0.1:
-            continue
-
-        muY = (line[3] + line[1])/2
-        # Set to max line if greater Y than current maxline
-        if (None in max_line) or ((max_line[3] + max_line[1])/2 < muY):
-            max_line = line
-
-        # Set to min line if smaller Y than current minline
-        if (None in min_line) or (muY < (min_line[3] + min_line[1])/2):
-            min_line = line
+    # Find the most frequent line gradient and the pipette edge lines,
+    # ignoring lines far from the median line
+    edgeLines = dominant_edge_lines(hough_lines, binTolerance = 1,
+        maxMedianDist = 500, meanY = True)
 
-    if None in max_line or None in min_line:
+    if edgeLines is None:
         return [None, None, None, None]
+    max_freq_angle, min_line, max_line = edgeLines
 
     # Create line functions that represent the top and bottom pipette edges
     mu_grad = max_freq_angle
@@ -4,5 +4,59 @@ IMAG_VIDEO = False
 
 VIDEO_PATH = None
 
+VIDEO_EVERY_FRAME = False
+
 MIN_PIP_LEN = 5
 
+FRAME_RING_SLOTS = 4
+
+PIPETTE_BAND_DETECTION = False
+
+PIPETTE_BAND_MARGIN = 20
+
+CAPTURE_BUFFER_SIZE = 2
+
+CAPTURE_FPS = 25
+
+CAPTURE_RETRY_DELAY = 0.01
+
+CAPTURE_TIMEOUT = 5
+
+CAPTURE_REPORT_INTERVAL = 10
+
+PIPETTE_PYRAMID_LEVELS = 0
+
+PIPETTE_REFINE_WINDOW = 16
+
+CELL_TRACKER_WORKERS = 4
+
+CONCURRENT_TRACKER_STAGES = True
+
+TRACKER_STAGE_WORKERS = 2
+
+MOTION_PREDICTION = False
+
+PREDICTION_SIGMAS = 3
+
+PREDICTION_MARGIN = 10
+
+PREDICTION_REACQUIRE_FRAMES = 2
+
+COMMAND_AWARE_DETECTION = False
+
+PIPETTE_SETTLE_TIME = 0.5
+
+PIPETTE_MAX_VERIFIED_FRAMES = 50
+
+PIPETTE_VERIFY_WINDOW = 20
+
+PIPETTE_VERIFY_SAMPLES = 8
+
+PIPETTE_VERIFY_THRESHOLD = 20
+
+VISION_PROFILING = False
+
+PROFILE_WINDOW = 500
+
+PROFILE_REPORT_INTERVAL = 2
+
@@ -0,0 +1,307 @@
+import cv2
+import time
+import threading
+from collections import deque
+from .ConfigFiles.settings import *
+from sessionRecording import replayCapture
+
+class stillCapture():
+    """
+    Capture device repeatedly providing a single still image.
+    """
+    def __init__(self, img):
+        """
+        Initialise the still capture.
+
+        Args:
+            img (numpy.ndarray): Image provided on every read.
+        """
+        self.img = img
+
+    def read(self):
+        """
+        Read method to access the image via the Capture device.
+
+        Returns:
+            bool, numpy.ndarray: True iff the image exists, and the image.
+        """
+        return (self.img is not None), self.img
+
+class capturePrefetcher():
+    """
+    Continuously reads frames from a capture device on a background thread
+    into a bounded buffer, so frame requests are answered with the newest
+    frame without waiting on the device.
+    """
+    def __init__(self, cap, fps = None, videoPath = None,
+    size = CAPTURE_BUFFER_SIZE):
+        """
+        Initialise the prefetcher (the thread is started with start).
+
+        Args:
+            cap (object): Capture device providing a read method.
+            fps (float, optional): Rate to read frames at. None reads as fast
+            as the device provides frames. Defaults to None.
+            videoPath (str, optional): Path of a video file to reopen once
+            its last frame is read. Defaults to None.
+            size (int, optional): Number of frames buffered.
+        """
+        self.cap = cap
+        self.period = (1/fps) if fps else None
+        self.videoPath = videoPath
+
+        # Buffer of frames not yet taken and the last frame taken
+        self.buffer = deque(maxlen = size)
+        self.latest = None
+        self.lock = threading.Condition()
+
+        self.stats = dict(captured = 0, failed = 0, delivered = 0,
+            dropped = 0, duplicated = 0)
+        self.lastReport = time.time()
+
+        self.thread = threading.Thread(target = self.capture_loop,
+            daemon = True)
+        self.running = False
+
+    def start(self):
+        """
+        Start reading frames on the background thread.
+        """
+        self.running = True
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stop reading frames.
+        """
+        self.running = False
+
+    def capture_loop(self):
+        """
+        Processing loop of the capture thread.
+        """
+        nextRead = time.time()
+
+        while(self.running):
+            # Pace reads for sources that do not block until a new frame
+            if(self.period is not None):
+                nextRead = max(nextRead + self.period, time.time())
+                time.sleep(max(nextRead - time.time(), 0))
+
+            ret, frame = self.cap.read()
+
+            # If the read failed, restart video files from the first frame
+            if(not ret):
+                with self.lock:
+                    self.stats['failed'] += 1
+                if(self.videoPath is not None):
+                    self.cap = cv2.VideoCapture(self.videoPath)
+                else:
+                    time.sleep(CAPTURE_RETRY_DELAY)
+                continue
+
+            with self.lock:
+                # A full buffer drops its oldest frame
+                if(len(self.buffer) == self.buffer.maxlen):
+                    self.stats['dropped'] += 1
+                self.buffer.append(frame)
+                self.stats['captured'] += 1
+                self.lock.notify()
+
+    def get_frame(self, timeout = CAPTURE_TIMEOUT):
+        """
+        Take the newest frame. If no new frame has been read since the last
+        frame was taken, the last frame is taken again. Only blocks until the
+        first frame has been read, at most for the timeout.
+
+        Args:
+            timeout (float, optional): Maximum time to wait for the first
+            frame in seconds.
+
+        Returns:
+            bool, numpy.ndarray: True iff a frame has been read, and the
+            newest frame (None if no frame has been read).
+        """
+        deadline = time.time() + timeout
+        with self.lock:
+            while((not self.buffer) and (self.latest is None)):
+                # Stop waiting once the timeout expires, or if the capture
+                # thread has ended
+                remaining = deadline - time.time()
+                if((remaining <= 0) or (not self.thread.is_alive())):
+                    return False, None
+                self.lock.wait(remaining)
+
+            if(self.buffer):
+                # Frames older than the newest frame are never processed
+                self.latest = self.buffer.pop()
+                self.stats['dropped'] += len(self.buffer)
+                self.buffer.clear()
+                self.stats['delivered'] += 1
+            else:
+                self.stats['duplicated'] += 1
+
+            return True, self.latest
+
+    def get_stats(self):
+        """
+        Getter method for capture statistics.
+
+        Returns:
+            dict: Number of frames captured, failed reads, frames delivered,
+            frames dropped (never processed) and frames duplicated (processed
+            again).
+        """
+        with self.lock:
+            return dict(self.stats)
+
+    def report_stats(self, interval = CAPTURE_REPORT_INTERVAL):
+        """
+        Print the capture statistics, at most once per interval.
+
+        Args:
+            interval (float, optional): Seconds between reports.
+        """
+        if(time.time() - self.lastReport < interval):
+            return
+        self.lastReport = time.time()
+
+        stats = self.get_stats()
+        print("> Capture: %d captured, %d delivered, %d dropped, "%(
+            stats['captured'], stats['delivered'], stats['dropped']) +
+            "%d duplicated, %d failed reads"%(stats['duplicated'],
+            stats['failed']))
+
+class onDemandCapture():
+    """
+    Reads a frame from a capture device only when a frame is taken, for
+    devices that produce frames on request (the emulator) and video files
+    processed frame by frame. Frames are never produced without being
+    processed, and always show the current state.
+    """
+    def __init__(self, cap):
+        """
+        Initialise the capture.
+
+        Args:
+            cap (object): Capture device providing a read method.
+        """
+        self.cap = cap
+        self.latest = None
+
+        self.stats = dict(captured = 0, failed = 0, delivered = 0,
+            dropped = 0, duplicated = 0)
+        self.lastReport = time.time()
+
+    def start(self):
+        """
+        Start the capture. Frames are read as they are taken, so there is no
+        background thread.
+        """
+        return
+
+    def stop(self):
+        """
+        Stop the capture.
+        """
+        return
+
+    def get_frame(self, timeout = CAPTURE_TIMEOUT):
+        """
+        Read a new frame. If the read fails, the last frame is taken again
+        (only blocking until the first frame has been read, at most for the
+        timeout).
+
+        Args:
+            timeout (float, optional): Maximum time to wait for the first
+            frame in seconds.
+
+        Returns:
+            bool, numpy.ndarray: True iff a frame has been read, and the
+            newest frame (None if no frame has been read).
+        """
+        deadline = time.time() + timeout
+        while(True):
+            ret, frame = self.cap.read()
+            if(ret):
+                self.latest = frame
+                self.stats['captured'] += 1
+                self.stats['delivered'] += 1
+                return True, frame
+
+            self.stats['failed'] += 1
+            if(self.latest is not None):
+                self.stats['duplicated'] += 1
+                return True, self.latest
+            if(time.time() >= deadline):
+                return False, None
+            time.sleep(CAPTURE_RETRY_DELAY)
+
+    def get_stats(self):
+        """
+        Getter method for capture statistics.
+
+        Returns:
+            dict: Number of frames captured, failed reads, frames delivered,
+            frames dropped (always 0) and frames duplicated (processed again
+            after a failed read).
+        """
+        return dict(self.stats)
+
+    # Statistics are reported as by the prefetcher
+    report_stats = capturePrefetcher.report_stats
+
+def open_capture(emulation):
+    """
+    Open the configured capture source (emulator, replayed session, video
+    file, still image or camera) and wrap it in a capture prefetcher (or an
+    on demand capture for the emulator and replayed sessions).
+
+    Args:
+        emulation (CaptureEmulator or replayCapture): Capture emulator
+        instance, or the replay of a recorded session.
+
+    Returns:
+        capturePrefetcher or onDemandCapture: Capture reading from the
+        capture source.
+    """
+    # If emulator flag is true, use the emulator (rendering frames on
+    # request)
+    if(IMAG_EMULATOR or isinstance(emulation, replayCapture)):
+        return onDemandCapture(emulation)
+
+    # Otherwise, if using video file load the video as the capture
+    if((IMAG_VIDEO) and (VIDEO_PATH != None)):
+        split_path = VIDEO_PATH.split(".")
+        if((split_path[-1] == "mp4") or (split_path[-1] == "avi")):
+            return open_video_capture(VIDEO_PATH, VIDEO_EVERY_FRAME)
+        elif((split_path[-1] == "jpg") or (split_path[-1] == "png")):
+            img = cv2.imread(VIDEO_PATH, cv2.IMREAD_COLOR)
+            return capturePrefetcher(stillCapture(img), CAPTURE_FPS)
+
+    # Otherwise, default to video capture 0 for feed
+    return capturePrefetcher(cv2.VideoCapture(0))
+
+def open_video_capture(videoPath, everyFrame = VIDEO_EVERY_FRAME):
+    """
+    Open a video file as a capture. By default the video plays at its frame
+    rate, looping, and each request takes the newest frame (frames read
+    between requests are dropped). Processing every frame instead reads the
+    next frame of the video on each request, so the tracker outputs match
+    batch tracking of the video frame for frame. Once the video ends, its
+    last frame is taken again.
+
+    Args:
+        videoPath (str): Path of the video file.
+        everyFrame (bool, optional): True iff every frame is processed, in
+        order. Defaults to VIDEO_EVERY_FRAME.
+
+    Returns:
+        capturePrefetcher or onDemandCapture: Capture reading from the video.
+    """
+    cap = cv2.VideoCapture(videoPath)
+    if(everyFrame):
+        return onDemandCapture(cap)
+
+    fps = cap.get(cv2.CAP_PROP_FPS) or CAPTURE_FPS
+    return capturePrefetcher(cap, fps, videoPath)
@@ -0,0 +1,126 @@
+import time
+from .ConfigFiles.settings import *
+
+class detectionSchedule():
+    """
+    Schedules full pipette detection around commanded motion. The pipette
+    only moves when a motion command is sent, so full detection is run while
+    a move is in progress and for a settling time afterwards. Otherwise the
+    last detection is verified with a cheap check, escalating to full
+    detection when the check fails.
+    """
+    def __init__(self, enabled = COMMAND_AWARE_DETECTION,
+    settleTime = PIPETTE_SETTLE_TIME,
+    maxVerifiedFrames = PIPETTE_MAX_VERIFIED_FRAMES, clock = time.time):
+        """
+        Initialise the schedule, with no move in progress.
+
+        Args:
+            enabled (bool, optional): True iff frames may be verified instead
+            of running full detection.
+            settleTime (float, optional): Seconds after the expected
+            completion of a move that full detection continues to run for.
+            maxVerifiedFrames (int, optional): Maximum number of consecutive
+            verified frames before full detection is forced.
+            clock (function, optional): Current time (time.time() seconds),
+            replaced by the frame time when replaying a session.
+        """
+        self.enabled = enabled
+        self.settleTime = settleTime
+        self.maxVerifiedFrames = maxVerifiedFrames
+        self.clock = clock
+
+        # Expected completion time of the last move (time.time() seconds)
+        self.moveEnd = None
+        self.verifiedFrames = 0
+
+        self.stats = dict(frames = 0, moving = 0, forced = 0, hits = 0,
+            misses = 0)
+        self.lastStats = dict(self.stats)
+
+    def notify_motion(self, completion):
+        """
+        Notify the schedule of a motion command.
+
+        Args:
+            completion (float): Expected completion time of the move
+            (time.time() seconds). Infinite while the completion is unknown.
+        """
+        self.moveEnd = completion
+
+    def moving(self):
+        """
+        Check if a move is in progress or settling.
+
+        Returns:
+            bool: True iff a move is in progress or settling. Otherwise,
+            False.
+        """
+        return ((self.moveEnd is not None) and
+            (self.clock() < self.moveEnd + self.settleTime))
+
+    def verify_frame(self):
+        """
+        Decide how the pipette is detected in the current frame.
+
+        Returns:
+            bool: True iff the last detection is to be verified. False if
+            full detection is to be run.
+        """
+        self.stats['frames'] += 1
+        if(not self.enabled):
+            return False
+
+        if(self.moving()):
+            self.stats['moving'] += 1
+            return False
+
+        if(self.verifiedFrames >= self.maxVerifiedFrames):
+            self.stats['forced'] += 1
+            return False
+
+        return True
+
+    def record(self, verify, verified):
+        """
+        Record the outcome of the detection in the current frame.
+
+        Args:
+            verify (bool): True iff verification was attempted.
+            verified (bool): True iff verification succeeded.
+        """
+        if(verified):
+            self.verifiedFrames += 1
+            self.stats['hits'] += 1
+        else:
+            self.verifiedFrames = 0
+            if(verify):
+                self.stats['misses'] += 1
+
+    def get_stats(self):
+        """
+        Getter method for schedule statistics.
+
+        Returns:
+            dict: Number of frames, frames with full detection due to a move
+            or forced after consecutive verified frames, verifications
+            succeeding (hits) and failing (misses), and the hit rate.
+        """
+        stats = dict(self.stats)
+        stats['hitRate'] = stats['hits']/max(stats['hits'] + stats['misses'],
+            1)
+        return stats
+
+    def report_stats(self):
+        """
+        Print the schedule statistics since the last report (if enabled).
+        """
+        if(not self.enabled):
+            return
+
+        stats = {name: self.stats[name] - self.lastStats[name]
+            for name in self.stats}
+        self.lastStats = dict(self.stats)
+        print("> Pipette detection: %d frames, %d moving, %d forced, "%(
+            stats['frames'], stats['moving'], stats['forced']) +
+            "%d verified, %d escalated"%(stats['hits'], stats['misses']))
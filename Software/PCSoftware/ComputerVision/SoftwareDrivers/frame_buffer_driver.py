@@ -0,0 +1,171 @@
+from multiprocessing import shared_memory
+import numpy as np
+from .ConfigFiles.settings import *
+
+SEQUENCE_BYTES = 8 # Bytes of the sequence number held for each slot
+
+class sharedFrameRing():
+    """
+    Ring of preallocated frame slots held in shared memory. The producer
+    copies each frame into the next slot and only passes a small header
+    (layout, slot index and sequence number) to the consumer, which maps the
+    same memory and reads the frame in place. Each slot holds the sequence
+    number of its frame, so frames overwritten by the producer before being
+    read are dropped, and frames overwritten while being used are detected
+    by checking the sequence number again afterwards.
+    """
+    def __init__(self, slots = FRAME_RING_SLOTS):
+        """
+        Initialise an empty frame ring. Memory is allocated (producer) or
+        attached (consumer) once the first frame layout is known.
+
+        Args:
+            slots (int, optional): Number of frame slots in the ring. A frame
+            remains valid until (slots - 1) further frames have been written.
+        """
+        self.slots = slots
+        self.sequence = 0
+
+        # Shared memory block, its layout (name, slots, shape, dtype), the
+        # sequence number of the frame in each slot and the views of each
+        # slot
+        self.sharedBlock = None
+        self.layout = None
+        self.sequences = None
+        self.frames = None
+
+    def write(self, frame):
+        """
+        Copy a frame into the next slot of the ring (producer side).
+
+        Args:
+            frame (numpy.ndarray): Frame to publish.
+
+        Returns:
+            tuple: Header (layout, slot, sequence) describing the frame.
+        """
+        # Reallocate the ring if the frame size or type has changed
+        if((self.layout is None) or
+            (self.layout[2:] != (frame.shape, frame.dtype.str))):
+            self.allocate(frame.shape, frame.dtype)
+
+        # Copy the frame into the next slot, marking the slot as being
+        # written until the copy is complete
+        slot = self.sequence % self.slots
+        self.sequences[slot] = -1
+        np.copyto(self.frames[slot], frame)
+        self.sequences[slot] = self.sequence
+
+        header = (self.layout, slot, self.sequence)
+        self.sequence += 1
+        return header
+
+    def read(self, header):
+        """
+        View the frame described by a header in the ring, without copying it
+        (consumer side). The producer may overwrite the slot once (slots - 1)
+        further frames have been written, so anything derived from the view
+        must be discarded if valid(header) is False once it has been used.
+
+        Args:
+            header (tuple): Header returned by write in the producer.
+
+        Returns:
+            numpy.ndarray: View of the frame in shared memory. None if the
+            producer has overwritten its slot.
+        """
+        layout, slot, sequence = header
+
+        # Attach to the producers memory if the layout has changed
+        if(layout != self.layout):
+            self.attach(layout)
+
+        if(not self.valid(header)):
+            return None
+        return self.frames[slot]
+
+    def valid(self, header):
+        """
+        Check if the frame described by a header is still held in its slot
+        (consumer side).
+
+        Args:
+            header (tuple): Header returned by write in the producer.
+
+        Returns:
+            bool: True iff the slot holds the frame and is not being written.
+            Otherwise, False.
+        """
+        layout, slot, sequence = header
+        return (layout == self.layout) and (self.sequences[slot] == sequence)
+
+    def allocate(self, shape, dtype):
+        """
+        Create a new shared memory block for frames of the given layout.
+
+        Args:
+            shape (tuple): Shape of a single frame.
+            dtype (numpy.dtype): Data type of a single frame.
+        """
+        self.close(unlink = True)
+
+        frameBytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        self.sharedBlock = shared_memory.SharedMemory(create = True,
+            size = self.slots * (SEQUENCE_BYTES + frameBytes))
+        self.layout = (self.sharedBlock.name, self.slots, tuple(shape),
+            np.dtype(dtype).str)
+        self.map_block(tuple(shape), np.dtype(dtype))
+        self.sequences[:] = -1
+
+    def attach(self, layout):
+        """
+        Attach to a shared memory block created by the producer.
+
+        Args:
+            layout (tuple): Name, slot count, shape and dtype of the block.
+        """
+        self.close()
+
+        name, self.slots, shape, dtype = layout
+        self.sharedBlock = shared_memory.SharedMemory(name = name)
+        self.layout = layout
+        self.map_block(tuple(shape), np.dtype(dtype))
+
+    def map_block(self, shape, dtype):
+        """
+        Map the slot sequence numbers, followed by the frame slots, onto the
+        shared memory block.
+
+        Args:
+            shape (tuple): Shape of a single frame.
+            dtype (numpy.dtype): Data type of a single frame.
+        """
+        self.sequences = np.ndarray((self.slots,), dtype = np.int64,
+            buffer = self.sharedBlock.buf)
+        self.frames = np.ndarray((self.slots,) + shape, dtype = dtype,
+            buffer = self.sharedBlock.buf, offset = self.slots*SEQUENCE_BYTES)
+
+    def close(self, unlink = False):
+        """
+        Release the current shared memory block.
+
+        Args:
+            unlink (bool, optional): True iff the block should be destroyed
+            (producer side). Defaults to False.
+        """
+        if(self.sharedBlock is None):
+            return
+
+        self.sequences = None
+        self.frames = None
+        try:
+            self.sharedBlock.close()
+        # Frames still referenced elsewhere keep the mapping alive
+        except BufferError:
+            pass
+
+        if(unlink):
+            self.sharedBlock.unlink()
+
+        self.sharedBlock = None
+        self.layout = None
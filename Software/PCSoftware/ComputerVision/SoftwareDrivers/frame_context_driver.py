@@ -0,0 +1,119 @@
+import cv2
+import threading
+from .profiling_driver import profiler
+
+class FrameContext():
+    """
+    Products derived from a single frame (grayscale, blurred, Canny edges and
+    pyramid levels). Each product is computed on first request and reused by
+    every later request within the same frame.
+    """
+    def __init__(self, img):
+        """
+        Initialise the context of a new frame.
+
+        Args:
+            img (numpy.ndarray): 3 by 2D array representing RGB image
+        """
+        self.img = img
+        self.products = {}
+
+        # Trackers may request products from several threads at once
+        self.lock = threading.RLock()
+
+    def memoised(self, key, compute):
+        """
+        Get a derived product, computing it if this is the first request.
+
+        Args:
+            key (tuple): Key uniquely identifying the product.
+            compute (function): Function computing the product.
+
+        Returns:
+            numpy.ndarray: The derived product.
+        """
+        with self.lock:
+            product = self.products.get(key)
+            if(product is None):
+                with profiler.stage(key[0]):
+                    product = compute()
+                self.products[key] = product
+            return product
+
+    def gray(self):
+        """
+        Getter method for the grayscale frame.
+
+        Returns:
+            numpy.ndarray: 2D array representing grayscale image
+        """
+        return self.memoised(('gray',),
+            lambda: cv2.cvtColor(self.img, cv2.COLOR_BGR2GRAY))
+
+    def blurred(self, ksize = 5):
+        """
+        Getter method for the Gaussian blurred grayscale frame.
+
+        Args:
+            ksize (int, optional): Size of the Gaussian kernel. Defaults to 5.
+
+        Returns:
+            numpy.ndarray: 2D array representing blurred grayscale image
+        """
+        return self.memoised(('blurred', ksize),
+            lambda: cv2.GaussianBlur(self.gray(), (ksize, ksize), 0))
+
+    def canny(self, low, high, top = 0, bottom = None, level = 0):
+        """
+        Getter method for the Canny edges of the grayscale frame (or of a
+        horizontal band of its rows).
+
+        Args:
+            low (int): Lower hysteresis threshold
+            high (int): Upper hysteresis threshold
+            top (int, optional): First row of the band. Defaults to 0.
+            bottom (int, optional): Row after the last row of the band.
+            Defaults to the frame height.
+            level (int, optional): Pyramid level of the grayscale frame, rows
+            are given at this level. Defaults to 0.
+
+        Returns:
+            numpy.ndarray: 2D array of edge pixels
+        """
+        gray = self.pyramid(level, gray = True)
+        bottom = min(gray.shape[0] if bottom is None else bottom,
+            gray.shape[0])
+        return self.memoised(('canny', low, high, top, bottom, level),
+            lambda: cv2.Canny(gray[top:bottom], low, high))
+
+    def pyramid(self, level, gray = False):
+        """
+        Getter method for a downscaled pyramid level of the frame. Each level
+        halves the width and height of the level above it.
+
+        Args:
+            level (int): Pyramid level (0 is the full resolution frame)
+            gray (bool, optional): True iff the grayscale pyramid is
+            requested. Defaults to False.
+
+        Returns:
+            numpy.ndarray: The frame at the requested pyramid level
+        """
+        if(level <= 0):
+            return self.gray() if gray else self.img
+        return self.memoised(('pyramid', level, gray),
+            lambda: cv2.pyrDown(self.pyramid(level - 1, gray)))
+
+def frame_context(img):
+    """
+    Get the frame context of a frame, wrapping plain frames in a new context.
+
+    Args:
+        img (FrameContext or numpy.ndarray): Frame or its context
+
+    Returns:
+        FrameContext: Context of the frame
+    """
+    if(isinstance(img, FrameContext)):
+        return img
+    return FrameContext(img)
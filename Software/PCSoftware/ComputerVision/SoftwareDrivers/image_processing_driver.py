@@ -3,7 +3,23 @@ import numpy as np
 from .ConfigFiles.config import *
 from .ConfigFiles.settings import *
 from systemInformation import *
-import copy
+from .frame_context_driver import *
+from .stage_scheduler_driver import *
+from .detection_schedule_driver import *
+from .profiling_driver import profiler
+from concurrent.futures import ThreadPoolExecutor
+
+def set_motion_prediction(tracker):
+    """
+    Configure motion prediction of a tracker from the settings.
+
+    Args:
+        tracker (basicTracker): Tracker to configure.
+    """
+    tracker.motionPrediction = MOTION_PREDICTION
+    tracker.predictionSigmas = PREDICTION_SIGMAS
+    tracker.predictionMargin = PREDICTION_MARGIN
+    tracker.reacquireFrames = PREDICTION_REACQUIRE_FRAMES
 
 class pipetteTracker(basicTracker):
     """ 
@@ -16,17 +32,41 @@ class pipetteTracker(basicTracker):
         """
         basicTracker.__init__(self)
 
-    def update_track(self, img, sensitivity):
+        # Detect the pipette edges in a band around the last known edges
+        self.bandDetection = PIPETTE_BAND_DETECTION
+        self.bandMargin = PIPETTE_BAND_MARGIN
+
+        # Detect the pipette on a downscaled pyramid level (0 disables)
+        self.pyramidLevels = PIPETTE_PYRAMID_LEVELS
+        self.refineWindow = PIPETTE_REFINE_WINDOW
+
+        # Search for the tip around its predicted position
+        set_motion_prediction(self)
+
+    def update_track(self, img, sensitivity, verify = False):
         """ 
         Update the Basic tracker to identify the objects position within the 
         incoming frame.
 
         Args:
-            img (numpy.ndarray): Numpy array representing pixel values of the 
-            new frame.
+            img (FrameContext): Context of the new frame.
+            verify (bool, optional): True iff the last detection is verified
+            first, running full detection only if verification fails.
+            Defaults to False.
+
+        Returns:
+            bool: True iff the last detection was verified.
         """
         # Update position on basic tracker
-        updatedPosition = self.update_basic_track(img, sensitivity, 20, 1)
+        self.predict_motion()
+        updatedPosition = None
+        if(verify):
+            with profiler.stage("verify"):
+                updatedPosition = self.verify_position(img, sensitivity)
+        verified = updatedPosition is not None
+        if(not verified):
+            updatedPosition = self.detect_position(img, sensitivity)
+        self.correct_motion(updatedPosition)
         
         # Check if the track has moved significantly. If so, update position
         if updatedPosition is not None:
@@ -35,6 +75,127 @@ class pipetteTracker(basicTracker):
             if change_in_pos is None or 20 < change_in_pos:
                     self.set_track_position(updatedPosition)
 
+        return verified
+
+    def verify_position(self, img, sensitivity):
+        """
+        Cheaply verify the last detection. The tip must be found within a
+        window around the tracked tip, and pixels sampled along the pipette
+        body must still lie on both known edges.
+
+        Args:
+            img (FrameContext or numpy.ndarray): Frame context or 3 by 2D
+            array representing RGB image
+            sensitivity (int): Threshold required for an edge between pixels
+
+        Returns:
+            list: Pipette position. None if verification failed.
+        """
+        if((not self.active_track()) or (self.edgeSpread is None)):
+            return
+
+        gray_frame = frame_context(img).gray()
+        height, width = gray_frame.shape[:2]
+
+        # The tip must be found near the tracked tip
+        tipX = self.trackPosition[0]
+        tip = self.locate_tip(gray_frame, self.mu_grad, self.mu_offset,
+            sensitivity, max(tipX - PIPETTE_VERIFY_WINDOW, 0), 1,
+            stopPos = tipX + PIPETTE_VERIFY_WINDOW, requireEdge = True)
+        if(tip is None):
+            return
+
+        # Sample the pipette body behind the tip
+        x = tip - 10 - 10*np.arange(PIPETTE_VERIFY_SAMPLES)
+        x = x[x >= 0]
+        if(len(x) == 0):
+            return
+        min_offset = self.mu_offset - self.edgeSpread/2
+        max_offset = self.mu_offset + self.edgeSpread/2
+
+        # Each edge must differ from the pixels either side of it, for most
+        # of the samples
+        for offset in (min_offset, max_offset):
+            y = (x * self.mu_grad + offset).astype(np.intp)
+            if((y.min() < 3) or (y.max() >= height - 3)):
+                return
+            edge = gray_frame[y, x].astype(np.int32)
+            strength = np.maximum(np.abs(edge - gray_frame[y - 3, x]),
+                np.abs(edge - gray_frame[y + 3, x]))
+            if(np.mean(PIPETTE_VERIFY_THRESHOLD < strength) < 0.75):
+                return
+
+        return [tip, int(tip * self.mu_grad + min_offset), 0,
+            max_offset - min_offset]
+
+    def detect_position(self, img, sensitivity):
+        """
+        Detect the pipette position in a frame, on a pyramid level if
+        configured or otherwise at full resolution.
+
+        Args:
+            img (FrameContext or numpy.ndarray): Frame context or 3 by 2D
+            array representing RGB image
+            sensitivity (int): Threshold required for an edge between pixels
+
+        Returns:
+            list: Pipette position. None if no position is found.
+        """
+        if(self.pyramidLevels > 0):
+            return self.update_pyramid_track(frame_context(img), sensitivity,
+                20, 1)
+        return self.update_basic_track(img, sensitivity, 20, 1)
+
+    def update_pyramid_track(self, frame, thresh, startPos, step):
+        """
+        Coarse to fine pipette detection. The edge lines and an approximate
+        tip are found on a downscaled pyramid level, then the tip is refined
+        at full resolution within a window around the approximate tip.
+
+        Args:
+            frame (FrameContext): Context of the new frame.
+            thresh (int): Threshold required for an edge between pixels
+            startPos (int): Starting position for tracker search
+            step (int): Step taken per one iteration
+
+        Returns:
+            list: Pipette position. None if no position is found.
+        """
+        level = self.pyramidLevels
+        scale = 2**level
+
+        # Find the pipette edges on the pyramid level
+        edges = self.find_edges(frame, level)
+        if edges is None:
+            return
+        mu_grad, mu_offset, min_offset, max_offset = edges
+
+        # Approximate the tip along the centreline on the pyramid level
+        with profiler.stage("tip scan"):
+            coarseTip = self.locate_predicted_tip(
+                frame.pyramid(level, gray = True), mu_grad, mu_offset/scale,
+                thresh, startPos//scale, step, max(5//scale, 1),
+                scale = scale)
+        if(coarseTip is None):
+            return
+        coarseTip *= scale
+
+        # Refine the tip at full resolution within the window (not searching
+        # before the start position)
+        windowStart = coarseTip - step*self.refineWindow
+        if(step > 0):
+            windowStart = max(windowStart, startPos)
+        else:
+            windowStart = min(windowStart, startPos)
+        with profiler.stage("tip scan"):
+            tipX = self.locate_tip(frame.gray(), mu_grad, mu_offset, thresh,
+                windowStart, step, stopPos = coarseTip + step*self.refineWindow)
+        if(tipX is None):
+            tipX = coarseTip
+
+        return [tipX, int(tipX * mu_grad + min_offset), 0,
+            max_offset - min_offset]
+
 
 class cellTracker(MOSSETracker):
     """ 
@@ -47,14 +208,16 @@ class cellTracker(MOSSETracker):
         """
         MOSSETracker.__init__(self)
 
+        # Reacquire lost tracks at their predicted position
+        set_motion_prediction(self)
+
     def update_track(self, img):
         """ 
         Update the MOSSE tracker to identify the objects position within the 
         incoming frame.
 
         Args:
-            img (numpy.ndarray): Numpy array representing pixel values of the 
-            new frame.
+            img (FrameContext): Context of the new frame.
         """
         self.update_mosse_track(img)
         
@@ -70,6 +233,9 @@ class aspTracker(MOSSETracker):
         """
         MOSSETracker.__init__(self)
 
+        # Reacquire lost tracks at their predicted position
+        set_motion_prediction(self)
+
     def check_aspiration(self, pipRange, cellRange):
         """ 
         Check if a cell is being aspirated, given the position of the 
@@ -115,8 +281,7 @@ class aspTracker(MOSSETracker):
         incoming frame.
 
         Args:
-            img (numpy.ndarray): Numpy array representing pixel values of the 
-            new frame.
+            img (FrameContext): Context of the new frame.
             pipRange (int[]): Current Pipette tracker range
         """
         # Check the current tracker state
@@ -124,14 +289,26 @@ class aspTracker(MOSSETracker):
 
         # If currently aspirating
         if state == asp_track_state.ACTIVE_ASP_TRACK:
-            # Convert the frame to grayscale and display grayscale frame
-            src = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-
-            # Find first edge iterating from the Pipette tip to base
-            backwardAspCheck = self.asp_iter(src, 
-            [int(pipRange[0] + pipRange[2]/2) - 10, 10], 
-            -1, 5, mu_grad, mu_offset, 10)
+            # Get the grayscale frame (shared by all trackers this frame)
+            src = img.gray()
+            self.predict_motion()
+
+            # Find first edge iterating from the Pipette tip to base, first
+            # only within the range the edge is predicted to be in
+            backwardAspCheck = None
+            tipStart = int(pipRange[0] + pipRange[2]/2) - 10
+            window = self.prediction_window(0)
+            if window is not None:
+                self.predictionStats['attempts'] += 1
+                backwardAspCheck = self.asp_iter(src,
+                [min(tipStart, window[1]), max(window[0], 10)],
+                -1, 5, mu_grad, mu_offset, 10)
+                if backwardAspCheck is not None:
+                    self.predictionStats['hits'] += 1
+
+            if backwardAspCheck is None:
+                backwardAspCheck = self.asp_iter(src,
+                [tipStart, 10], -1, 5, mu_grad, mu_offset, 10)
             
             '''
             backwardAspCheck = self.update_basic_track(img, 30, 
@@ -148,15 +325,20 @@ class aspTracker(MOSSETracker):
 
             # If no edge was found in a direction: No cell was found
             if (backwardAspCheck is None) or (forwardAspCheck is None):
+                self.correct_motion(None)
                 self.set_track_position(pipRange)
 
             # If edges found were relatively close: Currently aspirating
             elif abs(forwardAspCheck - backwardAspCheck) < 30:
+                self.correct_motion([backwardAspCheck, pipRange[1], 0,
+                    pipRange[3]])
                 self.set_track_position([backwardAspCheck, pipRange[1], 0, pipRange[3]])
             
             # If two distinct edges were found: The cell is fully aspirated
             else:
-                # Initialise MOSSE tracker for the fully aspirated cell
+                # Initialise MOSSE tracker for the fully aspirated cell, its
+                # motion is predicted afresh
+                self.predictor.reset()
                 self.create_mosse_track(img, 
                 (forwardAspCheck - 20, pipRange[1],
                 abs(pipRange[0] - forwardAspCheck + 10), 
@@ -170,23 +352,54 @@ class aspTracker(MOSSETracker):
 
 
     def asp_iter(self, src, x_range, step, comp_dist, mu_grad, mu_offset, thresh):
-        
-        # Start X-iterations at initial condition
-        iteration = x_range[0]
-
-        # Iterate horizontally in the X-range to find egde
-        for x_coord in range(x_range[0], x_range[1], step):
-            curr_pixel = int(src[int(x_coord * mu_grad + mu_offset), x_coord])
-            comp_pixel = int(src[int((x_coord + step*comp_dist) * mu_grad + mu_offset),
-                                    x_coord + step*comp_dist])
+        """
+        Find the first edge along the pipette centreline within an X-range.
+        The intensity profile along the centreline is sampled in a single
+        indexing operation and compared against the profile shifted by the
+        comparison distance.
 
-            # If difference meets the threshold, this is the edge
-            if thresh < abs(curr_pixel - comp_pixel):
-                iteration = int(x_coord + step*comp_dist/2)
-                break
+        Args:
+            src (numpy.ndarray): Grayscale frame
+            x_range (int[]): [Start, end) X coordinates of the search
+            step (int): Direction (and stride) of the search
+            comp_dist (int): Number of steps between compared pixels
+            mu_grad (float): Gradient of the pipette centreline
+            mu_offset (int): Offset of the pipette centreline
+            thresh (int): Threshold required for an edge between pixels
 
-            # Step iteration
-            iteration += step
+        Returns:
+            int: X coordinate of the edge. None if no edge is found.
+        """
+        # X coordinates of each pixel and the pixel it is compared to
+        x_coords = np.arange(x_range[0], x_range[1], step)
+        comp_coords = x_coords + step*comp_dist
+
+        # Y coordinates of the compared pixels along the centreline
+        y_coords = (x_coords * mu_grad + mu_offset).astype(np.intp)
+        comp_y_coords = (comp_coords * mu_grad + mu_offset).astype(np.intp)
+
+        # Only compare pixels up to the first that falls outside the frame
+        height, width = src.shape[:2]
+        in_frame = ((-height <= y_coords) & (y_coords < height)
+            & (-height <= comp_y_coords) & (comp_y_coords < height)
+            & (-width <= x_coords) & (x_coords < width)
+            & (-width <= comp_coords) & (comp_coords < width))
+        last = len(x_coords) if in_frame.all() else int(np.argmin(in_frame))
+
+        # Difference between each pixel and its comparison pixel
+        difference = np.abs(
+            src[y_coords[:last], x_coords[:last]].astype(np.int32)
+            - src[comp_y_coords[:last], comp_coords[:last]])
+        edges = thresh < difference
+
+        # The first difference meeting the threshold is the edge
+        if edges.any():
+            iteration = int(x_coords[np.argmax(edges)] + step*comp_dist/2)
+        elif last < len(x_coords):
+            raise IndexError("Aspiration edge search left the frame at " +
+                "x = %d"%(x_coords[last]))
+        else:
+            iteration = x_range[0] + step*len(x_coords)
 
         if(step > 0):
             if(iteration >= x_range[1]):
@@ -208,14 +421,34 @@ class trackerManager():
         Initialise members of the trackerManager.
         """
 
-        # Initialise the current image
+        # Initialise the current image and its context
         self.img = None
+        self.frame = None
 
         # Initialise a Pipette, Cell and Aspiration tracker
         self.pipetteTracker = pipetteTracker()
         self.cellTracker = cellTracker()
         self.aspTracker = aspTracker()
 
+        # Cell trackers by ID. The most recently selected cell is the primary
+        # Cell tracker (self.cellTracker), an inactive tracker if no cells
+        self.cellTrackers = {}
+        self.nextCellId = 0
+        self.primaryCellId = None
+
+        # Worker pool to update Cell trackers in parallel (OpenCV releases
+        # the GIL while updating)
+        self.cellPool = ThreadPoolExecutor(max_workers = CELL_TRACKER_WORKERS)
+
+        # Scheduler running independent tracker updates concurrently, and the
+        # Asp tracker state at the start of the frame
+        self.scheduler = stageScheduler(TRACKER_STAGE_WORKERS,
+            CONCURRENT_TRACKER_STAGES)
+        self.aspFrameState = basic_track_state.NO_ACTIVE_TRACK
+
+        # Schedule of full pipette detection around commanded motion
+        self.pipetteSchedule = detectionSchedule()
+
     def update(self, img, sensitivity):
         """ 
         Update the current image and tracker states.
@@ -224,56 +457,66 @@ class trackerManager():
             img (numpy.ndarray): Next frame to process.
             sensitivity (int): Threshold for the Pipette tracker
         """
-        # Update the image member
+        # Update the image member. Products derived from the image are built
+        # once in its context and shared by every tracker
         self.img = img
+        self.frame = FrameContext(img)
         
-        # Update the trackers for the next frame
-        self.update_asp_track()
-        self.update_cell_track()
-        self.update_pipette_track(sensitivity)
+        # Update the trackers for the next frame. The aspiration check must
+        # precede all other updates. Inactive Cell trackers are then removed
+        # (reassigning the primary Cell tracker) before any other stage
+        # starts. The Pipette tracker depends on the Asp tracker update, while
+        # the Cell trackers are independent of both
+        self.scheduler.run([
+            ("aspCheck", self.check_asp_track, []),
+            ("cellRemoval", self.remove_inactive_cells, ["aspCheck"]),
+            ("aspUpdate", self.advance_asp_track, ["cellRemoval"]),
+            ("pipette", lambda: self.update_pipette_track(sensitivity),
+                ["aspUpdate"]),
+            ("cells", self.update_cell_track, ["cellRemoval"])])
    
-    def display_img(self):
-        """ 
-        Generates the image to display to the user.
+    def overlays(self):
+        """
+        Generates the overlays of the active trackers, drawn over the frame by
+        the User Interface.
 
         Returns:
-            numpy.ndarray: The image to display to the user
+            List: (name, [X, Y, W, H], (R, G, B)) overlay of each active
+            tracker.
         """
+        overlays = []
 
-        # Create a copy of the current image
-        displayImage = np.copy(self.img)
-
-        
         # If a Pipette Tracker is active
         if self.pipetteTracker.active_track():
-            # Add the Pipette tracker to the display image
-            displayImage = self.display_track(displayImage, 
-            self.pipetteTracker.get_track_range(), "Pipette", (128,128,255))
-        
+            # Add the Pipette tracker overlay
+            overlays.append(self.overlay_track(
+            self.pipetteTracker.get_track_range(), "Pipette", (255,128,128)))
+
+        # Add an overlay for each active Cell tracker
+        for cellId, tracker in self.cellTrackers.items():
+            if tracker.active_track():
+                overlays.append(self.overlay_track(
+                tracker.get_track_range(), "Cell %d"%(cellId), (128,128,255)))
 
-        # If a Cell Tracker is active
-        if self.cellTracker.active_track():
-            # Add the Cell tracker to the display image
-            displayImage = self.display_track(displayImage, 
-            self.cellTracker.get_track_range(), "Cell", (255,128,128))
-        
         # If an Aspiration Tracker is active
         if self.aspTracker.active_track():
-            # Add the Aspiration tracker to the display image
-            displayImage = self.display_track(displayImage,
-            self.aspTracker.get_track_range(), "Asp. Cell", (128, 255, 128))
-        
-        return displayImage
+            # Add the Aspiration tracker overlay
+            overlays.append(self.overlay_track(
+            self.aspTracker.get_track_range(), "Asp. Cell", (128,255,128)))
 
+        return overlays
 
-    def display_track(self, img, pos, name, colour):
-        """ Append information about the specified track position to the image.
+
+    def overlay_track(self, pos, name, colour):
+        """ Generate the overlay of the specified track position.
 
         Args:
-            img (numpy.ndarray): Input image to append information to.
+            pos (List): Tracker position [X, Y, W, H].
+            name (str): Label drawn with the track.
+            colour (tuple): RGB colour of the track.
 
         Returns:
-            numpy.ndarray: Output image, with tracker information appended.
+            tuple: (name, [X, Y, W, H], (R, G, B)) overlay of the track.
         """
         # Get the current tracker position
         x, y, w, h = int(pos[0]), int(pos[1]), int(pos[2]), int(pos[3])
@@ -285,10 +528,7 @@ class trackerManager():
         if h == 0:
             h = 1
 
-        # Draw the track on the image
-        cv2.rectangle(img, (x,y), (x+w, y+h), colour, 3, 1)
-        cv2.putText(img, name, (x+w,y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, colour, 2)
-        return img
+        return (name, [x, y, w, h], colour)
 
 
 
@@ -310,8 +550,44 @@ class trackerManager():
             return
         
         # Initialise a MOSSE track at the desired position
-        if self.cellTracker.create_mosse_track(self.img, (X,Y,W,H)):
-            self.cellTracker.set_state(basic_track_state.ACTIVE_TRACK)
+        tracker = cellTracker()
+        if not tracker.create_mosse_track(self.img, (X,Y,W,H)):
+            return
+        tracker.set_state(basic_track_state.ACTIVE_TRACK)
+
+        # Add the Cell tracker as the primary Cell tracker
+        cellId = self.nextCellId
+        self.nextCellId += 1
+        self.cellTrackers[cellId] = tracker
+        self.set_primary_cell(cellId)
+
+        return cellId
+
+    def set_primary_cell(self, cellId):
+        """
+        Set the primary Cell tracker (the Cell tracker used in aspiration).
+
+        Args:
+            cellId (int): ID of the Cell tracker. None if no Cell trackers.
+        """
+        self.primaryCellId = cellId
+        if cellId is None:
+            self.cellTracker = cellTracker()
+        else:
+            self.cellTracker = self.cellTrackers[cellId]
+
+    def remove_inactive_cells(self):
+        """
+        Remove Cell trackers which are no longer active, selecting the most
+        recent remaining Cell tracker if the primary Cell tracker is removed.
+        """
+        for cellId in list(self.cellTrackers):
+            if (self.cellTrackers[cellId].get_state() ==
+            basic_track_state.NO_ACTIVE_TRACK):
+                del self.cellTrackers[cellId]
+
+        if self.primaryCellId not in self.cellTrackers:
+            self.set_primary_cell(max(self.cellTrackers, default = None))
  
     def update_pipette_track(self, sensitivity):
         """
@@ -319,27 +595,92 @@ class trackerManager():
         """
         # Only update the Pipette tracker if not currently aspirating
         if basic_track_state.NO_ACTIVE_TRACK == self.aspTracker.get_state():
-            self.pipetteTracker.update_track(self.img, sensitivity)
+            # Run full detection around commanded motion, otherwise verify
+            verify = self.pipetteSchedule.verify_frame()
+            verified = self.pipetteTracker.update_track(self.frame,
+                sensitivity, verify)
+            self.pipetteSchedule.record(verify, verified)
+
+    def notify_motion(self, completion):
+        """
+        Notify the tracker manager of a motion command.
+
+        Args:
+            completion (float): Expected completion time of the move
+            (time.time() seconds). Infinite while the completion is unknown.
+        """
+        self.pipetteSchedule.notify_motion(completion)
+
+    def get_detection_stats(self):
+        """
+        Getter method for the pipette detection schedule statistics.
+
+        Returns:
+            dict: Statistics of the pipette detection schedule.
+        """
+        return self.pipetteSchedule.get_stats()
+
+    def report_tracker_stats(self):
+        """
+        Print, if enabled, the band detection statistics of the Pipette
+        tracker and the motion prediction statistics of the Pipette, Asp and
+        primary Cell trackers (since each tracker was created).
+        """
+        if(PIPETTE_BAND_DETECTION):
+            band = self.pipetteTracker.get_band_stats()
+            print("> Band detection: %d frames, %d attempts, %d hits "%(
+                band['frames'], band['attempts'], band['hits']) +
+                "(%.0f%%)"%(100*band['hitRate']))
+
+        if(not MOTION_PREDICTION):
+            return
+        for name, tracker in (("pipette", self.pipetteTracker),
+            ("asp", self.aspTracker), ("cell", self.cellTracker)):
+            stats = tracker.get_prediction_stats()
+            print("> Motion prediction (%s): %d frames, %d predicted, "%(
+                name, stats['frames'], stats['attempts']) +
+                "%d hits (%.0f%%), %d reacquired"%(stats['hits'],
+                100*stats['hitRate'], stats['reacquired']))
 
     def update_asp_track(self):
         """
         Update the Asp tracker in the tracker manager.
         """
+        self.check_asp_track()
+        self.advance_asp_track()
+
+    def check_asp_track(self):
+        """
+        Check for the aspiration of a Cell, if there is no current
+        Aspiration track.
+        """
         # Get the current Asp tracker state
         trackState = self.aspTracker.get_state()
+        self.aspFrameState = trackState
 
         # If no current Aspiration track
         if trackState == basic_track_state.NO_ACTIVE_TRACK:
-            # Check for aspiration
-            if self.aspTracker.check_aspiration( 
-                self.pipetteTracker.get_track_range(),
-                self.cellTracker.get_track_range()):
-                self.cellTracker.kill_track()
+            # Check each Cell for aspiration, primary Cell first
+            cellIds = sorted(self.cellTrackers,
+                key = lambda cellId: cellId != self.primaryCellId)
+            for cellId in cellIds:
+                if self.aspTracker.check_aspiration(
+                    self.pipetteTracker.get_track_range(),
+                    self.cellTrackers[cellId].get_track_range()):
+                    self.cellTrackers[cellId].kill_track()
+                    break
+
+    def advance_asp_track(self):
+        """
+        Update the Asp tracker for the current frame, given the Asp tracker
+        state before the aspiration check.
+        """
+        trackState = self.aspFrameState
 
         # If currently aspirating or fully aspirated
         if (trackState == asp_track_state.ACTIVE_ASP_TRACK) or (trackState == asp_track_state.ACTIVE_FULL_ASP_TRACK):
             # Update the Aspiration tracker
-            self.aspTracker.update_track(self.img, 
+            self.aspTracker.update_track(self.frame,
             self.pipetteTracker.get_track_range(), self.pipetteTracker.mu_grad,
             self.pipetteTracker.mu_offset)
 
@@ -350,29 +691,72 @@ class trackerManager():
 
     def update_cell_track(self):
         """
-        Update the Cell tracker in tracker manager.
+        Update all active Cell trackers in tracker manager, as a batch on the
+        worker pool. Cell trackers that were lost or aspirated have already
+        been removed.
         """
-        # Check if there is an active Cell tracker
-        if self.cellTracker.get_state() == basic_track_state.ACTIVE_TRACK:
-            # Update Cell tracker
-            self.cellTracker.update_track(self.img)
+        # Get the active Cell trackers
+        active = [tracker for tracker in self.cellTrackers.values()
+            if tracker.get_state() == basic_track_state.ACTIVE_TRACK]
+
+        # Update a single Cell tracker without the overhead of the pool
+        if len(active) == 1:
+            active[0].update_track(self.frame)
+        elif active:
+            list(self.cellPool.map(
+                lambda tracker: tracker.update_track(self.frame), active))
+
+    def cell_states(self):
+        """
+        Compact state of every Cell tracker, sent to the User Interface in a
+        single message.
+
+        Returns:
+            numpy.ndarray: Array with a row [ID, state, X, Y, W, H] per Cell
+            tracker. Unknown positions are NaN.
+        """
+        states = np.full((len(self.cellTrackers), 6), np.nan,
+            dtype = np.float32)
+        for row, (cellId, tracker) in enumerate(self.cellTrackers.items()):
+            states[row, 0] = cellId
+            states[row, 1] = tracker.get_state().value
+            if tracker.active_track():
+                states[row, 2:] = tracker.get_track_range()[:4]
+        return states
 
     def clear_frame_states(self):
         """
         Clear single frame states in each of the trackers
         """
+        for tracker in self.cellTrackers.values():
+            tracker.lostTrack = False
         self.cellTracker.lostTrack = False
         self.pipetteTracker.lostTrack = False
         self.aspTracker.lostTrack = False
 
+    def get_stage_times(self):
+        """
+        Getter method for the mean wall time of each tracker update stage.
+
+        Returns:
+            dict: Mean wall time (ms) of each stage and of the whole frame.
+        """
+        return self.scheduler.get_stage_times()
+
     def get_image_info(self):
         """
-        Get image info to pass the the User Interface
+        Get image info to pass the the User Interface. The frame is passed
+        unmodified, the User Interface draws the tracker overlays.
 
         Returns:
-            tuple: Tuple containing the current display image and basic forms
-            of each of the trackers (as MOSSE Trackers are non-pickleable)
+            tuple: Tuple containing the current frame, snapshots of each of
+            the trackers (as MOSSE Trackers are non-pickleable), the compact
+            state of all Cell trackers and the tracker overlays
         """
-        return (self.display_img(), 
-        [self.pipetteTracker.toBasic(), self.cellTracker.toBasic(), 
-        self.aspTracker.toBasic()])
\ No newline at end of file
+        primaryCellId = -1 if self.primaryCellId is None else self.primaryCellId
+        with profiler.stage("overlay"):
+            overlays = self.overlays()
+        return (self.img,
+        [self.pipetteTracker.snapshot(),
+        self.cellTracker.snapshot(primaryCellId),
+        self.aspTracker.snapshot(), self.cell_states(), overlays])
\ No newline at end of file
@@ -0,0 +1,102 @@
+import numpy as np
+
+GRADIENT_BINS_PER_UNIT = 10 # Line gradients are quantised to 0.1
+
+def quantise_gradients(hough_lines):
+    """ Compute and quantise the gradient of each non-vertical line segment.
+
+    Args:
+        hough_lines (numpy.ndarray): Line segments [X1, Y1, X2, Y2] as
+        returned by cv2.HoughLinesP (shape (N, 1, 4) or (N, 4)).
+
+    Returns:
+        numpy.ndarray, numpy.ndarray: Non-vertical line segments (shape
+        (M, 4)) and the gradient bin of each segment.
+    """
+    lines = np.asarray(hough_lines).reshape(-1, 4).astype(np.int64)
+
+    # Vertical lines have no defined gradient
+    dx = lines[:, 2] - lines[:, 0]
+    dy = lines[:, 3] - lines[:, 1]
+    sloped = dx != 0
+
+    gradients = dy[sloped] / dx[sloped]
+    scaled = gradients * GRADIENT_BINS_PER_UNIT
+    bins = np.rint(scaled)
+
+    # Gradients (near) halfway between bins are rounded as round(gradient, 1)
+    # on the exact gradient, so bins match the scalar implementation
+    halfway = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    for n in np.flatnonzero(halfway):
+        bins[n] = round(round(float(gradients[n]), 1)*GRADIENT_BINS_PER_UNIT)
+
+    return lines[sloped], bins.astype(np.int64)
+
+def dominant_edge_lines(hough_lines, binTolerance = 0, maxMedianDist = None,
+meanY = False):
+    """ Find the most frequent gradient among line segments and the highest
+    and lowest segments (in Y) sharing that gradient. These segments are
+    taken as the top and bottom pipette edges.
+
+    Args:
+        hough_lines (numpy.ndarray): Line segments [X1, Y1, X2, Y2] as
+        returned by cv2.HoughLinesP.
+        binTolerance (int, optional): Number of gradient bins either side of
+        the most frequent bin accepted for the edge lines. Defaults to 0.
+        maxMedianDist (int, optional): If set, segments whose first Y
+        coordinate is further than this from the median are not accepted as
+        edge lines. Defaults to None.
+        meanY (bool, optional): True iff the edge lines are the segments
+        with the smallest and largest mean Y coordinate (as the demos).
+        Defaults to False, the tracker rule: segments are visited in order,
+        and a segment replaces the minimum (maximum) edge line if its
+        smallest (largest) Y coordinate is beyond the first Y coordinate of
+        the current edge line.
+
+    Returns:
+        float, numpy.ndarray, numpy.ndarray: Most frequent gradient, minimum
+        (Y) edge line and maximum (Y) edge line. None if no edge lines exist.
+    """
+    allLines = np.asarray(hough_lines).reshape(-1, 4)
+    lines, bins = quantise_gradients(allLines)
+
+    if not len(lines):
+        return
+
+    # Most frequent gradient bin, ties resolved to the first bin seen.
+    # Negative gradients rounding to zero (-0.0) are counted apart from
+    # zero gradients, as by the scalar implementation
+    dx = lines[:, 2] - lines[:, 0]
+    dy = lines[:, 3] - lines[:, 1]
+    negativeZero = (bins == 0) & ((dy*dx < 0) | ((dy == 0) & (dx < 0)))
+    keys = 2*bins + negativeZero
+    values, first, counts = np.unique(keys, return_index = True,
+        return_counts = True)
+    candidates = np.flatnonzero(counts == counts.max())
+    modeKey = values[candidates[np.argmin(first[candidates])]]
+    modeBin, modeSign = modeKey//2, (-1 if modeKey % 2 else 1)
+
+    # Segments accepted as pipette edges
+    accepted = np.abs(bins - modeBin) <= binTolerance
+    if maxMedianDist is not None:
+        medianY = np.median(allLines[:, 1])
+        accepted &= np.abs(lines[:, 1] - medianY) <= maxMedianDist
+
+    if not accepted.any():
+        return
+
+    edgeLines = lines[accepted]
+    if meanY:
+        # Select the edges with the smallest and largest mean Y coordinate
+        centreY = edgeLines[:, 1] + edgeLines[:, 3]
+        minLine = edgeLines[np.argmin(centreY)]
+        maxLine = edgeLines[np.argmax(centreY)]
+    else:
+        minLine = maxLine = edgeLines[0]
+        for line in edgeLines[1:]:
+            if maxLine[1] < max(line[1], line[3]):
+                maxLine = line
+            if min(line[1], line[3]) < minLine[1]:
+                minLine = line
+
+    return modeSign*float(modeBin)/GRADIENT_BINS_PER_UNIT, minLine, maxLine
@@ -0,0 +1,148 @@
+import numpy as np
+
+PROCESS_NOISE = 1.0 # Standard deviation of the acceleration (px/frame^2)
+MEASUREMENT_NOISE = 2.0 # Standard deviation of measured positions (px)
+MIN_CORRECTIONS = 3 # Corrections before predictions are used
+
+class motionPredictor():
+    """
+    Constant velocity Kalman filter over the centre of a track. Predicts the
+    position of the track in the next frame, and the uncertainty of the
+    prediction, from the positions measured in previous frames. Time is
+    measured in frames.
+    """
+    # State transition ([X, Y, VX, VY] advanced by one frame)
+    F = np.array([[1, 0, 1, 0],
+                  [0, 1, 0, 1],
+                  [0, 0, 1, 0],
+                  [0, 0, 0, 1]], dtype = np.float64)
+
+    # Measurement of the state (position only)
+    H = np.array([[1, 0, 0, 0],
+                  [0, 1, 0, 0]], dtype = np.float64)
+
+    def __init__(self, processNoise = PROCESS_NOISE,
+    measurementNoise = MEASUREMENT_NOISE):
+        """
+        Initialise the predictor without a state.
+
+        Args:
+            processNoise (float, optional): Standard deviation of the
+            acceleration between frames (px/frame^2).
+            measurementNoise (float, optional): Standard deviation of
+            measured positions (px).
+        """
+        # Process noise of a piecewise constant acceleration
+        G = np.array([[0.5, 0], [0, 0.5], [1, 0], [0, 1]])
+        self.Q = processNoise**2 * (G @ G.T)
+        self.R = measurementNoise**2 * np.eye(2)
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the state of the predictor (e.g. when the track is lost).
+        """
+        self.x = None
+        self.P = None
+        self.corrections = 0
+        self.misses = 0
+
+    def predict(self):
+        """
+        Advance the state by one frame. Called once per frame, before the
+        track is searched for.
+        """
+        if(self.x is None):
+            return
+        self.x = self.F @ self.x
+        self.P = self.F @ self.P @ self.F.T + self.Q
+
+    def correct(self, centre):
+        """
+        Correct the state with the centre measured in this frame.
+
+        Args:
+            centre (List): Measured centre [X, Y].
+        """
+        z = np.array(centre, dtype = np.float64)
+
+        # Initialise the state at the first measurement, with no velocity
+        if(self.x is None):
+            self.x = np.array([z[0], z[1], 0, 0])
+            self.P = np.diag([self.R[0, 0], self.R[1, 1], 100, 100])
+        else:
+            S = self.H @ self.P @ self.H.T + self.R
+            K = self.P @ self.H.T @ np.linalg.inv(S)
+            self.x = self.x + K @ (z - self.H @ self.x)
+            self.P = (np.eye(4) - K @ self.H) @ self.P
+
+        self.corrections += 1
+        self.misses = 0
+
+    def miss(self):
+        """
+        Record a frame in which the track was not measured. The prediction
+        continues with growing uncertainty.
+        """
+        self.misses += 1
+
+    def ready(self):
+        """
+        Check if the predictor has seen enough measurements to be used.
+
+        Returns:
+            bool: True iff predictions can be used. Otherwise, False.
+        """
+        return (self.x is not None) and (self.corrections >= MIN_CORRECTIONS)
+
+    def get_position(self):
+        """
+        Getter method for the predicted centre.
+
+        Returns:
+            List: Predicted centre [X, Y]. None without a state.
+        """
+        if(self.x is None):
+            return
+        return [float(self.x[0]), float(self.x[1])]
+
+    def get_velocity(self):
+        """
+        Getter method for the estimated velocity.
+
+        Returns:
+            List: Velocity [VX, VY] (px/frame). None without a state.
+        """
+        if(self.x is None):
+            return
+        return [float(self.x[2]), float(self.x[3])]
+
+    def get_uncertainty(self):
+        """
+        Getter method for the uncertainty of the predicted centre.
+
+        Returns:
+            List: Standard deviation of the predicted centre [X, Y]. None
+            without a state.
+        """
+        if(self.x is None):
+            return
+        return [float(np.sqrt(self.P[0, 0])), float(np.sqrt(self.P[1, 1]))]
+
+    def search_range(self, axis, sigmas, margin):
+        """
+        Range around the predicted centre the track is expected within.
+
+        Args:
+            axis (int): Axis of the range (0 for X, 1 for Y).
+            sigmas (float): Number of standard deviations covered.
+            margin (int): Margin added to both sides of the range.
+
+        Returns:
+            List: [Start, end] of the range. None if the predictor is not
+            ready.
+        """
+        if(not self.ready()):
+            return
+        halfRange = sigmas*np.sqrt(self.P[axis, axis]) + margin
+        return [int(self.x[axis] - halfRange), int(self.x[axis] + halfRange)]
@@ -0,0 +1,129 @@
+import time
+import threading
+import numpy as np
+from collections import deque
+from contextlib import nullcontext
+from .ConfigFiles.settings import *
+
+# Context returned for every stage while profiling is disabled
+NULL_STAGE = nullcontext()
+
+class stageTimer():
+    """
+    Context timing a single execution of a stage.
+    """
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        """
+        Initialise the timer.
+
+        Args:
+            profiler (stageProfiler): Profiler to record the time with.
+            name (str): Name of the stage.
+        """
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name,
+            1000*(time.perf_counter() - self.start))
+        return False
+
+class stageProfiler():
+    """
+    Opt-in timing of the stages of the vision pipeline. Keeps a rolling
+    window of the latest times of each stage, summarised as percentiles. When
+    disabled, stages cost a single attribute check.
+    """
+    def __init__(self, enabled = VISION_PROFILING, window = PROFILE_WINDOW):
+        """
+        Initialise the profiler.
+
+        Args:
+            enabled (bool, optional): True iff stages are timed.
+            window (int, optional): Number of latest times kept per stage.
+        """
+        self.enabled = enabled
+        self.window = window
+        self.samples = {}
+        self.lock = threading.Lock()
+        self.lastReport = time.time()
+
+    def stage(self, name):
+        """
+        Context timing a stage, e.g. with profiler.stage("canny"): ...
+
+        Args:
+            name (str): Name of the stage.
+
+        Returns:
+            object: Context manager timing the stage.
+        """
+        if(not self.enabled):
+            return NULL_STAGE
+        return stageTimer(self, name)
+
+    def record(self, name, ms):
+        """
+        Record the time of a stage.
+
+        Args:
+            name (str): Name of the stage.
+            ms (float): Time of the stage in milliseconds.
+        """
+        with self.lock:
+            samples = self.samples.get(name)
+            if(samples is None):
+                samples = deque(maxlen = self.window)
+                self.samples[name] = samples
+            samples.append(ms)
+
+    def get_stats(self):
+        """
+        Getter method for the percentiles of each stage.
+
+        Returns:
+            dict: (count, p50, p95, p99) in milliseconds of each stage, over
+            its rolling window.
+        """
+        with self.lock:
+            samples = {name: np.array(times)
+                for name, times in self.samples.items()}
+        return {name: (len(times),) + tuple(np.percentile(times, [50, 95, 99]))
+            for name, times in samples.items() if len(times)}
+
+    def poll_stats(self, interval = PROFILE_REPORT_INTERVAL):
+        """
+        Get the stage percentiles, at most once per interval.
+
+        Args:
+            interval (float, optional): Seconds between results.
+
+        Returns:
+            dict: Stage percentiles (as get_stats). None if disabled or the
+            interval has not elapsed.
+        """
+        if((not self.enabled) or (time.time() - self.lastReport < interval)):
+            return
+        self.lastReport = time.time()
+        return self.get_stats()
+
+def profile_summary(stats):
+    """ Human readable summary of stage percentiles.
+
+    Args:
+        stats (dict): (count, p50, p95, p99) of each stage.
+
+    Returns:
+        str: Summary with a line per stage.
+    """
+    return "\n".join(["%s: %.2f / %.2f / %.2f ms (p50/p95/p99)"%(name,
+        p50, p95, p99) for name, (count, p50, p95, p99) in stats.items()])
+
+# Profiler of the current process
+profiler = stageProfiler()
@@ -0,0 +1,98 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from .profiling_driver import profiler
+
+class stageScheduler():
+    """
+    Runs the stages of a frame on a thread pool, each stage starting once
+    the stages it depends on have completed. Records the wall time of every
+    stage so the critical path of a frame can be seen.
+    """
+    def __init__(self, workers, concurrent = True):
+        """
+        Initialise the scheduler.
+
+        Args:
+            workers (int): Number of worker threads.
+            concurrent (bool, optional): True iff independent stages are run
+            concurrently. Otherwise, stages are run in order on the calling
+            thread. Defaults to True.
+        """
+        self.concurrent = concurrent
+        self.pool = ThreadPoolExecutor(max_workers = workers)
+
+        # Wall time (ms) of each stage in the last frame, and the total and
+        # count since the last reset
+        self.lastTimes = {}
+        self.totalTimes = {}
+        self.frames = 0
+
+    def run_stage(self, name, function, dependencies):
+        """
+        Run a stage after its dependencies, recording its wall time.
+
+        Args:
+            name (str): Name of the stage.
+            function (function): Function run by the stage.
+            dependencies (List): Futures of the stages depended on.
+        """
+        # Stages are submitted in order, so dependencies have already started
+        for dependency in dependencies:
+            dependency.result()
+
+        start = time.perf_counter()
+        function()
+        self.lastTimes[name] = 1000*(time.perf_counter() - start)
+        if(profiler.enabled):
+            profiler.record("stage " + name, self.lastTimes[name])
+
+    def run(self, stages):
+        """
+        Run the stages of a frame, returning once all stages have completed.
+
+        Args:
+            stages (List): (name, function, names of dependencies) of each
+            stage, where every stage follows the stages it depends on.
+        """
+        start = time.perf_counter()
+
+        if(self.concurrent):
+            futures = {}
+            for name, function, dependencies in stages:
+                futures[name] = self.pool.submit(self.run_stage, name,
+                    function, [futures[d] for d in dependencies])
+            wait(futures.values())
+
+            # Raise any exception from a stage
+            for future in futures.values():
+                future.result()
+        else:
+            for name, function, dependencies in stages:
+                self.run_stage(name, function, [])
+
+        self.lastTimes['frame'] = 1000*(time.perf_counter() - start)
+
+        for name, ms in self.lastTimes.items():
+            self.totalTimes[name] = self.totalTimes.get(name, 0) + ms
+        self.frames += 1
+
+    def get_stage_times(self):
+        """
+        Getter method for the mean wall time of each stage.
+
+        Returns:
+            dict: Mean wall time (ms) of each stage and of the whole frame
+            since the last reset.
+        """
+        return {name: total/max(self.frames, 1)
+            for name, total in self.totalTimes.items()}
+
+    def report_stage_times(self):
+        """
+        Print the mean wall time of each stage, then reset the means.
+        """
+        times = self.get_stage_times()
+        print("> Stages (ms/frame): " + ", ".join(["%s %.2f"%(name, ms)
+            for name, ms in times.items()]))
+        self.totalTimes = {}
+        self.frames = 0
@@ -0,0 +1,206 @@
+import os
+import csv
+import time
+import argparse
+from math import nan
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from .image_processing_OS import process_frame
+from .SoftwareDrivers.image_processing_driver import *
+
+# Trackers recorded per frame, in order of the tracker information
+TRACKER_NAMES = ("pipette", "cell", "asp")
+
+# Columns recorded per tracker
+TRACKER_COLUMNS = ("State", "X", "Y", "W", "H", "Moving", "Lost")
+
+# Columns of the output, per frame
+COLUMNS = ["frame", "cells"] + [name + column for name in TRACKER_NAMES
+    for column in TRACKER_COLUMNS] + ["aspDistance"]
+
+class trackingJob():
+    """
+    Batch tracking of a single video file.
+    """
+    def __init__(self, videoPath, outputPath, cellBox = None, cellFrame = 1,
+    sensitivity = 0):
+        """
+        Initialise the job.
+
+        Args:
+            videoPath (str): Path of the video file.
+            outputPath (str): Path of the output file (.csv or .npz).
+            cellBox (List, optional): Initial cell box [X, Y, W, H]. Defaults
+            to None (no cell is tracked).
+            cellFrame (int, optional): Frame the cell is selected on (as if
+            selected by the user while the frame is displayed). Defaults to
+            the first frame.
+            sensitivity (int, optional): Edge threshold of pipette detection.
+            Defaults to 0 (the GUI default).
+        """
+        self.videoPath = videoPath
+        self.outputPath = outputPath
+        self.cellBox = cellBox
+        self.cellFrame = cellFrame
+        self.sensitivity = sensitivity
+
+def frame_row(frameNumber, trackers, systemInfo):
+    """ Tracker states and aspiration measurement of a single frame.
+
+    Args:
+        frameNumber (int): Number of the frame (from 1).
+        trackers (List): Tracker information of the frame (as
+        trackerManager.get_image_info).
+        systemInfo (systemInformation): System information to measure with.
+
+    Returns:
+        List: Value of each output column.
+    """
+    row = [frameNumber, len(trackers[3])]
+    for snapshot in trackers[:3]:
+        position = [nan if p is None else float(p)
+            for p in snapshot.get_track_range()]
+        row += [trackerSnapshot.STATES.index(snapshot.get_state())] + \
+            position + [int(snapshot.moving_track()),
+            int(snapshot.lost_track())]
+
+    # Aspiration distance, as measured for the results widget
+    systemInfo.set_trackers(*trackers[:3])
+    aspDistance = nan
+    if((systemInfo.active_asp_cell() != basic_track_state.NO_ACTIVE_TRACK)
+        and systemInfo.pipetteTracker.active_track()
+        and systemInfo.aspTracker.active_track()):
+        aspDistance = systemInfo.asp_to_pipette()
+
+    return row + [aspDistance]
+
+def track_video(job):
+    """ Run the tracker manager over every frame of a video file, writing
+    the tracker states of each frame to the output file. No frame is
+    skipped, as in the interactive pipeline with VIDEO_EVERY_FRAME set
+    (which otherwise drops frames read between GUI requests).
+
+    Args:
+        job (trackingJob): Job to run.
+
+    Returns:
+        str, int, float: Video path, number of frames and processing time
+        (seconds).
+    """
+    start = time.perf_counter()
+    cap = cv2.VideoCapture(job.videoPath)
+    track_manager = trackerManager()
+    systemInfo = systemInformation()
+
+    # No motion is commanded over a video, so the pipette is never known to
+    # be stationary. Run full detection on every frame
+    track_manager.pipetteSchedule.enabled = False
+    rows = []
+
+    while(1):
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        frame, trackers = process_frame(track_manager, frame,
+            job.sensitivity)
+        rows.append(frame_row(len(rows) + 1, trackers, systemInfo))
+
+        # Select the cell once its frame has been processed
+        if((job.cellBox is not None) and (len(rows) == job.cellFrame)):
+            x, y, w, h = job.cellBox
+            track_manager.init_cell_track_at([[x, y], [w, h]])
+
+    cap.release()
+    write_rows(job.outputPath, rows)
+    return job.videoPath, len(rows), time.perf_counter() - start
+
+def write_rows(outputPath, rows):
+    """ Write the rows of a video to a CSV file, or to a columnar NumPy
+    (.npz) file with an array per column.
+
+    Args:
+        outputPath (str): Path of the output file.
+        rows (List): Value of each column, per frame.
+    """
+    if(outputPath.endswith(".npz")):
+        columns = np.array(rows, dtype = np.float64).reshape(-1, len(COLUMNS))
+        np.savez(outputPath, **{name: columns[:, n]
+            for n, name in enumerate(COLUMNS)})
+        return
+
+    with open(outputPath, "w", newline = "") as output:
+        writer = csv.writer(output)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+
+def parse_box(text):
+    """ Parse a cell box of the form X,Y,W,H.
+
+    Returns:
+        List: Cell box [X, Y, W, H].
+    """
+    box = [int(value) for value in text.split(",")]
+    if(len(box) != 4):
+        raise argparse.ArgumentTypeError("Expected a cell box X,Y,W,H, " +
+            "recieved %s"%(text))
+    return box
+
+def batch_tracking(jobs, workers = None):
+    """ Run tracking jobs, distributing the video files across a process
+    pool.
+
+    Args:
+        jobs (List): Tracking jobs to run.
+        workers (int, optional): Number of worker processes. Defaults to the
+        number of CPUs.
+    """
+    with ProcessPoolExecutor(max_workers = workers) as pool:
+        for videoPath, frames, elapsed in pool.map(track_video, jobs):
+            print("> %s: %d frames in %.1f s (%.1f FPS)"%(videoPath, frames,
+                elapsed, frames/max(elapsed, 1e-9)))
+
+def main():
+    """ Command line entry point of batch tracking.
+    """
+    parser = argparse.ArgumentParser(description = "Track the pipette, " +
+        "cells and aspiration over recorded videos without the GUI.")
+    parser.add_argument("videos", nargs = "+", help = "Video files")
+    parser.add_argument("--cell", action = "append", default = [],
+        metavar = "X,Y,W,H", help = "Initial cell box of each video, in " +
+        "order of the videos (a single box applies to every video)")
+    parser.add_argument("--cell-frame", type = int, default = 1,
+        help = "Frame the cell is selected on (default 1)")
+    parser.add_argument("--sensitivity", type = int, default = 0,
+        help = "Edge threshold of pipette detection (default 0)")
+    parser.add_argument("--format", choices = ["csv", "npz"], default = "csv",
+        help = "Output format (default csv)")
+    parser.add_argument("--output", default = ".",
+        help = "Output directory (default the current directory)")
+    parser.add_argument("--workers", type = int, default = None,
+        help = "Number of worker processes (default the number of CPUs)")
+    args = parser.parse_args()
+
+    boxes = [parse_box(box) for box in args.cell]
+    if(len(boxes) == 1):
+        boxes = boxes*len(args.videos)
+    elif(len(boxes) == 0):
+        boxes = [None]*len(args.videos)
+    elif(len(boxes) != len(args.videos)):
+        parser.error("Expected one cell box, or one per video")
+
+    os.makedirs(args.output, exist_ok = True)
+    jobs = []
+    for videoPath, box in zip(args.videos, boxes):
+        name = os.path.splitext(os.path.basename(videoPath))[0]
+        jobs.append(trackingJob(videoPath, os.path.join(args.output,
+            "%sTracks.%s"%(name, args.format)), box, args.cell_frame,
+            args.sensitivity))
+
+    batch_tracking(jobs, args.workers)
+
+if __name__ == "__main__":
+    main()
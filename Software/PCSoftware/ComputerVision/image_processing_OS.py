@@ -1,8 +1,17 @@
 from multiprocessing import *
+import sys
+import time
+import signal
 from .SoftwareDrivers.image_processing_driver import *
+from .SoftwareDrivers.frame_buffer_driver import *
+from .SoftwareDrivers.capture_driver import *
+from .SoftwareDrivers.profiling_driver import profiler
 from .SoftwareDrivers.ConfigFiles.settings import *
+from communicationChannels import *
+from sessionRecording import sessionRecorder
 
-def initialise_computer_vision(pixQ, posQ, capSem, emulation):
+def initialise_computer_vision(pixQ, posQ, capSem, emulation, motionQ = None,
+recorder = None):
     """ Initialise the Computer Vision process
 
     Args:
@@ -10,92 +19,144 @@ def initialise_computer_vision(pixQ, posQ, capSem, emulation):
         posQ (Queue): Queue to transfer user selection information
         capSem (Queue): Queue used as semaphore to request observed information
         emulation (bool): True iff emulator is used.
+        motionQ (Queue, optional): Queue of expected completion times of
+        transmitted motion commands
+        recorder (sessionRecorder, optional): Recorder of the session.
 
     Returns:
         int: Process ID for the computer vision process
     """
     
     imageProcess = Process(target = imageProcesser, 
-        args=(pixQ, posQ, capSem, emulation))
+        args=(pixQ, posQ, capSem, emulation, motionQ, recorder))
     imageProcess.start()
 
     return imageProcess.pid
 
-def imageProcesser(pixQ, posQ, capSem, emulation):
+def process_frame(track_manager, frame, sensitivity):
+    """ Process a single frame, shared by the interactive and batch pipelines
+    so both apply the same per-frame processing. By default the interactive
+    pipeline only processes the newest frame of a video when the GUI
+    requests one (frames in between are dropped). With VIDEO_EVERY_FRAME set
+    it processes every frame in order, so its tracker states match the batch
+    pipeline frame for frame.
+
+    Args:
+        track_manager (trackerManager): Tracker manager to update.
+        frame (numpy.ndarray): Frame to process.
+        sensitivity (int): Edge threshold of pipette detection.
+
+    Returns:
+        numpy.ndarray, List: The frame and the tracker information (as
+        trackerManager.get_image_info).
+    """
+    # Update the trackers for the new frame
+    with profiler.stage("trackers"):
+        track_manager.update(frame, sensitivity)
+    frame, trackers = track_manager.get_image_info()
+
+    # Clear all single frame states
+    track_manager.clear_frame_states()
+
+    return frame, trackers
+
+def imageProcesser(pixQ, posQ, capSem, emulation, motionQ = None,
+recorder = None):
     """ Process loop for processing computer vision content.
 
     Args:
-        pixQ (Queue): Queue to transfer observed information
+        pixQ (Queue): Queue to transfer observed information (frame header
+        within the shared frame ring and tracker states)
         posQ (Queue): Queue to transfer user selection information
         capSem (Queue): Queue used as semaphore to request observed information
-        emulation (bool): True iff emulator is used.
+        emulation (CaptureEmulator): Capture emulator instance.
+        motionQ (Queue, optional): Queue of expected completion times of
+        transmitted motion commands
+        recorder (sessionRecorder, optional): Recorder of the session. Every
+        frame processed, motion notified, selection and tracker output is
+        recorded, in the order applied, so sessions can be replayed offline.
     """
+    if(recorder is None):
+        recorder = sessionRecorder(None)
+
+    # Open the capture source, frames are read on a background thread
+    capture = open_capture(emulation)
+    capture.start()
 
-    # Default value initialisation
-    using_video = False
-    using_img = False
-    frame_count = 0
-    img = None
-    
-    # If emulator flag is true, use the emulator
-    if(IMAG_EMULATOR):
-        cap = emulation
-    
-    # Otherwise, if using video file load the video as the capture
-    elif((IMAG_VIDEO) and (VIDEO_PATH != None)):
-        split_path = VIDEO_PATH.split(".")
-        if((split_path[-1] == "mp4") or (split_path[-1] == "avi")):
-            cap = cv2.VideoCapture(VIDEO_PATH)
-            using_video = True
-        elif((split_path[-1] == "jpg") or (split_path[-1] == "png")):
-            img = cv2.imread(VIDEO_PATH, cv2.IMREAD_COLOR)
-            using_img = True
-        else:
-            cap = cv2.VideoCapture(0)
-    
-    # Otherwise, default to video capture 0 for feed
-    else:
-        cap = cv2.VideoCapture(0)
-    
     # Initialise instance of a tracker manager
     track_manager = trackerManager()
 
-    while(1):
-        
-        # If using video and reached the last frame, reset the video
-        if (using_video) and (frame_count == cap.get(cv2.CAP_PROP_FRAME_COUNT)):
-            frame_count = 0
-            cap = cv2.VideoCapture(VIDEO_PATH)
-        
-        # If an image is requested
-        if not capSem.empty():
-            sensitivity = capSem.get()
+    # Initialise shared memory ring used to hand frames to the GUI
+    frame_ring = sharedFrameRing()
+
+    # Frame channels to report drop and overrun counts for
+    channels = [pixQ, capSem, getattr(emulation, "imageQueue", None)]
+    lastReport = time.time()
+
+    # End the process on termination (when the application exits), releasing
+    # the shared memory ring
+    signal.signal(signal.SIGTERM, lambda signum, stackFrame: sys.exit(0))
+
+    try:
+        while(1):
+
+            # Block until an image or a cell track is requested
+            requests = wait_for_channels([capSem, posQ])
+
+            # If an image is requested
+            if capSem in requests:
+                sensitivity = capSem.get()
+                frameStart = time.perf_counter()
             
-            # Attempt to read a frame from the capture
-            ret = False
-            for attempts in range(5):
-                if (not using_img):
-                    ret, frame = cap.read()
-                    if(ret):
-                        break
+                # Take the newest frame read from the capture
+                with profiler.stage("capture"):
+                    ret, frame = capture.get_frame()
+
+                # If no frame has been captured yet, retry the request
+                if(not ret):
+                    print("> Capture: no frame within %g s"%(
+                        CAPTURE_TIMEOUT))
+                    capSem.put(sensitivity)
                 else:
-                    frame = img
-                    break
-                
-            # If a video is used, count the frame capture
-            if(using_video):
-                frame_count += 1
-                
-            # Update the trackers for the new frame
-            track_manager.update(frame, sensitivity)
-
-            # Communicate new observed info the the GUI
-            pixQ.put(track_manager.get_image_info())
-            
-            # Clear all single frame states
-            track_manager.clear_frame_states()
-        
-        # If the user has requested a cell track
-        if not posQ.empty():
-            sel, position = posQ.get()
-            track_manager.init_cell_track_at(position)
+                    # Follow commanded motion, the pipette is fully detected
+                    # while it is moving
+                    while((motionQ is not None) and (not motionQ.empty())):
+                        completion = motionQ.get()
+                        recorder.record("motion", completion)
+                        track_manager.notify_motion(completion)
+
+                    # Update the trackers for the new frame
+                    recorder.record("frame", (time.time(), sensitivity, frame))
+                    frame, trackers = process_frame(track_manager, frame,
+                        sensitivity)
+                    recorder.record("trackers", trackers[:3])
+
+                    # Communicate new observed info the the GUI. The frame is
+                    # placed in shared memory, only its header is sent over
+                    # the queue. The tracker overlays are drawn by the GUI,
+                    # which periodically also recieves the stage timings (if
+                    # profiling is enabled)
+                    trackers.append(profiler.poll_stats())
+                    with profiler.stage("queue put"):
+                        pixQ.put((frame_ring.write(frame), trackers))
+                    if(profiler.enabled):
+                        profiler.record("frame",
+                            1000*(time.perf_counter() - frameStart))
+
+                    # Periodically report dropped and duplicated frames
+                    capture.report_stats()
+                    if(time.time() - lastReport >= CHANNEL_REPORT_INTERVAL):
+                        lastReport = time.time()
+                        print("> Channels: %s"%(channel_summary(channels)))
+                        track_manager.scheduler.report_stage_times()
+                        track_manager.pipetteSchedule.report_stats()
+                        track_manager.report_tracker_stats()
+
+            # If the user has requested a cell track
+            if posQ in requests:
+                sel, position = posQ.get()
+                recorder.record("select", position)
+                track_manager.init_cell_track_at(position)
+    finally:
+        capture.stop()
+        frame_ring.close(unlink = True)
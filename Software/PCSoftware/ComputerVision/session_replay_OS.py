@@ -0,0 +1,82 @@
+import time
+import argparse
+
+from .image_processing_OS import process_frame
+from .SoftwareDrivers.image_processing_driver import *
+from sessionRecording import read_session, sessionPacer
+
+# Kinds of record replayed through the tracker manager
+REPLAYED_KINDS = ("frame", "motion", "select", "trackers")
+
+def replay_session(path, speed = None, lastFrame = None):
+    """ Replay the frames, motion notifications and cell selections of a
+    recorded session through a tracker manager, in the order they were
+    applied, comparing the tracker outputs with those recorded.
+
+    Args:
+        path (str): Path of the session file.
+        speed (float, optional): Replay speed (1 for real time). Defaults to
+        None (as fast as possible).
+        lastFrame (int, optional): Number of the last frame to replay (from
+        1). Defaults to None (every frame).
+
+    Returns:
+        int, List: Number of frames replayed, and the numbers of the frames
+        whose tracker outputs differ from the recording.
+    """
+    track_manager = trackerManager()
+    pacer = sessionPacer(speed)
+
+    # Pipette detection is scheduled by the recorded frame times
+    frameTime = [0]
+    track_manager.pipetteSchedule.clock = lambda: frameTime[0]
+
+    frames = 0
+    trackers = []
+    divergent = []
+    for timestamp, kind, payload in read_session(path, REPLAYED_KINDS):
+        if(kind == "frame"):
+            if((lastFrame is not None) and (frames >= lastFrame)):
+                break
+            pacer.wait(timestamp)
+            frameTime[0], sensitivity, frame = payload
+            frame, trackers = process_frame(track_manager, frame, sensitivity)
+            frames += 1
+        elif(kind == "motion"):
+            track_manager.notify_motion(payload)
+        elif(kind == "select"):
+            track_manager.init_cell_track_at(payload)
+        elif(kind == "trackers"):
+            if([snapshot.encode() for snapshot in trackers[:3]] !=
+                [snapshot.encode() for snapshot in payload]):
+                divergent.append(frames)
+
+    return frames, divergent
+
+def main():
+    """ Command line entry point of session replay.
+    """
+    parser = argparse.ArgumentParser(description = "Replay a recorded " +
+        "session through the trackers without the GUI, reporting frames " +
+        "whose tracker outputs differ from the recording.")
+    parser.add_argument("session", help = "Session file")
+    parser.add_argument("--speed", type = float, default = None,
+        help = "Replay speed, 1 for real time (default as fast as possible)")
+    parser.add_argument("--frames", type = int, default = None,
+        help = "Number of frames to replay (default every frame)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    frames, divergent = replay_session(args.session, args.speed, args.frames)
+    elapsed = time.perf_counter() - start
+
+    print("> %s: %d frames in %.1f s (%.1f FPS)"%(args.session, frames,
+        elapsed, frames/max(elapsed, 1e-9)))
+    if(divergent):
+        print("> %d frames differ from the recording, first frame %d"%(
+            len(divergent), divergent[0]))
+    else:
+        print("> Tracker outputs match the recording")
+
+if __name__ == "__main__":
+    main()
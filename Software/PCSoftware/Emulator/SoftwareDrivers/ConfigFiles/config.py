@@ -1,8 +1,22 @@
 from math import *
-import random
 
-# Seed the RNG
-random.seed()
+# Seed of the random pipette and cell placement, drawn by the emulator
+# process when it starts (None seeds from the system, set to replay
+# scenarios deterministically)
+EMULATOR_SEED = None
+
+# Simulation clock of the emulator: "REALTIME" follows the wall clock,
+# "STEPPED" advances by a tick per frame read (faster than real time)
+EMULATOR_CLOCK = "REALTIME"
+
+# Simulated seconds per emulator tick
+EMULATOR_TICK = 1/10
+
+# Number of cells simulated by the emulator
+EMULATOR_CELLS = 1
+
+# Seconds a frame read waits for the emulator to render the frame
+EMULATOR_FRAME_TIMEOUT = 1
 
 # Declare constants relating the emulator model
 emulatorModel = dict( 
@@ -13,16 +27,18 @@ emulatorModel = dict(
 # Declare constants relating to the pipette model
 pipetteModel = dict(
     pipetteHeight = 25,
-    initPipetteX = random.randrange(75,int(emulatorModel['imgWidth']/2)),
-    initPipetteY = random.randrange(75,int(emulatorModel['imgHeight']/2)),
+    # Ranges [start, stop) of the random initial pipette tip position
+    initPipetteX = [75, int(emulatorModel['imgWidth']/2)],
+    initPipetteY = [75, int(emulatorModel['imgHeight']/2)],
 )
 
 # Declare contstants relating to the cell model
 cellModel = dict(
-    initCellPos = [[random.randrange(int(emulatorModel['imgWidth']/2) - 50, 
-        emulatorModel['imgWidth'] - 50),
-        random.randrange(int(emulatorModel['imgHeight']/2) - 50, 
-        emulatorModel['imgHeight'] - 50)]],
+    # Ranges [start, stop) of the random initial cell positions
+    initCellX = [int(emulatorModel['imgWidth']/2) - 50,
+        emulatorModel['imgWidth'] - 50],
+    initCellY = [int(emulatorModel['imgHeight']/2) - 50,
+        emulatorModel['imgHeight'] - 50],
     standardCellDim = [[15, 15]],
     aspiratedCellDim = [[30, pipetteModel['pipetteHeight'] - 5]],
     standardCellIntensity = [255],
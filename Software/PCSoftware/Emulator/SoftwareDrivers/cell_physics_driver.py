@@ -0,0 +1,163 @@
+import numpy as np
+from settings import *
+from .ConfigFiles.config import *
+
+# Mass of the cell to aspirate
+CELL_MASS = 0.0000000000001
+# Radius of the cell to aspirate
+INTERNAL_RADIUS = 0.000002
+
+def cell_acceleration(xPip, yPip, positions, pressure):
+    """ Acceleration of cells towards a point of the micropipette, for a
+    change in pressure (computed for all cells at once).
+
+    Args:
+        xPip (int or nd.array): X-Position to accelerate towards (pixels)
+        yPip (int or nd.array): Y-Position to accelerate towards (pixels)
+        positions (nd.array): [x,y] position of each cell
+        pressure (float): Pressure applied in the system (pascals)
+
+    Returns:
+        nd.array, nd.array: Acceleration,Distance of each cell to the point
+    """
+    # Calculate difference in position in micrometers
+    dist = np.hypot(xPip - positions[:, 0], yPip - positions[:, 1])
+
+    # Calculate volume from desired pressure
+    crossSection = pi * pow((COLUMN_DIAMETER/2), 2)
+
+    # Calculate the relative pressure at the cell
+    pressureAtCell = (MIN_VOLUME_INCREMENT * pow(10, -6) *
+        pressure)/(crossSection * FLUID_DENSITY * pow(10, 1.5) * GRAVITY)
+
+    # Calculate the relative force at the cell, undergoing the set pressure
+    forceOnCell = pi*pow(INTERNAL_RADIUS, 2)*pressureAtCell
+
+    # Calculare the acceleration of the cell, undergoing the set force
+    acceleration = forceOnCell/(CELL_MASS)
+
+    return np.full(len(positions), acceleration*PIXEL_PER_MICRON), dist
+
+def cell_theta(xPip, yPip, positions):
+    """ Relative angle between a point of the micropipette and each cell. As
+    the scalar model, a cell vertically aligned with the point gets an angle
+    of 90 (in radians).
+
+    Args:
+        xPip (int or nd.array): X-Position of the point (pixels)
+        yPip (int or nd.array): Y-Position of the point (pixels)
+        positions (nd.array): [x,y] position of each cell
+
+    Returns:
+        nd.array: Relative angle, theta, of each cell
+    """
+    dx = positions[:, 0] - xPip
+    dy = positions[:, 1] - yPip
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        theta = np.arctan(dy/dx)
+    theta = np.where(np.abs(dy) < 3, 0, theta)
+    return np.where(np.abs(dx) < 3, 90, theta)
+
+class cellPhysics():
+    """
+    Physics state of the emulated cells, as arrays of positions, velocities,
+    accelerations and dimensions with a row per cell. Pressure changes and
+    ticks update every cell at once, so crowded fields of cells can be
+    simulated.
+    """
+    def __init__(self, positions, standardCellDim = None,
+    aspiratedCellDim = None):
+        """
+        Initialise the cells at rest.
+
+        Args:
+            positions (List): [x,y] position of each cell.
+            standardCellDim (List, optional): Dimensions of the cells, cycled
+            over the cells. Defaults to the cell model dimensions.
+            aspiratedCellDim (List, optional): Dimensions of the aspirated
+            cells, cycled over the cells. Defaults to the cell model
+            dimensions.
+        """
+        self.positions = np.array(positions, dtype = np.float64).reshape(-1, 2)
+        self.velocities = np.zeros(len(self.positions))
+        self.accelerations = np.zeros(len(self.positions))
+
+        n = np.arange(len(self.positions))
+        standardCellDim = np.array(cellModel['standardCellDim']
+            if standardCellDim is None else standardCellDim)
+        aspiratedCellDim = np.array(cellModel['aspiratedCellDim']
+            if aspiratedCellDim is None else aspiratedCellDim)
+        self.standardCellDim = standardCellDim[n % len(standardCellDim)]
+        self.aspiratedCellDim = aspiratedCellDim[n % len(aspiratedCellDim)]
+
+    @classmethod
+    def at_random(cls, count, rng):
+        """
+        Initialise cells at random positions within the cell model ranges.
+
+        Args:
+            count (int): Number of cells.
+            rng (random.Random): Random number generator of the emulator.
+
+        Returns:
+            cellPhysics: Cells at rest at random positions.
+        """
+        return cls([[rng.randrange(*cellModel['initCellX']),
+            rng.randrange(*cellModel['initCellY'])] for n in range(count)])
+
+    def apply_pressure(self, xOrigin, yOrigin, pressure):
+        """
+        Set the acceleration of each cell for a change in pressure. Cells
+        at the pipette tip accelerate towards the pipette base, and other
+        cells towards the tip.
+
+        Args:
+            xOrigin (int): X-Position of the micropipette tip
+            yOrigin (int): Y-Position of the micropipette tip
+            pressure (float): Change in pressure (pascals)
+        """
+        atTip = ((self.positions[:, 0] <= xOrigin) &
+            (np.abs(self.positions[:, 1] - yOrigin) < 5))
+        self.accelerations, dist = cell_acceleration(
+            np.where(atTip, -10, xOrigin), yOrigin, self.positions, pressure)
+
+    def tick(self, xOrigin, yOrigin, dt):
+        """
+        Advance the cells by a tick: decay the accelerations, apply drag to
+        the velocities and move the cells towards the pipette.
+
+        Args:
+            xOrigin (int): X-Position of the micropipette tip
+            yOrigin (int): Y-Position of the micropipette tip
+            dt (float): Simulated seconds per tick
+        """
+        acc = self.accelerations
+        vel = self.velocities
+
+        # Decay the accelerations towards 0
+        acc = np.where(0 < acc, np.maximum(acc - vel*dt, 0),
+            np.where(acc < 0, np.minimum(acc - vel*dt, 0), acc))
+
+        # Update the velocities, and apply drag
+        vel = vel + acc*dt
+        vel = np.where(0 < vel, np.maximum(vel - 1*dt, 0),
+            np.where(vel < 0, np.minimum(vel + 1*dt, 0), vel))
+
+        # Cells near the pipette tip approach the base, others the tip
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        nearTip = (np.abs(x - xOrigin) < 3) & (np.abs(y - yOrigin) < 5)
+        theta = cell_theta(np.where(nearTip, -10, xOrigin), yOrigin,
+            self.positions)
+
+        # Calculate the required change in position
+        moveX = vel*np.cos(theta)*dt
+        moveY = vel*np.sin(theta)*dt
+
+        # Ensure move to the target position, at most
+        self.positions[:, 0] = np.where((xOrigin < x) & (xOrigin > x + moveX),
+            xOrigin, x + moveX)
+        self.positions[:, 1] = np.where((yOrigin < y) & (yOrigin > y + moveY),
+            yOrigin, y + moveY)
+
+        self.accelerations = acc
+        self.velocities = vel
@@ -0,0 +1,120 @@
+import time
+from communicationChannels import *
+from .ConfigFiles.config import *
+
+class realTimeClock():
+    """
+    Simulation clock following the wall clock, with a tick due once per
+    period.
+    """
+    stepped = False
+
+    def __init__(self, period = EMULATOR_TICK):
+        """
+        Initialise the clock.
+
+        Args:
+            period (float, optional): Seconds between ticks.
+        """
+        self.period = period
+        self.lastTick = time.time()
+
+    def time(self):
+        """
+        Getter method for the simulated time.
+
+        Returns:
+            float: Simulated time (seconds).
+        """
+        return time.time()
+
+    def step(self):
+        """
+        Request a tick. Ticks follow the wall clock, so requests are ignored.
+        """
+        return
+
+    def wait_tick(self, channels):
+        """
+        Block until a channel has pending contents or the next tick is due.
+
+        Args:
+            channels (List): Channels to wait on.
+
+        Returns:
+            bool: True iff a tick is due. Otherwise, False.
+        """
+        wait_for_channels(channels, max(self.lastTick + self.period -
+            time.time(), 0))
+
+        if(time.time() - self.lastTick > self.period):
+            self.lastTick = time.time()
+            return True
+        return False
+
+class steppedClock():
+    """
+    Simulation clock advanced by a fixed period per requested tick,
+    independent of the wall clock, so scenarios run as fast as the CPU allows
+    and replay deterministically.
+    """
+    stepped = True
+
+    def __init__(self, period = EMULATOR_TICK):
+        """
+        Initialise the clock at time 0.
+
+        Args:
+            period (float, optional): Simulated seconds per tick.
+        """
+        self.period = period
+        self.ticks = 0
+        self.pending = 0
+
+    def time(self):
+        """
+        Getter method for the simulated time.
+
+        Returns:
+            float: Simulated time (seconds).
+        """
+        return self.ticks*self.period
+
+    def step(self):
+        """
+        Request a tick.
+        """
+        self.pending += 1
+
+    def wait_tick(self, channels):
+        """
+        Advance the simulated time by a period if a tick was requested.
+        Otherwise, block until a channel has pending contents.
+
+        Args:
+            channels (List): Channels to wait on.
+
+        Returns:
+            bool: True iff a tick is due. Otherwise, False.
+        """
+        if(self.pending == 0):
+            wait_for_channels(channels, None)
+            return False
+
+        self.pending -= 1
+        self.ticks += 1
+        return True
+
+def emulator_clock(mode = EMULATOR_CLOCK, period = EMULATOR_TICK):
+    """ Create the simulation clock of the emulator.
+
+    Args:
+        mode (str, optional): "REALTIME" or "STEPPED".
+        period (float, optional): Simulated seconds per tick.
+
+    Returns:
+        realTimeClock or steppedClock: Simulation clock.
+    """
+    if(mode == "STEPPED"):
+        return steppedClock(period)
+    return realTimeClock(period)
@@ -1,18 +1,24 @@
 from multiprocessing import *
 from multiprocessing.managers import *
 from .SoftwareDrivers.ConfigFiles.config import *
+from .SoftwareDrivers.clock_driver import *
+from .SoftwareDrivers.cell_physics_driver import *
 import os
+import queue
 import numpy as np
 import random
 from systemInformation import *
 from settings import *
+from communicationChannels import *
 from math import *
 import time
 
-# Mass of the cell to aspirate
-CELL_MASS = 0.0000000000001
-# Radius of the cell to aspirate
-INTERNAL_RADIUS = 0.000002
+# Command requesting a frame of the current state, tagged with the number of
+# the request (returned with the frame) and the number of the frame held by
+# the capture device (the frame is sent as the changes since it)
+FRAME_COMMAND = "0 FRAME %d %d\n"
+# Command requesting a tick of a stepped emulator clock, and its frame
+STEP_COMMAND = "0 STEP %d %d\n"
 
 class SerialEmulator:
     """ 
@@ -78,16 +84,29 @@ class CaptureEmulator:
     """
     Capture emululation class for Image capturing class
     """
-    def __init__(self, imageQueue):
+    def __init__(self, imageQueue, commandQueue, stepped = False):
         """
         Initialise Capture emulator object.
 
         Args:
             imageQueue (Queue): Queue to send captured images over
+            commandQueue (Queue): Queue to request frames over (ordered with
+            the serial commands)
+            stepped (bool, optional): True iff the emulator clock is stepped,
+            each frame requested advancing it a tick. Defaults to False.
         """
-        # Initialise empty image
-        self.image = np.zeros((750,750,3), dtype = np.uint8)
+        # Initialise empty image (as the emulator's initial frame)
+        self.image = np.zeros((emulatorModel['imgHeight'],
+            emulatorModel['imgWidth'], 3), dtype = np.uint8)
         self.imageQueue = imageQueue
+        self.commandQueue = commandQueue
+        self.stepped = stepped
+
+        # Number of the last frame request, the frame held and the regions
+        # changed by the last read
+        self.request = 0
+        self.frameNumber = 0
+        self.dirtyRegions = []
 
     def empty(self):
         """ 
@@ -101,124 +120,157 @@ class CaptureEmulator:
 
     def read(self):
         """
-        Read method to access image via the Capture device.
+        Read method to access image via the Capture device. The emulator
+        renders a frame of its current state on request (advancing a tick
+        first if stepped), sending only the regions changed since the frame
+        held. Frames of earlier requests (arriving after their read timed
+        out) are dropped.
 
         Returns:
-            nd.array: Numpy array representing image.
+            bool, nd.array: True iff a new image was rendered, and the Numpy
+            array representing image.
         """
-        # Check if the image Queue is non empty
-        if(not self.imageQueue.empty()):
-            # Update the image
-            self.image = self.imageQueue.get()
-        
+        # Request a frame, and await it
+        self.request += 1
+        self.commandQueue.put((STEP_COMMAND if self.stepped else
+            FRAME_COMMAND)%(self.request, self.frameNumber))
+
+        deadline = time.time() + EMULATOR_FRAME_TIMEOUT
+        while(True):
+            try:
+                request, frameUpdate = self.imageQueue.get(
+                    timeout = max(deadline - time.time(), 0))
+            except queue.Empty:
+                self.dirtyRegions = []
+                return False, self.image
+
+            # Frames of earlier requests are relative to the same frame held,
+            # the frame of this request supersedes them
+            if(request == self.request):
+                break
+
+        self.update_image(frameUpdate)
+
         # Send the image to the application
         return True, self.image
+
+    def update_image(self, frameUpdate):
+        """
+        Update the image from a frame update sent by the emulator. Images
+        returned by earlier reads are left unchanged, the changes are applied
+        to a copy.
+
+        Args:
+            frameUpdate (tuple): Frame number, the whole frame (or None) and
+            the changed regions [X, Y, W, H] with their pixels (as
+            FrameRenderer.frame_update).
+        """
+        self.frameNumber, image, patches = frameUpdate
+
+        # The whole frame replaces the image
+        if(image is not None):
+            height, width = image.shape[:2]
+            self.image = image
+            self.dirtyRegions = [[0, 0, width, height]]
+            return
+
+        self.dirtyRegions = [region for region, pixels in patches]
+        if(patches):
+            self.image = self.image.copy()
+        for (x, y, w, h), pixels in patches:
+            self.image[y:y + h, x:x + w] = pixels
+
+    def get_dirty_regions(self):
+        """
+        Getter method for the regions of the image changed by the last read.
+
+        Returns:
+            List: Regions [X, Y, W, H] that changed since the previous read.
+            Empty if the image is unchanged.
+        """
+        return self.dirtyRegions
  
-def initialise_emulation_process(commandQueue, imageQueue):
+def initialise_emulation_process(commandQueue, imageQueue, clock = None,
+seed = EMULATOR_SEED):
     """ Initialisation of the Emulation process.
 
     Args:
         commandQueue (Queue): Queue to communicate Serial commands to emulator.
         imageQueue (Queue): Queue to communicate Images to the application.
+        clock (realTimeClock or steppedClock, optional): Simulation clock.
+        Defaults to the clock set by EMULATOR_CLOCK.
+        seed (int, optional): Seed of the random pipette and cell placement.
+        Defaults to EMULATOR_SEED.
 
     Returns:
         int: ID of the Emulator process
     """
     # Declare emulation process
-    emulationProcess = Process(target = emulation_processer, 
-        args=(commandQueue, imageQueue))
+    emulationProcess = Process(target = emulation_processer,
+        args=(commandQueue, imageQueue, clock, seed))
     emulationProcess.start()
     return emulationProcess.pid
 
-def emulation_processer(commandQueue, imageQueue):
-    """ 
+def emulation_processer(commandQueue, imageQueue, clock = None,
+seed = EMULATOR_SEED):
+    """
     Process loop for Emulation software to update the Serial and Capture
     objects once per frame.
 
     Args:
         commandQueue (Queue): Queue to communicate Serial commands to emulator.
         imageQueue (Queue): Queue to communicate Images to the application.
+        clock (realTimeClock or steppedClock, optional): Simulation clock.
+        Defaults to the clock set by EMULATOR_CLOCK.
+        seed (int, optional): Seed of the random pipette and cell placement.
+        Defaults to EMULATOR_SEED (None seeds from the system).
     """
+    if(clock is None):
+        clock = emulator_clock()
+
+    # Random number generator of the emulator, placing the pipette and cells
+    rng = random.Random(seed)
+
     # Initialise emulator state
     toolSel = 0
-    initialPDist = 0
 
     yPipette = [-pipetteModel['pipetteHeight'], 
                 pipetteModel['pipetteHeight']]
     xPipetteTip = 0
-    theta = 0
 
     # Initialise emulator pipette tip origin
-    yOrigin = int(pipetteModel['initPipetteY'])
-    xOrigin = pipetteModel['initPipetteX']
+    xOrigin = rng.randrange(*pipetteModel['initPipetteX'])
+    yOrigin = rng.randrange(*pipetteModel['initPipetteY'])
+
+    # Initiaise position, velocity and acceleration of each cell
+    cells = cellPhysics.at_random(EMULATOR_CELLS, rng)
 
-    # Initialise cell origin
-    cellPos = cellModel['initCellPos']
-    
-    # Initiaise position, velocity and acceleration based on pressure.
     absPosX = 0
     absPosY = 0
-    cellAcceleration = 0
-    cellVelocity = 0
     pipettePressure = 0
 
-    # Set the update time for change in cell position
-    updatePortionOfSecond = 1/10
-    lastUpdateTime = time.time()*1000
+    # Set the simulated time between changes in cell position
+    updatePortionOfSecond = clock.period
+
+    # Frame the emulator draws into when a frame is requested, redrawing
+    # only what changed since the last request
+    renderer = FrameRenderer()
 
-    imageQueue.put(draw_frame(xPipetteTip, yPipette, xOrigin, yOrigin, cellPos))
+    # Requests of the ticks requested on the stepped clock
+    stepRequests = []
 
     while(1):
 
-        # If the change in time is sufficient for an update
-        if(time.time()*1000 - lastUpdateTime > updatePortionOfSecond*1000):
-            # If the cell is to move away from the micropipette
-            if(0 < cellAcceleration):
-                cellAcceleration = max(cellAcceleration - 
-                    cellVelocity*updatePortionOfSecond, 0)
-            # If the cell is to move towards the micropipette
-            if(cellAcceleration < 0):
-                cellAcceleration = min(cellAcceleration - 
-                    cellVelocity*updatePortionOfSecond, 0)
-            
-            # Update the cell velocity
-            cellVelocity += cellAcceleration*updatePortionOfSecond
-
-            # If the cell is moving
-            if(0 < cellVelocity):
-                cellVelocity = max(cellVelocity - 1*updatePortionOfSecond, 0)
-            if(cellVelocity < 0):
-                cellVelocity = min(cellVelocity + 1*updatePortionOfSecond, 0)
-            
-            # If the cell is near the pipette tip, approach the base
-            if((abs(cellPos[0][0] - xOrigin) < 3) and 
-                (abs(cellPos[0][1] - yOrigin) < 5)):
-                theta = cell_to_pipette_theta(-10, yOrigin, cellPos[0])
-            # If the cell is away from the pipette tip, approach the tip
-            else:
-                theta = cell_to_pipette_theta(xOrigin, yOrigin, cellPos[0])
-
-            # Calculate the required change in position
-            moveX = cellVelocity*cos(theta)*updatePortionOfSecond
-            moveY = cellVelocity*sin(theta)*updatePortionOfSecond
-
-            # Ensure move to the target position, at most
-            if((xOrigin < cellPos[0][0]) and (xOrigin > cellPos[0][0] + moveX)):
-                cellPos[0][0] = xOrigin
-            else:
-                cellPos[0][0] += moveX
-            
-            if((yOrigin < cellPos[0][1]) and (yOrigin > cellPos[0][1] + moveY)):
-                cellPos[0][1] = yOrigin
-            else:
-                cellPos[0][1] += moveY
-
-            # Update the image to be displayed by the capture device
-            imageQueue.put(draw_frame(xPipetteTip, yPipette, xOrigin, 
-                        yOrigin, cellPos))            
-
-            # Set update time
-            lastUpdateTime = time.time()*1000
+        # Block until a serial command arrives or the next update is due,
+        # updating if the change in time is sufficient
+        if(clock.wait_tick([commandQueue])):
+            # Accelerate, apply drag and move every cell
+            cells.tick(xOrigin, yOrigin, updatePortionOfSecond)
+
+            # Send the frame of a requested tick to the capture device
+            if(clock.stepped):
+                render_frame(renderer, imageQueue, *stepRequests.pop(0),
+                    xPipetteTip, yPipette, xOrigin, yOrigin, cells)
     
         # If a pending serial command exists
         if(not commandQueue.empty()):
@@ -248,9 +300,18 @@ def emulation_processer(commandQueue, imageQueue):
                 else:
                     absPosY = pos
 
-                # Update the image to be displayed by the capture device
-                imageQueue.put(draw_frame(xPipetteTip, yPipette, xOrigin, 
-                    yOrigin, cellPos))
+            # If a frame is requested, send the current state to the capture
+            # device
+            if(commandSections[1] == "FRAME"):
+                render_frame(renderer, imageQueue, int(commandSections[2]),
+                    int(commandSections[3]), xPipetteTip, yPipette, xOrigin,
+                    yOrigin, cells)
+
+            # If a tick of the stepped clock is requested
+            if(commandSections[1] == "STEP"):
+                stepRequests.append((int(commandSections[2]),
+                    int(commandSections[3])))
+                clock.step()
 
             # If tool select command
             if(commandSections[1] == "T"):
@@ -259,25 +320,36 @@ def emulation_processer(commandQueue, imageQueue):
 
             # If presssure command
             if(commandSections[1] == "S01"):
-                # If cell is far away from the pipette tip
-                if((cellPos[0][0] <= xOrigin) 
-                    and (abs(cellPos[0][1] - yOrigin) < 5)):
-                    # Calculate the cell acceleration to the pipette tip
-                    cellAcceleration, initialPDist = updateCellPosition(
-                        -10, yOrigin, cellPos[0], 
-                        (float(commandSections[2]) - pipettePressure))
-                else:
-                    # Calculate the accleleration to the pipette base
-                    cellAcceleration, initialPDist = updateCellPosition(xOrigin, 
-                    yOrigin, cellPos[0], 
-                    (float(commandSections[2]) - pipettePressure))
+                # Calculate the cell accelerations for the change in pressure
+                cells.apply_pressure(xOrigin, yOrigin,
+                    float(commandSections[2]) - pipettePressure)
                 pipettePressure = float(commandSections[2])
                 
                 if(commandSections[2] == 1):
-                    cellAcceleration = -cellAcceleration
+                    cells.accelerations = -cells.accelerations
 
 
 
+def render_frame(renderer, imageQueue, request, heldFrame, xPip, yPip,
+xOrigin, yOrigin, cells):
+    """
+    Render the emulator frame and send its changes to the capture device.
+
+    Args:
+        renderer (FrameRenderer): Renderer of the emulator frames.
+        imageQueue (Queue): Queue to communicate Images to the application.
+        request (int): Number of the frame request, returned with the frame.
+        heldFrame (int): Number of the frame held by the capture device.
+        xPip (int): X-Position of the Micropipette tip (pixels)
+        yPip (int): Y-Position of the Micropipette tip (pixels)
+        xOrigin (int): Initial X-Position of the micropipette tip
+        yOrigin (int): Initial Y-Position of the micropipette tip
+        cells (cellPhysics): Physics state of the cells
+    """
+    regions = renderer.render(xPip, yPip, xOrigin, yOrigin, cells.positions,
+        (cells.standardCellDim, cells.aspiratedCellDim))
+    imageQueue.put((request, renderer.frame_update(regions, heldFrame)))
+
 def updateCellPosition(xPip, yPip, cellPos, pressure):
     """
     Update cell positon recorded for the emulator
@@ -291,25 +363,9 @@ def updateCellPosition(xPip, yPip, cellPos, pressure):
     Returns:
         int, int: Acceleration,Distance of the cell to the micropipette tip
     """
-    
-    # Calculate difference in position in micrometers
-    dist = sqrt(pow(xPip - cellPos[0], 2) + pow(yPip - cellPos[1], 2))
-    micron = dist/(PIXEL_PER_MICRON)
-
-    # Calculate volume from desired pressure
-    crossSection = pi * pow((COLUMN_DIAMETER/2), 2)
-
-    # Calculate the relative pressure at the cell
-    pressureAtCell = (MIN_VOLUME_INCREMENT * pow(10, -6) * 
-        pressure)/(crossSection * FLUID_DENSITY * pow(10, 1.5) * GRAVITY)
-
-    # Calculate the relative force at the cell, undergoing the set pressure
-    forceOnCell = pi*pow(INTERNAL_RADIUS, 2)*pressureAtCell
-
-    # Calculare the acceleration of the cell, undergoing the set force
-    acceleration = forceOnCell/(CELL_MASS)
-
-    return acceleration*PIXEL_PER_MICRON, dist
+    acceleration, dist = cell_acceleration(xPip, yPip,
+        np.array([cellPos], dtype = np.float64), pressure)
+    return float(acceleration[0]), float(dist[0])
 
 
 def cell_to_pipette_theta(xPip, yPip, cellPos):
@@ -324,12 +380,8 @@ def cell_to_pipette_theta(xPip, yPip, cellPos):
     Returns:
         int: Relative angle, theta, between the cell and micropipette tip
     """
-    if(abs(cellPos[0] - xPip) < 3):
-        return 90
-    if(abs(cellPos[1] - yPip) < 3):
-        return 0
-
-    return atan((cellPos[1] - yPip)/(cellPos[0] - xPip))
+    return float(cell_theta(xPip, yPip,
+        np.array([cellPos], dtype = np.float64))[0])
 
 
 def set_pipette_position(toolSel, xPip, yPip, pos, xOrigin, yOrigin):
@@ -366,7 +418,67 @@ def set_pipette_position(toolSel, xPip, yPip, pos, xOrigin, yOrigin):
 
     return xOrigin, yOrigin 
 
-def draw_frame(xPip, yPip, xOrigin, yOrigin, cellPos):
+def frame_boxes(xPip, yPip, xOrigin, yOrigin, cellPos, width, height,
+cellDims = None):
+    """ Boxes of the shapes drawn in a frame: the two pipette walls, the
+    pipette tip and each cell (computed for all cells at once).
+
+    Args:
+        xPip (int): X-Position of the Micropipette tip (pixels)
+        yPip (int): Y-Position of the Micropipette tip (pixels)
+        xOrigin (int): Initial X-Position of the micropipette tip
+        yOrigin (int): Initial Y-Position of the micropipette tip
+        cellPos (int[]): [x,y] position of each cell
+        width (int): Width of the frame.
+        height (int): Height of the frame.
+        cellDims (tuple, optional): Standard and aspirated dimensions of each
+        cell. Defaults to the cell model dimensions, cycled over the cells.
+
+    Returns:
+        nd.array: [yStart, yStop, xStart, xStop] of each shape, clipped to
+        the frame (empty boxes have stop = start).
+    """
+    # Pipette walls, from the left border to the tip, and the pipette tip
+    xTip = xPip + xOrigin
+    boxes = [[max(int(yWall + yOrigin - 1), 0),
+        min(int(yWall + yOrigin + 2), height - 1), 0, min(xTip, width)]
+        for yWall in (yPip[1], yPip[0])]
+    boxes.append([max(int(yPip[0] + yOrigin), 0),
+        min(int(yPip[1] + yOrigin), height - 1), max(int(xTip - 1), 0),
+        min(int(xTip + 2), width - 1)])
+    boxes = np.array(boxes, dtype = np.int64).reshape(-1, 4)
+
+    # Cells, aspirated when behind the pipette tip
+    cells = np.asarray(cellPos, dtype = np.float64).reshape(-1, 2)
+    if(len(cells)):
+        if(cellDims is None):
+            n = np.arange(len(cells))
+            standardCellDim = np.array(cellModel['standardCellDim'])[
+                n % len(cellModel['standardCellDim'])]
+            aspiratedCellDim = np.array(cellModel['aspiratedCellDim'])[
+                n % len(cellModel['aspiratedCellDim'])]
+        else:
+            standardCellDim, aspiratedCellDim = cellDims
+        aspirated = ((cells[:, 0] + standardCellDim[:, 0]/2 <= xOrigin) &
+            (np.abs(yOrigin - cells[:, 1]) < 10))
+        cellDim = np.where(aspirated[:, np.newaxis], aspiratedCellDim,
+            standardCellDim)
+
+        cellBoxes = np.stack([
+            np.maximum(np.trunc(cells[:, 1] - cellDim[:, 1]), 0),
+            np.minimum(np.trunc(cells[:, 1] + cellDim[:, 1] + 1), height - 1),
+            np.maximum(np.trunc(cells[:, 0]), 0),
+            np.minimum(np.trunc(cells[:, 0] + 2*cellDim[:, 0] + 1), width - 1)
+            ], axis = 1).astype(np.int64)
+        boxes = np.concatenate([boxes, cellBoxes])
+
+    # Empty ranges (including negative stops) become empty boxes
+    boxes[:, 1] = np.maximum(boxes[:, 1], boxes[:, 0])
+    boxes[:, 3] = np.maximum(boxes[:, 3], boxes[:, 2])
+    return boxes
+
+def draw_frame(xPip, yPip, xOrigin, yOrigin, cellPos, width = None,
+height = None, out = None):
     """[summary]
 
     Args:
@@ -375,55 +487,138 @@ def draw_frame(xPip, yPip, xOrigin, yOrigin, cellPos):
         cellPos (int[]): [x,y] position of the cell
         xOrigin (int): Initial X-Position of the micropipette tip
         yOrigin (int): Initial Y-Position of the micropipette tip
+        width (int, optional): Width of the frame. Defaults to the emulator
+        model image width.
+        height (int, optional): Height of the frame. Defaults to the emulator
+        model image height.
+        out (nd.array, optional): Frame to draw into, of shape (height,
+        width, 3). Defaults to None (a new frame is allocated).
 
     Returns:
         nd.array: Updated frame with the set positions
     """
-    # Create an empty image array
-    image = np.zeros((emulatorModel['imgWidth'],
-                        emulatorModel['imgHeight'],3), 
-                        dtype = np.uint8)
-
-    # Iterate over the pipette tip ranges to draw its representation
-    for x in range(0, xPip + xOrigin):
-        for y in range(max(int(yPip[1] + yOrigin - 1), 0), 
-            min(int(yPip[1] + yOrigin + 2), 749)):
-            image[y, x] = 255
-        for y in range(max(int(yPip[0] + yOrigin - 1), 0), 
-            min(int(yPip[0] + yOrigin + 2), 749)):
-            image[y, x] = 255
-
-    for x in range(max(int(xPip + xOrigin - 1), 0), 
-        min(int(xPip +xOrigin + 2), 749)):
-        for y in range(max(int(yPip[0] + yOrigin),0), 
-            min(int(yPip[1] + yOrigin),749)):
-            image[y, x] = 255
-
-    # Iterate over the cell ranges to draw its representation
-    for n,cell in enumerate(cellPos):
-        standardCellDim = cellModel['standardCellDim'][n]
-        aspiratedCellDim = cellModel['aspiratedCellDim'][n]
-        if((cell[0] + standardCellDim[0]/2 <= xOrigin) 
-        and (abs(yOrigin - cell[1]) < 10)):
-            cellDim = aspiratedCellDim
-        else:
-            cellDim = standardCellDim
-        for y in range(max(int(cell[1] - cellDim[1]),0), 
-        min(int(cell[1] + cellDim[1] + 1), 749)):
-            for x in range(max(int(cell[0]),0), 
-            min(int(cell[0] + 2*cellDim[0] + 1), 749)):
-                image[y,x] = 255
+    # Create an empty image array, or clear the reused one
+    if(out is None):
+        width = emulatorModel['imgWidth'] if width is None else width
+        height = emulatorModel['imgHeight'] if height is None else height
+        image = np.zeros((height, width, 3), dtype = np.uint8)
+    else:
+        height, width = out.shape[:2]
+        image = out
+        image.fill(0)
+
+    # Draw the pipette and each cell
+    for yStart, yStop, xStart, xStop in frame_boxes(xPip, yPip, xOrigin,
+        yOrigin, cellPos, width, height).tolist():
+        image[yStart:yStop, xStart:xStop] = 255
 
     # Return the updated image 
     return image
 
+class FrameRenderer:
+    """
+    Incremental renderer of emulator frames. Keeps a persistent frame and,
+    when positions change, erases and redraws only the boxes of the shapes
+    that moved, so the render cost depends on what changed rather than on
+    the frame size or number of cells.
+    """
+    def __init__(self, width = None, height = None):
+        """
+        Initialise the renderer with an empty frame.
 
+        Args:
+            width (int, optional): Width of the frame. Defaults to the
+            emulator model image width.
+            height (int, optional): Height of the frame. Defaults to the
+            emulator model image height.
+        """
+        width = emulatorModel['imgWidth'] if width is None else width
+        height = emulatorModel['imgHeight'] if height is None else height
+        self.image = np.zeros((height, width, 3), dtype = np.uint8)
+        # Boxes of the shapes currently drawn (as frame_boxes)
+        self.boxes = np.zeros((0, 4), dtype = np.int64)
+        # Number of frames with changes rendered
+        self.frameNumber = 0
+
+    def render(self, xPip, yPip, xOrigin, yOrigin, cellPos, cellDims = None):
+        """
+        Update the frame to the set positions.
 
+        Args:
+            xPip (int): X-Position of the Micropipette tip (pixels)
+            yPip (int): Y-Position of the Micropipette tip (pixels)
+            xOrigin (int): Initial X-Position of the micropipette tip
+            yOrigin (int): Initial Y-Position of the micropipette tip
+            cellPos (int[]): [x,y] position of each cell
+            cellDims (tuple, optional): Standard and aspirated dimensions of
+            each cell. Defaults to the cell model dimensions.
 
+        Returns:
+            List: Regions [X, Y, W, H] of the frame that changed (old and new
+            boxes of the shapes that moved). Empty if the frame is unchanged.
+        """
+        height, width = self.image.shape[:2]
+        boxes = frame_boxes(xPip, yPip, xOrigin, yOrigin, cellPos, width,
+            height, cellDims)
+
+        # Shapes that moved (all shapes if the number of cells changed)
+        if(boxes.shape == self.boxes.shape):
+            moved = np.any(boxes != self.boxes, axis = 1)
+            erased = self.boxes[moved]
+        else:
+            moved = np.ones(len(boxes), dtype = bool)
+            erased = self.boxes
+
+        regions = np.concatenate([erased, boxes[moved]])
+        regions = regions[(regions[:, 1] > regions[:, 0]) &
+            (regions[:, 3] > regions[:, 2])]
+        if(len(regions) == 0):
+            self.boxes = boxes
+            return []
+
+        # Erase the old boxes of the moved shapes
+        for yStart, yStop, xStart, xStop in erased.tolist():
+            self.image[yStart:yStop, xStart:xStop] = 0
+
+        # Draw the moved shapes, and the shapes overlapping the erased boxes
+        overlapping = np.any(
+            (boxes[:, np.newaxis, 0] < erased[np.newaxis, :, 1]) &
+            (erased[np.newaxis, :, 0] < boxes[:, np.newaxis, 1]) &
+            (boxes[:, np.newaxis, 2] < erased[np.newaxis, :, 3]) &
+            (erased[np.newaxis, :, 2] < boxes[:, np.newaxis, 3]), axis = 1)
+        for yStart, yStop, xStart, xStop in boxes[moved |
+            overlapping].tolist():
+            self.image[yStart:yStop, xStart:xStop] = 255
+
+        self.boxes = boxes
+        self.frameNumber += 1
+        return [[xStart, yStart, xStop - xStart, yStop - yStart]
+            for yStart, yStop, xStart, xStop in regions.tolist()]
+
+    def frame_update(self, regions, heldFrame):
+        """
+        Frame update to send to the capture emulator, holding only the pixels
+        of the regions the capture emulator is missing. The queue pickles
+        items in a feeder thread, so the pixels are copied.
 
-        
-
+        Args:
+            regions (List): Regions of the frame that changed in the last
+            render.
+            heldFrame (int): Number of the frame held by the capture
+            emulator.
 
+        Returns:
+            int, nd.array, List: Frame number, a copy of the whole frame if
+            the held frame is neither the current nor the previous frame
+            (otherwise None), and the regions [X, Y, W, H] that changed since
+            the held frame with their pixels.
+        """
+        if(heldFrame == self.frameNumber):
+            return self.frameNumber, None, []
 
+        if((heldFrame == self.frameNumber - 1) and regions):
+            return self.frameNumber, None, [([x, y, w, h],
+                self.image[y:y + h, x:x + w].copy())
+                for x, y, w, h in regions]
 
-    
\ No newline at end of file
+        return self.frameNumber, self.image.copy(), []
@@ -10,3 +10,5 @@ RECV_ATTEMPTS = 1
 
 TRANSMIT_ATTEMPTS = 1
 
+SERIAL_POLL_INTERVAL = 0.05
+
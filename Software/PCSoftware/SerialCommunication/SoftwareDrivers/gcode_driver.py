@@ -172,6 +172,19 @@ class codeSequence:
             
         return True
 
+    def motion_duration(self):
+        """ Expected duration of the motion commanded by the sequence.
+
+        Returns:
+            float: Duration (in seconds) of the rapid positioning commands.
+            None if the sequence commands no motion.
+        """
+        moves = [code for code in self.sequence
+            if isinstance(code, GCodeSegment) and (code.code == "G00")]
+        if(not moves):
+            return None
+        return sum([abs(code.pos)/code.rate for code in moves if code.rate])
+
     def isEmpty(self):
         """ Check method for if the code sequence is empty.
 
@@ -2,6 +2,8 @@ from .SoftwareDrivers.gcode_driver import *
 from .SoftwareDrivers.ConfigFiles.settings import *
 from Emulator.emulator_os import *
 from multiprocessing import *
+from communicationChannels import *
+from sessionRecording import recordingSerial, replaySerial
 import time
 
 
@@ -21,22 +23,54 @@ Arguments       SOut (Queue) Queue of G-Code Sequences to transmit
 '''
 def serial_comm_process(context, deviceName, emulate):
     errNo = 0
-    if(SERIAL_EMULATOR):
+    if(SERIAL_EMULATOR or isinstance(emulate, replaySerial)):
         ser = emulate
     else:
         ser = initialise_serial(errNo, deviceName, BAUDRATE)
 
+    # Record the packets written and read (including acknowledgements)
+    if(ser and context.recorder.enabled):
+        ser = recordingSerial(ser, context.recorder)
+
+    # Wait on the serial device alongside the transmit queue where the
+    # device supports it. Otherwise, poll the device between waits
+    channels = [context.sOut]
+    timeout = CHANNEL_WAIT_TIMEOUT
+    if(ser and hasattr(ser, "fileno")):
+        channels.append(ser)
+    elif(ser):
+        timeout = SERIAL_POLL_INTERVAL
+
     time.sleep(1)
     while(1):
+        # Block until there is something to transmit or recieve
+        wait_for_channels(channels if ser else [], timeout)
+
         if(ser):
             #Prioritise transmission, check if anything to transmit
             while(not(context.sOut.empty())):
                 #Attempt to transmit sequence
                 sequence = context.sOut.get()
-                if not(sequence.transmit_sequence(ser, transmit_disp = context.sDisp)):
-                    context.put_comm_success(False)
-                else:
-                    context.put_comm_success(True)
+                context.recorder.record("command", sequence)
+
+                # Notify the computer vision process of motion, completing
+                # at an unknown time until the sequence is transmitted
+                duration = sequence.motion_duration()
+                if(duration is not None):
+                    context.motionQ.put(float('inf'))
+
+                # The completion is always sent, even if transmission
+                # raises. A failed sequence does not move, completing now
+                success = False
+                try:
+                    success = bool(sequence.transmit_sequence(ser,
+                        transmit_disp = context.sDisp))
+                    context.recorder.record("result", success)
+                    context.put_comm_success(success)
+                finally:
+                    if(duration is not None):
+                        context.motionQ.put(time.time() +
+                            (duration if success else 0))
 
             #Check if anything to recieve
             command = recieve_serial(errNo, ser, 1)
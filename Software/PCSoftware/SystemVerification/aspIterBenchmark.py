@@ -0,0 +1,110 @@
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ComputerVision.SoftwareDrivers.image_processing_driver import aspTracker
+
+FRAME_WIDTHS = [750, 2048] # Frame widths to benchmark
+NUM_CHECKS = 500 # Number of random scans compared against the reference
+REPEATS = 200 # Number of timed scans per measurement
+
+def reference_asp_iter(src, x_range, step, comp_dist, mu_grad, mu_offset,
+thresh):
+    """ Per pixel implementation of aspTracker.asp_iter, used as the reference
+    for the vectorised implementation.
+    """
+    iteration = x_range[0]
+
+    for x_coord in range(x_range[0], x_range[1], step):
+        curr_pixel = int(src[int(x_coord * mu_grad + mu_offset), x_coord])
+        comp_pixel = int(src[int((x_coord + step*comp_dist) * mu_grad
+            + mu_offset), x_coord + step*comp_dist])
+
+        if thresh < abs(curr_pixel - comp_pixel):
+            iteration = int(x_coord + step*comp_dist/2)
+            break
+
+        iteration += step
+
+    if(step > 0):
+        if(iteration >= x_range[1]):
+            return None
+    else:
+        if(iteration <= x_range[1]):
+            return None
+
+    return iteration
+
+def synthetic_frame(width, rng):
+    """ Generate a grayscale frame containing a pipette with an aspirated
+    cell edge along its centreline.
+
+    Args:
+        width (int): Width (and height) of the frame.
+        rng (numpy.random.Generator): Random number generator.
+
+    Returns:
+        numpy.ndarray, int, float, int: Frame, pipette tip X coordinate,
+        centreline gradient and centreline offset.
+    """
+    src = rng.integers(0, 8, (width, width), dtype = np.uint8)
+    tipX = int(rng.integers(width//2, width - 20))
+    mu_grad = round(float(rng.uniform(-0.2, 0.2)), 1)
+    mu_offset = int(width/2 - mu_grad*tipX/2)
+
+    # Draw the aspirated cell along the centreline
+    edgeX = int(rng.integers(20, tipX - 20))
+    for x in range(edgeX, tipX):
+        y = int(x * mu_grad + mu_offset)
+        src[max(y - 5, 0):y + 5, x] = 200
+
+    return src, tipX, mu_grad, mu_offset
+
+def check_equivalence(tracker, rng, n = NUM_CHECKS):
+    """ Compare the vectorised and reference scans over random frames.
+
+    Returns:
+        int: Number of scans with differing results.
+    """
+    mismatches = 0
+    for i in range(n):
+        width = FRAME_WIDTHS[i % len(FRAME_WIDTHS)]
+        src, tipX, mu_grad, mu_offset = synthetic_frame(width, rng)
+        thresh = int(rng.integers(0, 60))
+
+        for args in ([src, [tipX - 10, 10], -1, 5, mu_grad, mu_offset, thresh],
+                     [src, [10, tipX - 10], 1, 5, mu_grad, mu_offset, thresh]):
+            if(tracker.asp_iter(*args) != reference_asp_iter(*args)):
+                mismatches += 1
+
+    return mismatches
+
+def asp_iter_benchmark():
+    """ Time the reference and vectorised scans at each frame width.
+    """
+    rng = np.random.default_rng(0)
+    tracker = aspTracker()
+
+    print("Mismatched scans: %d"%(check_equivalence(tracker, rng)))
+    print("Width,Direction,Reference (us),Vectorised (us),Speedup")
+
+    for width in FRAME_WIDTHS:
+        src, tipX, mu_grad, mu_offset = synthetic_frame(width, rng)
+        # Scan the full pipette length (no edge found)
+        src[:] = 0
+
+        for name, args in (("backward",
+            [src, [tipX - 10, 10], -1, 5, mu_grad, mu_offset, 10]),
+            ("forward", [src, [10, tipX - 10], 1, 5, mu_grad, mu_offset, 10])):
+            reference = timeit.timeit(lambda: reference_asp_iter(*args),
+                number = REPEATS)
+            vectorised = timeit.timeit(lambda: tracker.asp_iter(*args),
+                number = REPEATS)
+            print("%d,%s,%.1f,%.1f,%.1f"%(width, name, 1e6*reference/REPEATS,
+                1e6*vectorised/REPEATS, reference/vectorised))
+
+if __name__ == "__main__":
+    asp_iter_benchmark()
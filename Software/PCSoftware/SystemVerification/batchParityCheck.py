@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+import tempfile
+
+import cv2
+import numpy as np
+from multiprocessing import *
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from communicationChannels import frameChannel
+from ComputerVision.image_processing_OS import imageProcesser
+from ComputerVision.batch_tracking_OS import *
+from ComputerVision.SoftwareDrivers import capture_driver
+from Emulator.emulator_os import draw_frame
+from Emulator.SoftwareDrivers.ConfigFiles.config import pipetteModel
+
+NUM_FRAMES = 60 # Frames of the clip
+CELL_BOX = [380, 280, 40, 40] # Cell selected, [X, Y, W, H]
+CELL_FRAME = 5 # Frame the cell is selected on
+SENSITIVITY = 20 # Edge threshold of pipette detection
+
+def write_clip(videoPath, n = NUM_FRAMES):
+    """ Write a clip of the pipette advancing towards a drifting cell.
+
+    Args:
+        videoPath (str): Path of the video file (.avi).
+        n (int, optional): Number of frames.
+    """
+    yPipette = [-pipetteModel['pipetteHeight'], pipetteModel['pipetteHeight']]
+    writer = cv2.VideoWriter(videoPath, cv2.VideoWriter_fourcc(*"MJPG"), 25,
+        (750, 750))
+    for i in range(n):
+        writer.write(draw_frame(0, yPipette, 150 + 2*i, 300,
+            [[400 - i, 300]]))
+    writer.release()
+
+def batch_rows(videoPath, outputPath):
+    """ Track the clip with batch tracking.
+
+    Returns:
+        numpy.ndarray: Output columns of each frame.
+    """
+    track_video(trackingJob(videoPath, outputPath, CELL_BOX, CELL_FRAME,
+        SENSITIVITY))
+    columns = np.load(outputPath)
+    return np.stack([columns[name] for name in COLUMNS], axis = 1)
+
+def interactive_rows(videoPath, n):
+    """ Track the clip with the computer vision process, processing every
+    frame of the video, requesting frames and selecting the cell as the GUI
+    does.
+
+    Returns:
+        numpy.ndarray: Output columns of each frame, as batch tracking.
+    """
+    # Read the video frame by frame (inherited by the vision process)
+    capture_driver.IMAG_EMULATOR = False
+    capture_driver.IMAG_VIDEO = True
+    capture_driver.VIDEO_PATH = videoPath
+    capture_driver.VIDEO_EVERY_FRAME = True
+
+    pixQ, posQ, capSem = [frameChannel(name)
+        for name in ("pixQ", "posQ", "capSem")]
+    process = Process(target = imageProcesser,
+        args = (pixQ, posQ, capSem, None))
+    process.start()
+
+    systemInfo = systemInformation()
+    rows = []
+    for frameNumber in range(1, n + 1):
+        capSem.put(SENSITIVITY)
+        header, trackers = pixQ.get(timeout = 30)
+        rows.append(frame_row(frameNumber, trackers, systemInfo))
+
+        # Select the cell once its frame has been displayed, before the next
+        # frame is requested
+        if(frameNumber == CELL_FRAME):
+            x, y, w, h = CELL_BOX
+            posQ.put((True, [[x, y], [w, h]]))
+            while(not posQ.empty()):
+                time.sleep(0.01)
+
+    process.terminate()
+    process.join()
+    return np.array(rows, dtype = np.float64)
+
+def batch_parity_check():
+    """ Track the same clip with batch tracking and with the interactive
+    pipeline processing every frame, comparing the tracker outputs of each
+    frame.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        videoPath = os.path.join(directory, "clip.avi")
+        write_clip(videoPath)
+        batch = batch_rows(videoPath, os.path.join(directory, "clip.npz"))
+        interactive = interactive_rows(videoPath, len(batch))
+
+    mismatches = [int(row[0]) for row, other in zip(batch, interactive)
+        if not np.array_equal(row, other, equal_nan = True)]
+    print("Frames,Mismatched frames")
+    print("%d,%d"%(len(batch), len(mismatches)))
+    assert not mismatches, "Tracker outputs differ from frame %d"%(
+        mismatches[0])
+    print("> Interactive tracker outputs match batch tracking")
+
+if __name__ == "__main__":
+    batch_parity_check()
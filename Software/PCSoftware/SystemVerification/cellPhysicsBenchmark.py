@@ -0,0 +1,162 @@
+import os
+import sys
+import timeit
+from math import *
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from settings import *
+from Emulator.SoftwareDrivers.cell_physics_driver import *
+
+CELL_COUNTS = [1, 100, 1000] # Number of cells to benchmark
+NUM_SCENARIOS = 50 # Number of random scenarios compared against the reference
+NUM_TICKS = 100 # Number of ticks per scenario
+REPEATS = 50 # Number of timed ticks per measurement
+DT = 1/10 # Simulated seconds per tick
+
+def reference_acceleration(xPip, yPip, cellPos, pressure):
+    """ Scalar cell acceleration of the original emulator, used as the
+    reference for the vectorised physics.
+    """
+    crossSection = pi * pow((COLUMN_DIAMETER/2), 2)
+    pressureAtCell = (MIN_VOLUME_INCREMENT * pow(10, -6) *
+        pressure)/(crossSection * FLUID_DENSITY * pow(10, 1.5) * GRAVITY)
+    forceOnCell = pi*pow(INTERNAL_RADIUS, 2)*pressureAtCell
+    return forceOnCell/(CELL_MASS)*PIXEL_PER_MICRON
+
+def reference_theta(xPip, yPip, cellPos):
+    """ Scalar cell angle of the original emulator.
+    """
+    if(abs(cellPos[0] - xPip) < 3):
+        return 90
+    if(abs(cellPos[1] - yPip) < 3):
+        return 0
+
+    return atan((cellPos[1] - yPip)/(cellPos[0] - xPip))
+
+class referenceCell():
+    """
+    Scalar physics of a single cell, as the original emulator loop.
+    """
+    def __init__(self, position):
+        self.position = list(position)
+        self.acceleration = 0
+        self.velocity = 0
+
+    def apply_pressure(self, xOrigin, yOrigin, pressure):
+        if((self.position[0] <= xOrigin)
+            and (abs(self.position[1] - yOrigin) < 5)):
+            self.acceleration = reference_acceleration(-10, yOrigin,
+                self.position, pressure)
+        else:
+            self.acceleration = reference_acceleration(xOrigin, yOrigin,
+                self.position, pressure)
+
+    def tick(self, xOrigin, yOrigin, dt):
+        cellPos = self.position
+        if(0 < self.acceleration):
+            self.acceleration = max(self.acceleration - self.velocity*dt, 0)
+        if(self.acceleration < 0):
+            self.acceleration = min(self.acceleration - self.velocity*dt, 0)
+
+        self.velocity += self.acceleration*dt
+
+        if(0 < self.velocity):
+            self.velocity = max(self.velocity - 1*dt, 0)
+        if(self.velocity < 0):
+            self.velocity = min(self.velocity + 1*dt, 0)
+
+        if((abs(cellPos[0] - xOrigin) < 3) and
+            (abs(cellPos[1] - yOrigin) < 5)):
+            theta = reference_theta(-10, yOrigin, cellPos)
+        else:
+            theta = reference_theta(xOrigin, yOrigin, cellPos)
+
+        moveX = self.velocity*cos(theta)*dt
+        moveY = self.velocity*sin(theta)*dt
+
+        if((xOrigin < cellPos[0]) and (xOrigin > cellPos[0] + moveX)):
+            cellPos[0] = xOrigin
+        else:
+            cellPos[0] += moveX
+
+        if((yOrigin < cellPos[1]) and (yOrigin > cellPos[1] + moveY)):
+            cellPos[1] = yOrigin
+        else:
+            cellPos[1] += moveY
+
+def random_cells(count, rng):
+    """ Generate random cell positions, some aligned with the pipette tip.
+
+    Returns:
+        List, int, int: Cell positions and the pipette tip position.
+    """
+    xOrigin = int(rng.integers(75, 375))
+    yOrigin = int(rng.integers(75, 375))
+    positions = [[float(rng.uniform(0, 750)), float(rng.uniform(0, 750))]
+        for n in range(count)]
+
+    # Place cells at and ahead of the pipette tip
+    for position in positions[:count//4]:
+        position[0] = xOrigin + float(rng.uniform(-5, 50))
+        position[1] = yOrigin + float(rng.uniform(-4, 4))
+
+    return positions, xOrigin, yOrigin
+
+def check_equivalence(rng, n = NUM_SCENARIOS):
+    """ Compare the vectorised and reference physics over random scenarios
+    of pressure changes and ticks.
+
+    Returns:
+        float: Largest difference in cell position (pixels).
+    """
+    largest = 0
+    for i in range(n):
+        positions, xOrigin, yOrigin = random_cells(8, rng)
+        cells = cellPhysics(positions)
+        references = [referenceCell(position) for position in positions]
+
+        for tick in range(NUM_TICKS):
+            if(tick % 25 == 0):
+                pressure = float(rng.uniform(-100, 100))
+                cells.apply_pressure(xOrigin, yOrigin, pressure)
+                for reference in references:
+                    reference.apply_pressure(xOrigin, yOrigin, pressure)
+
+            cells.tick(xOrigin, yOrigin, DT)
+            for reference in references:
+                reference.tick(xOrigin, yOrigin, DT)
+
+        largest = max(largest, float(np.max(np.abs(cells.positions -
+            np.array([reference.position for reference in references])))))
+
+    return largest
+
+def physics_benchmark():
+    """ Time the reference and vectorised ticks for each number of cells.
+    """
+    rng = np.random.default_rng(0)
+
+    print("Largest position difference: %.3g px"%(check_equivalence(rng)))
+    print("Cells,Reference (us),Vectorised (us),Speedup")
+
+    for count in CELL_COUNTS:
+        positions, xOrigin, yOrigin = random_cells(count, rng)
+        cells = cellPhysics(positions)
+        references = [referenceCell(position) for position in positions]
+        cells.apply_pressure(xOrigin, yOrigin, 10)
+        for reference in references:
+            reference.apply_pressure(xOrigin, yOrigin, 10)
+
+        def reference_tick():
+            for reference in references:
+                reference.tick(xOrigin, yOrigin, DT)
+        reference = timeit.timeit(reference_tick, number = REPEATS)
+        vectorised = timeit.timeit(lambda: cells.tick(xOrigin, yOrigin, DT),
+            number = REPEATS)
+        print("%d,%.1f,%.1f,%.1f"%(count, 1e6*reference/REPEATS,
+            1e6*vectorised/REPEATS, reference/vectorised))
+
+if __name__ == "__main__":
+    physics_benchmark()
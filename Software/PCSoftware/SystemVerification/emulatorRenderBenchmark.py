@@ -0,0 +1,240 @@
+import os
+import sys
+import time
+import pickle
+import timeit
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Emulator.emulator_os import draw_frame, FrameRenderer, CaptureEmulator
+from Emulator.SoftwareDrivers.ConfigFiles.config import cellModel, pipetteModel
+
+FRAME_SIZES = [(750, 750), (3840, 2160)] # Frame (width, height) to benchmark
+NUM_CHECKS = 300 # Number of random frames compared against the reference
+REPEATS = 20 # Number of timed renders per measurement
+NUM_SEQUENCES = 8 # Number of random sequences of incremental renders
+CELL_COUNTS = [1, 100, 1000] # Number of cells of the incremental benchmark
+
+def reference_draw_frame(xPip, yPip, xOrigin, yOrigin, cellPos, width,
+height):
+    """ Per pixel implementation of draw_frame, used as the reference for the
+    vectorised implementation.
+    """
+    image = np.zeros((height, width, 3), dtype = np.uint8)
+
+    for x in range(0, xPip + xOrigin):
+        for y in range(max(int(yPip[1] + yOrigin - 1), 0),
+            min(int(yPip[1] + yOrigin + 2), height - 1)):
+            image[y, x] = 255
+        for y in range(max(int(yPip[0] + yOrigin - 1), 0),
+            min(int(yPip[0] + yOrigin + 2), height - 1)):
+            image[y, x] = 255
+
+    for x in range(max(int(xPip + xOrigin - 1), 0),
+        min(int(xPip +xOrigin + 2), width - 1)):
+        for y in range(max(int(yPip[0] + yOrigin),0),
+            min(int(yPip[1] + yOrigin), height - 1)):
+            image[y, x] = 255
+
+    for n,cell in enumerate(cellPos):
+        standardCellDim = cellModel['standardCellDim'][n]
+        aspiratedCellDim = cellModel['aspiratedCellDim'][n]
+        if((cell[0] + standardCellDim[0]/2 <= xOrigin)
+        and (abs(yOrigin - cell[1]) < 10)):
+            cellDim = aspiratedCellDim
+        else:
+            cellDim = standardCellDim
+        for y in range(max(int(cell[1] - cellDim[1]),0),
+        min(int(cell[1] + cellDim[1] + 1), height - 1)):
+            for x in range(max(int(cell[0]),0),
+            min(int(cell[0] + 2*cellDim[0] + 1), width - 1)):
+                image[y,x] = 255
+
+    return image
+
+def random_scene(width, height, rng):
+    """ Generate random emulator positions, including positions partially
+    outside the frame.
+
+    Returns:
+        List: Arguments of draw_frame.
+    """
+    yPipette = [-pipetteModel['pipetteHeight'], pipetteModel['pipetteHeight']]
+    xOrigin = int(rng.integers(-30, width))
+    yOrigin = int(rng.integers(-40, height + 40))
+
+    # Cells are either free or aspirated at the pipette tip
+    if(rng.random() < 0.5):
+        cell = [float(rng.uniform(-40, width + 40)),
+            float(rng.uniform(-40, height + 40))]
+    else:
+        cell = [float(xOrigin - rng.uniform(8, 60)),
+            float(yOrigin + rng.uniform(-9, 9))]
+
+    return [0, yPipette, xOrigin, yOrigin, [cell], width, height]
+
+def check_equivalence(rng, n = NUM_CHECKS):
+    """ Compare the vectorised and reference renders over random scenes,
+    drawing the vectorised renders into a reused frame.
+
+    Returns:
+        int: Number of frames with differing pixels.
+    """
+    mismatches = 0
+    frames = {size: np.zeros((size[1], size[0], 3), dtype = np.uint8)
+        for size in FRAME_SIZES}
+    for i in range(n):
+        width, height = FRAME_SIZES[i % len(FRAME_SIZES)]
+        args = random_scene(width, height, rng)
+        image = draw_frame(*args[:5], out = frames[(width, height)])
+        if(not np.array_equal(image, reference_draw_frame(*args))):
+            mismatches += 1
+
+    return mismatches
+
+def check_incremental(rng, n = NUM_SEQUENCES, steps = 20):
+    """ Compare incremental renders against full renders (draw_frame) over
+    random sequences of moves, with several cells.
+
+    Returns:
+        int, int: Number of frames with differing pixels, and frames with
+        pixels changed outside the reported regions.
+    """
+    mismatches = 0
+    unreported = 0
+    for i in range(n):
+        width, height = FRAME_SIZES[i % len(FRAME_SIZES)]
+        renderer = FrameRenderer(width, height)
+        args = random_scene(width, height, rng)
+        cells = [random_scene(width, height, rng)[4][0] for j in range(5)]
+        previous = np.zeros((height, width, 3), dtype = np.uint8)
+
+        for step in range(steps):
+            # Move a cell, or the pipette (as a G00 command)
+            if(rng.random() < 0.7):
+                cell = cells[int(rng.integers(len(cells)))]
+                cell[0] += float(rng.uniform(-5, 5))
+                cell[1] += float(rng.uniform(-5, 5))
+            else:
+                args[2] += int(rng.integers(-20, 20))
+
+            regions = renderer.render(*args[:4], cells)
+            image = renderer.image
+            if(not np.array_equal(image, draw_frame(*args[:4], cells, width,
+                height))):
+                mismatches += 1
+
+            # Pixels outside the reported regions must be unchanged
+            mask = np.ones((height, width), dtype = bool)
+            for x, y, w, h in regions:
+                mask[y:y + h, x:x + w] = False
+            if(np.any(np.any(image != previous, axis = 2) & mask)):
+                unreported += 1
+            previous = image.copy()
+
+    return mismatches, unreported
+
+def incremental_benchmark(rng):
+    """ Time full and incremental renders of a single moving cell, for each
+    frame size and number of cells.
+    """
+    print("Width,Height,Cells,Full (ms),Incremental (ms),Speedup")
+    for width, height in FRAME_SIZES:
+        for count in CELL_COUNTS:
+            cells = [[float(rng.uniform(0, width)),
+                float(rng.uniform(0, height))] for n in range(count)]
+            args = [0, [-pipetteModel['pipetteHeight'],
+                pipetteModel['pipetteHeight']], width//2, height//2]
+            frame = np.zeros((height, width, 3), dtype = np.uint8)
+            renderer = FrameRenderer(width, height)
+            renderer.render(*args, cells)
+
+            def move():
+                cells[0][0] = (cells[0][0] + 1) % width
+            full = timeit.timeit(lambda: (move(), draw_frame(*args, cells,
+                out = frame)), number = REPEATS)
+            incremental = timeit.timeit(lambda: (move(),
+                renderer.render(*args, cells)), number = REPEATS)
+            print("%d,%d,%d,%.3f,%.3f,%.1f"%(width, height, count,
+                1e3*full/REPEATS, 1e3*incremental/REPEATS, full/incremental))
+
+def update_benchmark(rng):
+    """ Compare sending the whole frame to the capture emulator with sending
+    the changed regions, for a single moving cell. Each update is pickled
+    and unpickled (as sent over the image queue) and applied by the capture
+    emulator, whose image must match the rendered frame.
+    """
+    print("Width,Height,Cells,Whole frame (bytes),Regions (bytes)," +
+        "Whole frame (ms),Regions (ms),Mismatched frames")
+    for width, height in FRAME_SIZES:
+        for count in CELL_COUNTS:
+            cells = [[float(rng.uniform(0, width)),
+                float(rng.uniform(0, height))] for n in range(count)]
+            args = [0, [-pipetteModel['pipetteHeight'],
+                pipetteModel['pipetteHeight']], width//2, height//2]
+            renderer = FrameRenderer(width, height)
+            capture = CaptureEmulator(None, None)
+            capture.update_image(renderer.frame_update(
+                renderer.render(*args, cells), -1))
+
+            sizes = [0, 0]
+            times = [0, 0]
+            mismatches = 0
+            for i in range(REPEATS):
+                cells[0][0] = (cells[0][0] + 1) % width
+                regions = renderer.render(*args, cells)
+
+                # Whole frame, as sent before the changed regions
+                start = time.perf_counter()
+                data = pickle.dumps((renderer.frameNumber,
+                    renderer.image.copy(), regions))
+                pickle.loads(data)
+                times[0] += time.perf_counter() - start
+                sizes[0] += len(data)
+
+                start = time.perf_counter()
+                data = pickle.dumps(renderer.frame_update(regions,
+                    capture.frameNumber))
+                capture.update_image(pickle.loads(data))
+                times[1] += time.perf_counter() - start
+                sizes[1] += len(data)
+                if(not np.array_equal(capture.image, renderer.image)):
+                    mismatches += 1
+
+            print("%d,%d,%d,%d,%d,%.3f,%.3f,%d"%(width, height, count,
+                sizes[0]/REPEATS, sizes[1]/REPEATS, 1e3*times[0]/REPEATS,
+                1e3*times[1]/REPEATS, mismatches))
+
+def render_benchmark():
+    """ Time the reference and vectorised renders at each frame size.
+    """
+    rng = np.random.default_rng(0)
+
+    print("Mismatched frames: %d"%(check_equivalence(rng)))
+    print("Mismatched incremental frames: %d, unreported changes: %d"%(
+        check_incremental(rng)))
+    print("Width,Height,Reference (ms),Vectorised (ms),Reused frame (ms)," +
+        "Speedup")
+
+    for width, height in FRAME_SIZES:
+        # Pipette across half the frame, with a cell ahead of it
+        args = [0, [-pipetteModel['pipetteHeight'],
+            pipetteModel['pipetteHeight']], width//2, height//2,
+            [[width*3/4, height//2]], width, height]
+        frame = np.zeros((height, width, 3), dtype = np.uint8)
+
+        reference = timeit.timeit(lambda: reference_draw_frame(*args),
+            number = REPEATS)
+        vectorised = timeit.timeit(lambda: draw_frame(*args), number = REPEATS)
+        reused = timeit.timeit(lambda: draw_frame(*args[:5], out = frame),
+            number = REPEATS)
+        print("%d,%d,%.3f,%.3f,%.3f,%.1f"%(width, height,
+            1e3*reference/REPEATS, 1e3*vectorised/REPEATS, 1e3*reused/REPEATS,
+            reference/reused))
+
+    incremental_benchmark(rng)
+    update_benchmark(rng)
+
+if __name__ == "__main__":
+    render_benchmark()
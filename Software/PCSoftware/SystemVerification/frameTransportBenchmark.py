@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+
+import numpy as np
+from multiprocessing import *
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ComputerVision.SoftwareDrivers.frame_buffer_driver import sharedFrameRing
+
+FRAME_SIZES = [(480, 640, 3), (750, 750, 3), (1080, 1920, 3), (2160, 3840, 3)]
+NUM_FRAMES = 200 # Number of frames transferred per measurement
+
+def producer_process(requestQueue, frameQueue, shape, shared):
+    """ Respond to each frame request with a frame, mirroring the computer
+    vision process answering requests from the GUI.
+
+    Args:
+        requestQueue (Queue): Queue of frame requests. None exits the process.
+        frameQueue (Queue): Queue to send frames (or frame headers) over.
+        shape (tuple): Shape of the frames to send.
+        shared (bool): True iff frames are sent through the shared ring.
+    """
+    frame = np.random.randint(0, 255, shape, dtype = np.uint8)
+    frameRing = sharedFrameRing()
+
+    while(1):
+        if(requestQueue.get() is None):
+            break
+
+        # Send the frame itself or only its header
+        if(shared):
+            frameQueue.put(frameRing.write(frame))
+        else:
+            frameQueue.put(frame)
+
+    frameRing.close(unlink = True)
+
+def measure_transport(shape, shared, n = NUM_FRAMES, copy = False):
+    """ Measure the request to frame latency of a frame transport.
+
+    Args:
+        shape (tuple): Shape of the frames to send.
+        shared (bool): True iff frames are sent through the shared ring.
+        n (int, optional): Number of frames to transfer.
+        copy (bool, optional): True iff frames read from the shared ring are
+        copied out of it (as before frames were read in place).
+
+    Returns:
+        float: Mean time per frame in milliseconds.
+    """
+    requestQueue = Queue()
+    frameQueue = Queue()
+    frameRing = sharedFrameRing()
+
+    producer = Process(target = producer_process,
+        args = (requestQueue, frameQueue, shape, shared))
+    producer.start()
+
+    # Warm up the transport (allocation and attaching of shared memory)
+    requestQueue.put(1)
+    message = frameQueue.get()
+    if(shared):
+        frameRing.read(message)
+
+    start = time.perf_counter()
+    for i in range(n):
+        requestQueue.put(1)
+        message = frameQueue.get()
+        frame = frameRing.read(message) if shared else message
+        if(copy):
+            frame = frame.copy()
+    elapsed = time.perf_counter() - start
+
+    requestQueue.put(None)
+    producer.join()
+    frameRing.close()
+
+    return 1000 * elapsed / n
+
+def frame_transport_benchmark(n = NUM_FRAMES):
+    """ Compare the pipe (pickled frame) and shared memory ring transports
+    over a range of frame sizes, with frames copied out of the ring and read
+    in place.
+
+    Args:
+        n (int, optional): Number of frames transferred per measurement.
+    """
+    print("Frame size,Pipe (ms/frame),Shared ring copied (ms/frame)," +
+        "Shared ring in place (ms/frame),Speedup")
+    for shape in FRAME_SIZES:
+        pipe = measure_transport(shape, False, n)
+        copied = measure_transport(shape, True, n, copy = True)
+        shared = measure_transport(shape, True, n)
+        print("%dx%d,%.3f,%.3f,%.3f,%.1f"%(shape[1], shape[0], pipe, copied,
+            shared, pipe/shared))
+
+if __name__ == "__main__":
+    if (len(sys.argv) > 2) or ((len(sys.argv) == 2) and
+        (sys.argv[1] == "help")):
+        print("\nThis program compares the time to transfer a frame from " +
+            "the computer vision process to the GUI through a pipe and " +
+            "through the shared memory frame ring.\nProgram usage: python " +
+            "frameTransportBenchmark.py <num_frames>\n")
+    elif (len(sys.argv) == 2):
+        frame_transport_benchmark(int(sys.argv[1]))
+    else:
+        frame_transport_benchmark()
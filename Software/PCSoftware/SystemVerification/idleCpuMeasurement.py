@@ -0,0 +1,177 @@
+import os
+import sys
+import time
+import threading
+
+from multiprocessing import *
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from communicationChannels import *
+from sessionRecording import sessionRecorder
+from ComputerVision.image_processing_OS import imageProcesser
+from SerialCommunication.serial_os import serial_comm_process
+from SerialCommunication.SoftwareDrivers.ConfigFiles.settings import SERIAL_PORT
+from Emulator.emulator_os import *
+
+SETTLE_TIME = 2 # Seconds allowed for a process to start before measuring
+MEASURE_TIME = 5 # Seconds of idle CPU time measured per process
+NUM_REQUESTS = 200 # Number of requests per latency measurement
+
+class measurementContext():
+    """
+    Serial communication queues of the application context, without the
+    remainder of the application.
+    """
+    def __init__(self):
+        self.sOut = frameChannel("sOut")
+        self.sIn = Queue()
+        self.sDisp = Queue()
+        self.sComplete = Queue()
+        self.motionQ = Queue()
+        self.recorder = sessionRecorder(None)
+
+    def put_comm_success(self, state):
+        self.sComplete.put(state)
+
+def reference_poll_loop(*queues):
+    """ Synthetic busy polling loop over the queues of a process loop, used
+    as a reference idle CPU usage. It is written for this measurement and is
+    not the process loop before it waited on its channels, which also
+    did work between polls.
+
+    Args:
+        queues (Queue): Queues polled by the process loop.
+    """
+    while(1):
+        for queue in queues:
+            if(not queue.empty()):
+                queue.get()
+
+def measured_process(target, args, result):
+    """ Run a process loop while measuring its CPU usage over MEASURE_TIME
+    seconds (after SETTLE_TIME seconds).
+
+    Args:
+        target (function): Process loop to run.
+        args (tuple): Arguments of the process loop.
+        result (Queue): Queue to put the CPU usage (fraction of one core).
+    """
+    def measure():
+        time.sleep(SETTLE_TIME)
+        start = time.process_time()
+        time.sleep(MEASURE_TIME)
+        result.put((time.process_time() - start)/MEASURE_TIME)
+
+        # Flush the result before exiting the process loop
+        result.close()
+        result.join_thread()
+        os._exit(0)
+
+    threading.Thread(target = measure, daemon = True).start()
+    target(*args)
+
+def idle_cpu(target, args):
+    """ Measure the idle CPU usage of a process loop.
+
+    Returns:
+        float: CPU usage of the process (percent of one core).
+    """
+    result = Queue()
+    process = Process(target = measured_process,
+        args = (target, args, result))
+    process.start()
+    usage = result.get()
+    process.join()
+
+    return 100 * usage
+
+def echo_process(requestQueue, responseQueue, event_driven):
+    """ Respond to each request, either polling or waiting on the request
+    queue.
+    """
+    while(1):
+        if(event_driven):
+            wait_for_channels([requestQueue])
+        if(not requestQueue.empty()):
+            responseQueue.put(requestQueue.get())
+
+def request_latency(requestQueue, responseQueue, n = NUM_REQUESTS):
+    """ Measure the mean time from a request to its response.
+
+    Returns:
+        float: Mean request to response time in milliseconds.
+    """
+    # Allow the responding process to start
+    requestQueue.put(0)
+    responseQueue.get()
+
+    start = time.perf_counter()
+    for i in range(n):
+        requestQueue.put(0)
+        responseQueue.get()
+
+    return 1000 * (time.perf_counter() - start) / n
+
+def echo_latency(event_driven):
+    """ Measure the request to response time of a polling or waiting loop.
+    """
+    requestQueue = frameChannel("requestQueue")
+    responseQueue = Queue()
+    process = Process(target = echo_process,
+        args = (requestQueue, responseQueue, event_driven))
+    process.start()
+    latency = request_latency(requestQueue, responseQueue)
+    process.kill()
+    process.join()
+
+    return latency
+
+def vision_latency():
+    """ Measure the request to frame time of the computer vision process,
+    with frames rendered on request by the emulator.
+    """
+    pixQ, posQ, capSem = Queue(), frameChannel("posQ"), frameChannel("capSem")
+    commandQueue, imageQueue = frameChannel("commandQueue"), Queue()
+    emulator = Process(target = emulation_processer,
+        args = (commandQueue, imageQueue))
+    emulator.start()
+    process = Process(target = imageProcesser,
+        args = (pixQ, posQ, capSem, CaptureEmulator(imageQueue, commandQueue)))
+    process.start()
+    latency = request_latency(capSem, pixQ)
+    for child in (process, emulator):
+        child.kill()
+        child.join()
+
+    return latency
+
+def idle_cpu_measurement():
+    """ Report the idle CPU usage of each process loop waiting on its
+    channels, alongside a synthetic polling loop over the same queues as a
+    reference (not a measurement of the process loop before the change), and
+    the request to response latency of synthetic polling and waiting echo
+    loops.
+    """
+    context = measurementContext()
+    processes = [
+        ("Computer vision", (Queue(), Queue()), imageProcesser,
+            (Queue(), frameChannel("posQ"), frameChannel("capSem"),
+            CaptureEmulator(Queue(), Queue()))),
+        ("Serial communication", (context.sOut,), serial_comm_process,
+            (context, SERIAL_PORT, SerialEmulator(Queue()))),
+        ("Emulation", (Queue(),), emulation_processer,
+            (frameChannel("commandQueue"), Queue()))]
+
+    print("Process,Synthetic polling reference CPU (%),Waiting CPU (%)")
+    for name, polled, target, args in processes:
+        reference = idle_cpu(reference_poll_loop, polled)
+        waiting = idle_cpu(target, args)
+        print("%s,%.1f,%.1f"%(name, reference, waiting))
+
+    print("\nLoop,Request latency (ms)")
+    print("Synthetic polling echo,%.3f"%(echo_latency(False)))
+    print("Synthetic waiting echo,%.3f"%(echo_latency(True)))
+    print("Computer vision,%.3f"%(vision_latency()))
+
+if __name__ == "__main__":
+    idle_cpu_measurement()
@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ComputerVision.SoftwareDrivers.image_processing_driver import *
+
+CELL_COUNTS = [1, 5, 10, 25, 50] # Numbers of tracked cells to benchmark
+NUM_FRAMES = 50 # Number of frames timed per measurement
+FRAME_SIZE = 750 # Width and height of the synthetic frames
+CELL_RADIUS = 12 # Radius of the synthetic cells
+
+def cell_centres(n):
+    """ Initial centres of n synthetic cells, spread in a grid over the frame.
+
+    Returns:
+        List: [X, Y] centre of each cell.
+    """
+    columns = int(np.ceil(np.sqrt(n)))
+    spacing = FRAME_SIZE//(columns + 1)
+    return [[spacing*(1 + i % columns), spacing*(1 + i//columns)]
+        for i in range(n)]
+
+def synthetic_frame(centres, frame_count):
+    """ Draw the synthetic cells, each drifting slowly across the frame.
+
+    Returns:
+        numpy.ndarray: Frame containing the cells.
+    """
+    frame = np.full((FRAME_SIZE, FRAME_SIZE, 3), 40, dtype = np.uint8)
+    for n, (x, y) in enumerate(centres):
+        shift = int(2*frame_count*np.sin(n))
+        cv2.circle(frame, (x + shift, y), CELL_RADIUS, (200, 200, 200), -1)
+    return frame
+
+def measure_cells(n, workers):
+    """ Measure the time to update n Cell trackers in one frame.
+
+    Args:
+        n (int): Number of Cell trackers.
+        workers (int): Number of workers updating the Cell trackers.
+
+    Returns:
+        float, int: Time per frame (ms) and number of active Cell trackers
+        after the final frame.
+    """
+    manager = trackerManager()
+    manager.cellPool = ThreadPoolExecutor(max_workers = workers)
+    centres = cell_centres(n)
+
+    # Select every cell on the first frame
+    manager.update(synthetic_frame(centres, 0), 0)
+    for x, y in centres:
+        manager.init_cell_track_at([[x - 2*CELL_RADIUS, y - 2*CELL_RADIUS],
+            [4*CELL_RADIUS, 4*CELL_RADIUS]])
+
+    frames = [synthetic_frame(centres, i) for i in range(1, NUM_FRAMES + 1)]
+
+    start = time.perf_counter()
+    for frame in frames:
+        manager.img = frame
+        manager.frame = FrameContext(frame)
+        manager.remove_inactive_cells()
+        manager.update_cell_track()
+    elapsed = time.perf_counter() - start
+
+    return 1000*elapsed/NUM_FRAMES, len(manager.cell_states())
+
+def multi_cell_benchmark():
+    """ Compare Cell tracker updates on a single worker and on the worker
+    pool as the number of cells grows.
+    """
+    print("Cells,Active,Serial (ms/frame),Pool (ms/frame),Pool " +
+        "(us/cell),Speedup")
+    for n in CELL_COUNTS:
+        serial, active = measure_cells(n, 1)
+        pooled, active = measure_cells(n, CELL_TRACKER_WORKERS)
+        print("%d,%d,%.2f,%.2f,%.1f,%.1f"%(n, active, serial, pooled,
+            1000*pooled/n, serial/pooled))
+
+if __name__ == "__main__":
+    multi_cell_benchmark()
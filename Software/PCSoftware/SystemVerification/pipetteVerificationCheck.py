@@ -0,0 +1,75 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ComputerVision.SoftwareDrivers.image_processing_driver import *
+from Emulator.emulator_os import draw_frame
+from Emulator.SoftwareDrivers.ConfigFiles.config import pipetteModel
+
+NUM_FRAMES = 60 # Frames of each static sequence
+NOISE_SIGMA = 4 # Standard deviation of the pixel noise added to each frame
+EDGE_TOLERANCE = 2 # Pixels the verified pipette centreline may differ by
+SENSITIVITY = 20 # Edge threshold of pipette detection
+
+# Pipette tip X offset and origin of each static sequence
+SEQUENCES = [(0, 150, 300), (50, 200, 250), (120, 300, 200)]
+
+def static_sequence(xPip, xOrigin, yOrigin, rng, n = NUM_FRAMES):
+    """ Frames of a stationary pipette, differing only by pixel noise.
+
+    Args:
+        xPip (int): X-Position of the Micropipette tip (pixels)
+        xOrigin (int): Initial X-Position of the micropipette tip
+        yOrigin (int): Initial Y-Position of the micropipette tip
+        rng (numpy.random.Generator): Generator of the pixel noise.
+        n (int, optional): Number of frames.
+
+    Yields:
+        nd.array: Frame of the sequence.
+    """
+    yPipette = [-pipetteModel['pipetteHeight'], pipetteModel['pipetteHeight']]
+    frame = draw_frame(xPip, yPipette, xOrigin, yOrigin, []).astype(np.int16)
+    for i in range(n):
+        noisy = frame + rng.normal(0, NOISE_SIGMA, frame.shape)
+        yield np.clip(noisy, 0, 255).astype(np.uint8)
+
+def verification_check():
+    """ Track static sequences with the last detection verified on every
+    frame after the first, and with full detection on every frame. The
+    tracked pipette positions must match on every frame, and the verified
+    centreline must lie within EDGE_TOLERANCE pixels of the detected one.
+    """
+    rng = np.random.default_rng(0)
+    failures = 0
+
+    print("Sequence,Frames,Verified,Position mismatches,Max offset (px)")
+    for n, (xPip, xOrigin, yOrigin) in enumerate(SEQUENCES):
+        verifiedTracker = pipetteTracker()
+        fullTracker = pipetteTracker()
+        verified = mismatches = 0
+        maxOffset = 0
+
+        for i, frame in enumerate(static_sequence(xPip, xOrigin, yOrigin,
+            rng)):
+            verified += verifiedTracker.update_track(frame, SENSITIVITY,
+                verify = i > 0)
+            fullTracker.update_track(frame, SENSITIVITY)
+
+            if(verifiedTracker.get_track_range() !=
+                fullTracker.get_track_range()):
+                mismatches += 1
+            maxOffset = max(maxOffset, abs(verifiedTracker.mu_offset -
+                fullTracker.mu_offset))
+
+        print("%d,%d,%d,%d,%.1f"%(n, NUM_FRAMES, verified, mismatches,
+            maxOffset))
+        if((verified == 0) or mismatches or (maxOffset > EDGE_TOLERANCE)):
+            failures += 1
+
+    assert failures == 0, "%d sequences differ from full detection"%(failures)
+    print("> Verified positions match full detection")
+
+if __name__ == "__main__":
+    verification_check()
@@ -0,0 +1,193 @@
+import os
+import sys
+import time
+from math import *
+from os import listdir
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ComputerVision.SoftwareDrivers.image_processing_driver import *
+from Emulator.emulator_os import draw_frame
+from Emulator.SoftwareDrivers.ConfigFiles.config import pipetteModel
+
+PYRAMID_LEVELS = [0, 1, 2, 3] # Pyramid levels compared (0 is full resolution)
+SYNTHETIC_SCALES = [1, 2, 4] # Upscaling of synthetic frames (750px frames)
+SYNTHETIC_FRAMES = 60 # Number of synthetic frames per scale
+HEADER = "Video,Level,# Errors,# Frames,Average Distance,Time (ms/frame)," + \
+    "Speedup\n"
+
+def read_ground_truth(gt_filename):
+    """ Read a ground truth file of pipette tip positions. Each line holds
+    the X and Y position of the tip and the frame it is first valid for.
+
+    Args:
+        gt_filename (String): Ground truth filepath
+
+    Returns:
+        List: (X, Y, frame) tuples of the ground truth file.
+    """
+    positions = []
+    with open(gt_filename, "r") as gt:
+        for raw_line in gt:
+            line = raw_line.split(",")
+            if(len(line) == 3):
+                positions.append((int(line[0]), int(line[1]), int(line[2])))
+    return positions
+
+def ground_truth_at(positions, frame_count):
+    """ Get the ground truth tip position of a frame.
+
+    Returns:
+        int, int: X and Y position of the tip.
+    """
+    x, y, frame = positions[0]
+    for position in positions:
+        if(position[2] > frame_count):
+            break
+        x, y, frame = position
+    return x, y
+
+def measure_detection(frames, positions, level, dist_thresh, edge_thresh):
+    """ Run pipette detection at a pyramid level over a sequence of frames.
+
+    Args:
+        frames (iterable): Sequence of (frame number, frame).
+        positions (List): Ground truth (X, Y, frame) tuples.
+        level (int): Pyramid level to detect the pipette on.
+        dist_thresh (int): Distance from the ground truth counted as an error.
+        edge_thresh (int): Threshold required for an edge between pixels.
+
+    Returns:
+        int, int, float, float: Number of errors, number of frames, average
+        distance to the ground truth and detection time (ms/frame).
+    """
+    tracker = pipetteTracker()
+    tracker.pyramidLevels = level
+
+    errors = 0
+    frame_count = 0
+    total_dist = 0
+    elapsed = 0
+
+    for n, frame in frames:
+        start = time.perf_counter()
+        position = tracker.detect_position(FrameContext(frame), edge_thresh)
+        elapsed += time.perf_counter() - start
+        frame_count += 1
+
+        if position is None:
+            errors += 1
+            continue
+
+        gt_x, gt_y = ground_truth_at(positions, n)
+        dist = sqrt(pow(gt_x - position[0], 2) +
+            pow(gt_y - (position[1] + position[3]/2), 2))
+        total_dist += dist
+        if(dist_thresh <= dist):
+            errors += 1
+
+    return (errors, frame_count, total_dist/max(frame_count - errors, 1),
+        1000*elapsed/max(frame_count, 1))
+
+def video_frames(video_filepath):
+    """ Generator of the frames of a video file.
+    """
+    cap = cv2.VideoCapture(video_filepath)
+    n = 0
+    while(1):
+        ret, frame = cap.read()
+        if not ret:
+            break
+        n += 1
+        yield n, frame
+    cap.release()
+
+def synthetic_frames(scale, n = SYNTHETIC_FRAMES):
+    """ Generate emulated frames of a pipette moving across the frame,
+    upscaled to the requested resolution.
+
+    Returns:
+        List, List: (frame number, frame) tuples and ground truth positions.
+    """
+    frames = []
+    positions = []
+    yPipette = [-pipetteModel['pipetteHeight'], pipetteModel['pipetteHeight']]
+
+    for i in range(n):
+        xOrigin = 150 + 8*i
+        yOrigin = 300 + i
+        frame = draw_frame(0, yPipette, xOrigin, yOrigin, [])
+        frame = cv2.resize(frame, None, fx = scale, fy = scale,
+            interpolation = cv2.INTER_NEAREST)
+        frames.append((i + 1, frame))
+        positions.append((scale*xOrigin, scale*yOrigin, i + 1))
+
+    return frames, positions
+
+def report(name, results, output = None):
+    """ Print (and optionally write) the results of each pyramid level,
+    with the speedup relative to level 0.
+    """
+    baseline = results[0][1][3]
+    for level, (errors, frames, dist, ms) in results:
+        line = "%s,%d,%d,%d,%.1f,%.2f,%.1f\n"%(name, level, errors, frames,
+            dist, ms, baseline/ms)
+        print(line, end = "")
+        if output is not None:
+            output.write(line)
+
+def pyramid_benchmark(vid_filepath, gt_filepath, output_filepath,
+dist_thresh, edge_thresh):
+    """ Compare the speed and accuracy of pipette detection at each pyramid
+    level over a folder of videos and ground truth files, using the naming
+    convention of pipetteTrackGTResults.py (Video: <file_name>.mp4, Ground
+    Truth: <file_name>GT.txt).
+    """
+    gt_files = listdir(gt_filepath)
+    output = open(output_filepath, "w")
+    output.write(HEADER)
+
+    for video in listdir(vid_filepath):
+        filename = video.split(".")
+        if((len(filename) != 2) or
+            (filename[1] not in ["mov", "mp4", "avi"])):
+            continue
+        if filename[0] + "GT.txt" not in gt_files:
+            continue
+
+        print("Running pyramid benchmark on video %s..."%(filename[0]))
+        positions = read_ground_truth(gt_filepath + "/" + filename[0] +
+            "GT.txt")
+        results = [(level, measure_detection(
+            video_frames(vid_filepath + "/" + video), positions, level,
+            int(dist_thresh), int(edge_thresh))) for level in PYRAMID_LEVELS]
+        report(video, results, output)
+
+    output.close()
+
+def synthetic_benchmark(dist_thresh = 10, edge_thresh = 20):
+    """ Compare the speed and accuracy of pipette detection at each pyramid
+    level over emulated frames of increasing resolution.
+    """
+    print(HEADER, end = "")
+    for scale in SYNTHETIC_SCALES:
+        frames, positions = synthetic_frames(scale)
+        width = frames[0][1].shape[1]
+        results = [(level, measure_detection(frames, positions, level,
+            scale*dist_thresh, edge_thresh)) for level in PYRAMID_LEVELS]
+        report("Emulated %dpx"%(width), results)
+
+if __name__ == "__main__":
+    if (len(sys.argv) == 2) and (sys.argv[1] == "help"):
+        print("\nThis program compares the speed and accuracy of pipette " +
+            "detection on each pyramid level.\nProgram usage: python " +
+            "pyramidDetectionBenchmark.py <vid_dirpath> <gt_dirpath> " +
+            "<output_filepath> <dist_thresh> <edge_thresh>\nWithout " +
+            "arguments, emulated frames are used.\n")
+    elif (len(sys.argv) == 6):
+        pyramid_benchmark(sys.argv[1], sys.argv[2], sys.argv[3], sys.argv[4],
+            sys.argv[5])
+    else:
+        synthetic_benchmark()
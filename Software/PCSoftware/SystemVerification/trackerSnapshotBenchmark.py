@@ -0,0 +1,85 @@
+import os
+import sys
+import time
+import copy
+import pickle
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ComputerVision.SoftwareDrivers.image_processing_driver import *
+from Emulator.emulator_os import draw_frame
+from Emulator.SoftwareDrivers.ConfigFiles.config import pipetteModel
+
+NUM_FRAMES = 10000 # Number of frames serialised per measurement
+
+def tracked_manager():
+    """ Tracker manager with an active Pipette and Cell tracker on an
+    emulated frame.
+
+    Returns:
+        trackerManager: Tracker manager with active trackers.
+    """
+    manager = trackerManager()
+    yPipette = [-pipetteModel['pipetteHeight'], pipetteModel['pipetteHeight']]
+    frame = draw_frame(0, yPipette, 150, 300, [])
+    manager.update(frame, 20)
+    manager.init_cell_track_at([[400, 200], [60, 60]])
+    manager.update(frame, 20)
+    return manager
+
+def reference_to_basic(tracker):
+    """ Picklable copy of a tracker in the basicTracker class, as the
+    trackers were sent before tracker snapshots, used as the reference.
+    """
+    if(not hasattr(tracker, "MOSSETrack")):
+        return tracker
+
+    basic = copy.copy(tracker)
+    basic.MOSSETrack = None
+    basic.__class__ = basicTracker
+    return basic
+
+def measure_serialisation(trackers, n = NUM_FRAMES):
+    """ Measure the size and time to serialise a frame's trackers as they are
+    sent over the pixel queue.
+
+    Args:
+        trackers (function): Returns the trackers sent for one frame.
+        n (int, optional): Number of frames serialised.
+
+    Returns:
+        int, float, float: Bytes per frame, and time per frame (us) to
+        serialise and to deserialise.
+    """
+    data = pickle.dumps(trackers())
+
+    start = time.perf_counter()
+    for i in range(n):
+        data = pickle.dumps(trackers())
+    dumped = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(n):
+        pickle.loads(data)
+    loaded = time.perf_counter() - start
+
+    return len(data), 1e6*dumped/n, 1e6*loaded/n
+
+def snapshot_benchmark():
+    """ Compare sending copied trackers (toBasic) with sending tracker
+    snapshots, for the three trackers sent each frame.
+    """
+    manager = tracked_manager()
+    methods = [
+        ("toBasic", lambda: [reference_to_basic(manager.pipetteTracker),
+            reference_to_basic(manager.cellTracker),
+            reference_to_basic(manager.aspTracker)]),
+        ("snapshot", lambda: [manager.pipetteTracker.snapshot(),
+            manager.cellTracker.snapshot(0), manager.aspTracker.snapshot()])]
+
+    print("Method,Bytes/frame,Serialise (us/frame),Deserialise (us/frame)")
+    for name, trackers in methods:
+        size, dumped, loaded = measure_serialisation(trackers)
+        print("%s,%d,%.1f,%.1f"%(name, size, dumped, loaded))
+
+if __name__ == "__main__":
+    snapshot_benchmark()
@@ -0,0 +1,88 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ComputerVision.SoftwareDrivers.image_processing_driver import *
+from Emulator.emulator_os import draw_frame
+from Emulator.SoftwareDrivers.ConfigFiles.config import pipetteModel
+
+NUM_FRAMES = 120 # Frames of the scenario
+SENSITIVITY = 20 # Edge threshold of pipette detection
+
+# Initial [X, Y] position and per frame [X, Y] velocity of each cell. The
+# last cell leaves the frame, losing its tracker
+CELLS = [([450, 200], [1, 0]), ([550, 550], [-1, -1]), ([650, 400], [6, 0])]
+
+def scenario_frames(n = NUM_FRAMES):
+    """ Frames of an emulated scenario, with the pipette advancing and the
+    cells drifting.
+
+    Yields:
+        nd.array: Frame of the scenario.
+    """
+    yPipette = [-pipetteModel['pipetteHeight'], pipetteModel['pipetteHeight']]
+    for i in range(n):
+        cells = [[x + i*vx, y + i*vy] for (x, y), (vx, vy) in CELLS]
+        yield draw_frame(i, yPipette, 150, 300, cells)
+
+def tracker_states(track_manager):
+    """ Tracker outputs of the last frame, as sent to the User Interface.
+
+    Returns:
+        tuple: Encoded Pipette, primary Cell and Asp tracker snapshots, the
+        compact state of all Cell trackers and the tracker overlays.
+    """
+    img, trackers = track_manager.get_image_info()
+    return ([snapshot.encode() for snapshot in trackers[:3]],
+        trackers[3], trackers[4])
+
+def run_scenario(concurrent):
+    """ Track the scenario, selecting every cell on the first frame.
+
+    Args:
+        concurrent (bool): True iff independent tracker stages are run
+        concurrently.
+
+    Returns:
+        List: Tracker states of each frame.
+    """
+    track_manager = trackerManager()
+    track_manager.scheduler = stageScheduler(TRACKER_STAGE_WORKERS,
+        concurrent)
+
+    states = []
+    for i, frame in enumerate(scenario_frames()):
+        track_manager.update(frame, SENSITIVITY)
+        if(i == 0):
+            for (x, y), velocity in CELLS:
+                track_manager.init_cell_track_at([[x - 5, y - 20],
+                    [40, 40]])
+        states.append(tracker_states(track_manager))
+        track_manager.clear_frame_states()
+
+    return states
+
+def stages_check():
+    """ Compare the tracker states of each frame with the tracker stages run
+    concurrently and in order.
+    """
+    serial = run_scenario(False)
+    concurrent = run_scenario(True)
+
+    mismatches = []
+    for n, (a, b) in enumerate(zip(serial, concurrent)):
+        if((a[0] != b[0]) or (not np.array_equal(a[1], b[1],
+            equal_nan = True)) or (a[2] != b[2])):
+            mismatches.append(n + 1)
+
+    cells = [len(states[1]) for states in serial]
+    print("Frames,Cell trackers (first/last frame),Mismatched frames")
+    print("%d,%d/%d,%d"%(len(serial), cells[1], cells[-1], len(mismatches)))
+    assert not mismatches, "Tracker states differ from frame %d"%(
+        mismatches[0])
+    print("> Concurrent tracker stages match the serial pipeline")
+
+if __name__ == "__main__":
+    stages_check()
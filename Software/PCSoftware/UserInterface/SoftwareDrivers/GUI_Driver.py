@@ -7,11 +7,15 @@ from PyQt5.QtChart import *
 import sys
 import time
 from math import *
+from functools import partial
 
 from multiprocessing import *
 import numpy as np
 
 from SerialCommunication.SoftwareDrivers.gcode_driver import *
+from ComputerVision.SoftwareDrivers.frame_buffer_driver import sharedFrameRing
+from ComputerVision.SoftwareDrivers.profiling_driver import profile_summary
+from communicationChannels import wait_for_channels, channel_summary
 from systemInformation import *
 from settings import *
 from .ConfigFiles.config import *
@@ -274,12 +278,25 @@ class feedWidget(ControlWidget):
         self.configure = QCheckBox("Configure")
         self.buttonLayout.addWidget(self.configure, 0, 1)
 
+        # Initialise tracker overlay toggle
+        self.showOverlays = QCheckBox("Overlays")
+        self.showOverlays.setChecked(True)
+        self.buttonLayout.addWidget(self.showOverlays, 0, 0)
+
         # Initialise sensitivity setting
         self.sensitivityLabel = QLabel("Edge Threshold:")
         self.buttonLayout.addWidget(self.sensitivityLabel, 0, 2)
         self.sensitivity = QSpinBox()
         self.buttonLayout.addWidget(self.sensitivity, 0, 3)
 
+        # Initialise frame channel drop and overrun counters
+        self.channelLabel = QLabel()
+        self.buttonLayout.addWidget(self.channelLabel, 1, 0, 1, 4)
+
+        # Initialise vision stage timings (shown if profiling is enabled)
+        self.profileLabel = QLabel()
+        self.buttonLayout.addWidget(self.profileLabel, 2, 0, 1, 4)
+
         self.LmouseHeld = False
         self.configLine = False
 
@@ -306,6 +323,22 @@ class feedWidget(ControlWidget):
         """
         return int(self.sensitivity.value())
 
+    def set_channel_stats(self, stats):
+        """ Setter method for the displayed frame channel counters
+
+        Args:
+            stats (str): Summary of the frame channel counters
+        """
+        self.channelLabel.setText(stats)
+
+    def set_profile_stats(self, stats):
+        """ Setter method for the displayed vision stage timings
+
+        Args:
+            stats (dict): (count, p50, p95, p99) of each vision stage
+        """
+        self.profileLabel.setText(profile_summary(stats))
+
     def get_configure(self):
         """ Getter method for stae of configure checkbox
 
@@ -314,17 +347,39 @@ class feedWidget(ControlWidget):
         """
         return (self.configure.isChecked())
 
-    def update_image(self, image, scale):
+    def get_overlays(self):
+        """ Getter method for state of overlays checkbox
+
+        Returns:
+            bool: True iff the tracker overlays are shown. Otherwise, false.
+        """
+        return (self.showOverlays.isChecked())
+
+    def update_image(self, image, scale, overlays = None, valid = None):
         """ Update image displayed in the video feed.
 
         Args:
             image (numpy.ndarray): 2D array representing Grayscale image
             scale (double): Scaling of the image from original to display
-        """
-        # Create pixmap given the image array at appropriate scaling
+            overlays (List, optional): (name, [X, Y, W, H], (R, G, B))
+            overlay of each active tracker, in frame coordinates. Defaults
+            to None (no overlays).
+            valid (function, optional): Returns True iff the image is still
+            valid once converted (the image may be a view of a shared frame
+            slot, overwritten by the computer vision process). The update is
+            dropped otherwise. Defaults to None (always valid).
+        """
+        if(overlays is None):
+            overlays = []
+
+        # Create pixmap given the image array at appropriate scaling, keeping
+        # the displayed pixmap if the image was overwritten during conversion
         height, width = image.shape[:2]
+        pix = cvtopixmap(image, [width, height], scale)
+        if((valid is not None) and (not valid())):
+            return
         self.scale = scale
-        self.pix = cvtopixmap(image, [width, height], self.scale)
+        self.pix = pix
         PIXEL_PER_MICRON = self.getConfigLength()
         
         # Initialise painter font and colour
@@ -357,6 +412,14 @@ class feedWidget(ControlWidget):
 
         self.time = time.time()
 
+        # If enabled, draw the tracker overlays
+        if(self.get_overlays()):
+            painter.setBrush(Qt.NoBrush)
+            for name, (x, y, w, h), colour in overlays:
+                painter.setPen(QPen(QColor(*colour), 3))
+                painter.drawRect(QRectF(x*scale, y*scale, w*scale, h*scale))
+                painter.drawText(QPointF((x + w)*scale, y*scale), name)
+
         # If cell position exists, draw the cell
         if(self.cellPos[1].x() != -1 and self.cellPos[1].y() != -1):
             painter.setBrush(QColor(128, 128, 255, 128))
@@ -871,15 +934,19 @@ class feedObj(containerObj):
         """
         containerObj.__init__(self, n, names, parentIdx, childIdx, feedWidget)
 
-    def update_feed(self, childIdx, img, scale):
+    def update_feed(self, childIdx, img, scale, overlays = None,
+    valid = None):
         """ Update the image displayed in a child feed widget
 
         Args:
             childIdx (int): Index of child widget to update
             img (numpy.ndarray): 2D array representing grayscale image
             scale (double): Scale of image to display
+            overlays (List, optional): Tracker overlays to draw on the image
+            valid (function, optional): Returns True iff the image is still
+            valid once converted
         """
-        self.widgets[childIdx].update_image(img, scale)
+        self.widgets[childIdx].update_image(img, scale, overlays, valid)
 
     def pixel_to_micron(self, childIdx):
         """ Conversion from pixel to micron distance for a given feed widget.
@@ -937,7 +1004,8 @@ class videoFeed(QThread):
     Args:
         QThread: Inheret behaviour from QThread class.
     """
-    def __init__(self, pixQ, capSem, feedWidget, updateSystem):
+    def __init__(self, pixQ, capSem, feedWidget, updateSystem,
+    updateProfile = None):
         QThread.__init__(self)
 
         # Initialise variables and states
@@ -946,6 +1014,10 @@ class videoFeed(QThread):
         self.feedWidget = feedWidget
         self.abort = False
         self.updateSystem = updateSystem
+        self.updateProfile = updateProfile
+
+        # Shared memory ring the computer vision process writes frames to
+        self.frameRing = sharedFrameRing()
 
     def run(self):
         """ Processing loop for videoFeed thread. 
@@ -956,15 +1028,28 @@ class videoFeed(QThread):
         # While not leaving thread
         while(not self.abort):
             # Wait for 40 ms between frame requests
-            if(abs(time.time()*1000 - t) >= 40):
-                t = time.time()*1000
-                self.capSem.put((self.feedWidget.get_sensitivity()))
-                while(1):
-                    if(not self.pixQ.empty()):
-                        img, trackers = self.pixQ.get()
-                        self.updateSystem.emit(img, trackers[0], 
-                        trackers[1], trackers[2])
-                        break
+            time.sleep(max(t + 40 - time.time()*1000, 0)/1000)
+            t = time.time()*1000
+            self.capSem.put((self.feedWidget.get_sensitivity()))
+
+            # Block until the requested frame arrives
+            while(not self.abort):
+                if(wait_for_channels([self.pixQ])):
+                    header, trackers = self.pixQ.get()
+                    # View the frame in shared memory, frames overwritten
+                    # before being read are dropped. The frame is checked
+                    # again once the GUI has converted it
+                    img = self.frameRing.read(header)
+                    if(img is not None):
+                        self.updateSystem.emit(img, trackers[0],
+                        trackers[1], trackers[2], trackers[3], trackers[4],
+                        partial(self.frameRing.valid, header))
+
+                    # Vision stage timings arrive periodically
+                    if((trackers[5] is not None) and
+                        (self.updateProfile is not None)):
+                        self.updateProfile.emit(trackers[5])
+                    break
 
 
 def cvtopixmap(img, dim, scale):
@@ -1097,15 +1182,18 @@ class AppView(QMainWindow):
         """
         self.feedContainer = feedContainer
 
-    def update_view(self, img, scale):
+    def update_view(self, img, scale, overlays = None, valid = None):
         """
         Update feed widget view.
 
         Args:
             img (QPixMap): Image to update displayed to the user.
             scale (int): Scaling of the image.
+            overlays (List, optional): Tracker overlays to draw on the image.
+            valid (function, optional): Returns True iff the image is still
+            valid once converted.
         """
-        self.feedContainer.update_feed(0, img, scale)
+        self.feedContainer.update_feed(0, img, scale, overlays, valid)
 
 
 class AppController(QWidget):
@@ -1114,8 +1202,10 @@ class AppController(QWidget):
     input and current state of the system.
     """
     # Signal to update of the system in the tracker thread
-    updateSystem = pyqtSignal(np.ndarray, basicTracker, 
-        basicTracker, basicTracker)
+    updateSystem = pyqtSignal(np.ndarray, trackerSnapshot,
+        trackerSnapshot, trackerSnapshot, np.ndarray, list, object)
+    # Signal to update the vision stage timings
+    updateProfile = pyqtSignal(dict)
     # Signal to appraoch the cell
     approachCellSignal = pyqtSignal()
     # Signal to control system
@@ -1174,9 +1264,12 @@ class AppController(QWidget):
         
         # Update system for video feed
         self.updateSystem.connect(self.update)
+        self.updateProfile.connect(
+            FeedContainer1.get_child_widget(0).set_profile_stats)
         VidFeed1 = videoFeed(
             context.pixQ, context.capSem, 
-            FeedContainer1.get_child_widget(0), self.updateSystem)
+            FeedContainer1.get_child_widget(0), self.updateSystem,
+            self.updateProfile)
         
         # Initialise Video Feed
         VidFeed1.start()
@@ -1228,6 +1321,7 @@ class AppController(QWidget):
         self.view.show()
 
         self.context = context
+        self.channelUpdateTime = time.time()
 
     def reset_pressure(self):
         """
@@ -1236,15 +1330,20 @@ class AppController(QWidget):
         self.pumpWidgets.get_child_widget(0).set_value(0)
         self.synchronise_state()
 
-    def update(self, img, pipetteTracker, cellTracker, aspTracker):
+    def update(self, img, pipetteTracker, cellTracker, aspTracker, cells,
+    overlays, valid = None):
         """
         Update tracker states.
 
         Args:
             img (nd.array): Updated image to display in video feed.
-            pipetteTracker (basicTracker): Updated pipette tracker
-            cellTracker (basicTracker): Update cell tracker
-            aspTracker (basicTracker): Update aspiration tracker
+            pipetteTracker (trackerSnapshot): Updated pipette tracker
+            cellTracker (trackerSnapshot): Update cell tracker
+            aspTracker (trackerSnapshot): Update aspiration tracker
+            cells (nd.array): Compact state of all cell trackers
+            overlays (List): Overlays of the active trackers
+            valid (function, optional): Returns True iff the image (a view of
+            a shared frame slot) is still valid once converted
         """
 
         # If the Cell tracker has been lost
@@ -1253,15 +1352,23 @@ class AppController(QWidget):
 
         # Set trackers in system information
         self.systemInfo.set_trackers(pipetteTracker, cellTracker, aspTracker)
+        self.systemInfo.set_cell_states(cells)
         
         # Update trackers in control processing
         self.controlProcessor.systemUpdateSignal.emit(
             pipetteTracker, cellTracker, aspTracker, self.pendingComms)
 
         # Update view widget
-        self.view.update_view(img, self.scale)
+        self.view.update_view(img, self.scale, overlays, valid)
         self.update_data()
 
+        # Update the frame channel counters (once per second)
+        if(time.time() - self.channelUpdateTime >= 1):
+            self.channelUpdateTime = time.time()
+            self.feedWidgets.get_child_widget(0).set_channel_stats(
+                channel_summary([self.context.pixQ, self.context.capSem,
+                self.context.captureQueue]))
+
         # Set communication state
         if(self.context.get_comm_success() is not None):
             self.pendingComms = False
@@ -1437,8 +1544,8 @@ class controlWorker(QObject):
     # Signal requesting approaching cell
     approachingSignal = pyqtSignal()
     # Signal requesting system update
-    systemUpdateSignal = pyqtSignal(basicTracker, 
-            basicTracker, basicTracker, bool)
+    systemUpdateSignal = pyqtSignal(trackerSnapshot,
+            trackerSnapshot, trackerSnapshot, bool)
 
     def __init__(self, sDispQueue, commWidget):
         """
@@ -1530,9 +1637,11 @@ class controlWorker(QObject):
         """ Update system information for trackers and pending communications.
 
         Args:
-            pipetteTracker (basicTracker): Updated state of the pipette tracker
-            cellTracker (basicTracker): Updated state of the cell tracker
-            aspTracker (basicTracker): Updated state of the aspiration tracker
+            pipetteTracker (trackerSnapshot): Updated state of the pipette
+            tracker
+            cellTracker (trackerSnapshot): Updated state of the cell tracker
+            aspTracker (trackerSnapshot): Updated state of the aspiration
+            tracker
             pendingComms (bool): True iff communications currently pending
         """
         global cellStationaryCondition
@@ -6,6 +6,10 @@ from UserInterface.SoftwareDrivers.GUI_Driver import guiManagement
 from SerialCommunication.serial_os import initialise_serial_process
 from Emulator.emulator_os import \
 CaptureEmulator, SerialEmulator, initialise_emulation_process
+from Emulator.SoftwareDrivers.ConfigFiles.config import EMULATOR_CLOCK
+from communicationChannels import frameChannel
+from sessionRecording import sessionRecorder, replayCapture, replaySerial
+from settings import *
 from multiprocessing import Queue, Event
 
 def launch_application():
@@ -15,23 +19,30 @@ def launch_application():
     # Initialise application context object
     context = AppContext()
 
-    # Initialise emulation command queue (serial emulation)
-    commandQueue = Queue()
-    # Initialise emulation capture queue (capture emulation)
-    captureQueue = Queue()
-
-    # Initialise capture emulation instance
-    captureEmulator = CaptureEmulator(captureQueue)
-    # Initialise serial emulation instance
-    serialEmulator = SerialEmulator(commandQueue)
-
-    # Start emulation process
-    context.add_pid(initialise_emulation_process(commandQueue, captureQueue))
+    if(SESSION_REPLAY_PATH is not None):
+        # Replay a recorded session in place of the emulators
+        captureEmulator = replayCapture(SESSION_REPLAY_PATH)
+        serialEmulator = replaySerial(SESSION_REPLAY_PATH)
+    else:
+        # Initialise emulation command queue (serial emulation)
+        commandQueue = frameChannel("commandQueue")
+        # Initialise capture emulation instance (requesting frames over the
+        # command queue)
+        captureEmulator = CaptureEmulator(context.captureQueue, commandQueue,
+            EMULATOR_CLOCK == "STEPPED")
+        # Initialise serial emulation instance
+        serialEmulator = SerialEmulator(commandQueue)
+
+        # Start emulation process
+        context.add_pid(initialise_emulation_process(commandQueue,
+                                                     context.captureQueue))
     # Start serial communication process
     context.add_pid(initialise_serial_process(context, serialEmulator))
     # Start computer vision process
     context.add_pid(initialise_computer_vision(context.pixQ, context.posQ,
-                                               context.capSem, captureEmulator))
+                                               context.capSem, captureEmulator,
+                                               context.motionQ,
+                                               context.recorder))
     # Start UI process
     guiManagement(context)
 
@@ -46,15 +57,22 @@ class AppContext(object):
         """
         # Computer vision communicators
         # Distribute images captured via the microscope
-        self.pixQ = Queue()
+        self.pixQ = frameChannel("pixQ", PIX_CHANNEL_POLICY)
         # Request image capture from computer vision process
-        self.capSem = Queue()
+        self.capSem = frameChannel("capSem", CAPTURE_REQUEST_CHANNEL_POLICY)
+        # Distribute emulated images (capture emulation), rendered on
+        # request so a single frame is ever in flight
+        self.captureQueue = frameChannel("captureQueue",
+                                         CAPTURE_CHANNEL_POLICY, 1)
         # Distribute user input to the computer vision process
-        self.posQ = Queue()
+        self.posQ = frameChannel("posQ")
+        # Distribute expected completion of motion commands to the computer
+        # vision process
+        self.motionQ = Queue()
 
         # Serial communication communicators
         # Distribute G-Code segments to be transmitted
-        self.sOut = Queue()
+        self.sOut = frameChannel("sOut")
         # Distribute recieved segments
         self.sIn = Queue()
         # Distribute human readable serial comms strings to display to the user
@@ -62,6 +80,9 @@ class AppContext(object):
         # Semaphore to communicate serial communication completion
         self.sComplete = Queue()
 
+        # Recorder of the session (disabled unless a path is set)
+        self.recorder = sessionRecorder(SESSION_RECORD_PATH)
+
         # Event, triggered when the user exits the GUI
         self.kill = Event()
 
@@ -100,7 +121,7 @@ class AppContext(object):
         """ End the program by sending signal to exit all registered process'
         """
         for p in self.pid:
-            os.kill(p, signal.SIGKILL)
+            os.kill(p, signal.SIGTERM)
 
 if __name__ == "__main__":
     launch_application()
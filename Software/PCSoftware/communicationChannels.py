@@ -0,0 +1,224 @@
+import time
+import queue
+from multiprocessing import Queue, Array, Pipe, Lock
+from multiprocessing.connection import wait
+from settings import *
+
+# Delivery policies of frame channels
+CHANNEL_POLICIES = ("FIFO", "LATEST", "DROP_OLDEST")
+
+# Counters maintained by each frame channel
+CHANNEL_COUNTERS = ("sent", "received", "delivered", "dropped", "overruns")
+
+class frameChannel():
+    """
+    Queue between process' with a delivery policy. FIFO delivers every item
+    in order, LATEST delivers only the newest item and DROP_OLDEST delivers
+    in order but delivers at most the newest maxsize items, dropping the
+    oldest. Items are dropped by the producer as it sends, so a channel
+    never holds more than maxsize items (LATEST and DROP_OLDEST) however far
+    behind the consumer is. Dropped items and overruns (items sent while the
+    consumer is maxsize or more items behind) are counted in shared memory,
+    visible to every process.
+
+    Every item is announced by a token on a pipe owned by the channel, sent
+    before the item is queued and received as the item is taken, so the
+    channel can be waited on (the pipe holds a token iff an item is
+    outstanding). Items are queued and taken under the channel lock, so the
+    number of tokens is the number of items held.
+    """
+    def __init__(self, name, policy = "FIFO", maxsize = FRAME_CHANNEL_MAXSIZE):
+        """
+        Initialise the channel.
+
+        Args:
+            name (str): Name of the channel, used when reporting.
+            policy (str, optional): Delivery policy. Defaults to "FIFO".
+            maxsize (int, optional): Maximum number of items held by the
+            channel before the oldest items are dropped (DROP_OLDEST) or
+            sends are counted as overruns (FIFO).
+        """
+        if(policy not in CHANNEL_POLICIES):
+            raise ValueError("Invalid channel policy %s. Expected one of %s."%(
+                repr(policy), ", ".join(CHANNEL_POLICIES)))
+
+        self.name = name
+        self.policy = policy
+        self.maxsize = 1 if (policy == "LATEST") else maxsize
+
+        self.queue = Queue()
+        self.reader, self.writer = Pipe(duplex = False)
+        self.lock = Lock()
+        self.counters = Array('q', len(CHANNEL_COUNTERS))
+
+    def count(self, counter, n = 1):
+        """
+        Increment one of the shared channel counters.
+
+        Args:
+            counter (str): Name of the counter.
+            n (int, optional): Increment. Defaults to 1.
+        """
+        with self.counters.get_lock():
+            self.counters[CHANNEL_COUNTERS.index(counter)] += n
+
+    def get_stats(self):
+        """
+        Getter method for the channel counters.
+
+        Returns:
+            dict: Counters of the channel, and the number of items waiting to
+            be delivered (backlog).
+        """
+        with self.counters.get_lock():
+            stats = dict(zip(CHANNEL_COUNTERS, self.counters[:]))
+        stats['backlog'] = (stats['sent'] - stats['delivered']
+            - stats['dropped'])
+        return stats
+
+    def put(self, item):
+        """
+        Send an item over the channel (producer side). If the channel holds
+        maxsize items, the oldest items are dropped first (LATEST and
+        DROP_OLDEST), so sending never waits on the consumer.
+
+        Args:
+            item (object): Picklable item to send.
+        """
+        with self.lock:
+            held = self.get_stats()['backlog']
+            if(held >= self.maxsize):
+                self.count('overruns')
+
+            # Drop the oldest items to make room for the new item
+            if(self.policy != "FIFO"):
+                for n in range(held - self.maxsize + 1):
+                    self.take()
+                    self.count('dropped')
+
+            # Announce the item before queueing it, so a queued item always
+            # has its token in the pipe
+            self.count('sent')
+            self.writer.send_bytes(b"\0")
+            self.queue.put(item)
+
+    def take(self):
+        """
+        Take the oldest item from the channel, with the channel lock held and
+        at least one item held. The item may still be in transit to the
+        queue, but is known to arrive since its token was sent.
+
+        Returns:
+            object: The item taken.
+        """
+        item = self.queue.get()
+        self.reader.recv_bytes()
+        self.count('received')
+        return item
+
+    def get(self, block = True, timeout = None):
+        """
+        Get the oldest item held by the channel (consumer side). Items
+        beyond the bound were already dropped by the producer.
+
+        Args:
+            block (bool, optional): Block until an item is available.
+            timeout (float, optional): Maximum time to block for.
+
+        Raises:
+            queue.Empty: No item became available.
+
+        Returns:
+            object: The delivered item.
+        """
+        deadline = None if (timeout is None) else time.time() + timeout
+        while(True):
+            # Wait for a token without the lock, so producers can send
+            if(block):
+                remaining = None if (deadline is None) else \
+                    max(deadline - time.time(), 0)
+                self.reader.poll(remaining)
+
+            # The item may have been dropped by a producer since the token
+            # arrived, check again with the lock held
+            with self.lock:
+                if(self.reader.poll()):
+                    item = self.take()
+                    self.count('delivered')
+                    return item
+
+            if((not block) or ((deadline is not None) and
+                (time.time() >= deadline))):
+                raise queue.Empty
+
+    def empty(self):
+        """
+        Check if the channel has no item to deliver.
+
+        Returns:
+            bool: True iff no item is available. Otherwise, False.
+        """
+        return not self.reader.poll()
+
+    def summary(self):
+        """
+        Human readable summary of the channel counters.
+
+        Returns:
+            str: Summary of the channel counters.
+        """
+        stats = self.get_stats()
+        return "%s (%s): %d dropped, %d overruns, %d behind"%(self.name,
+            self.policy, stats['dropped'], stats['overruns'],
+            stats['backlog'])
+
+def channel_summary(channels):
+    """ Human readable summary of the counters of several channels.
+
+    Args:
+        channels (List): Channels to summarise. Plain Queues are ignored.
+
+    Returns:
+        str: Summary of the channel counters.
+    """
+    return "; ".join([channel.summary() for channel in channels
+        if isinstance(channel, frameChannel)])
+
+def channel_waitable(channel):
+    """ Get the object to wait on for a communication channel.
+
+    Args:
+        channel (frameChannel or object): Frame channel or any object
+        providing a fileno method (e.g. a serial device).
+
+    Returns:
+        object: Object accepted by multiprocessing.connection.wait
+    """
+    # Frame channels become readable once their pipe holds a token
+    if(isinstance(channel, frameChannel)):
+        return channel.reader
+    return channel
+
+def wait_for_channels(channels, timeout = CHANNEL_WAIT_TIMEOUT):
+    """ Block until at least one channel has pending contents, or the timeout
+    expires. Replaces polling channels with empty() in a busy loop.
+
+    Args:
+        channels (List): Frame channels (or objects providing fileno) to
+        wait on.
+        timeout (float, optional): Maximum time to wait in seconds. None
+        waits indefinitely. Defaults to CHANNEL_WAIT_TIMEOUT.
+
+    Returns:
+        List: Channels with pending contents. Empty if the timeout expired.
+    """
+    waitables = [channel_waitable(channel) for channel in channels]
+
+    # Nothing to wait on, wait out the timeout
+    if(not waitables):
+        wait([], timeout)
+        return []
+
+    ready = wait(waitables, timeout)
+    return [channel for channel, waitable in zip(channels, waitables)
+        if waitable in ready]
@@ -0,0 +1,285 @@
+import os
+import time
+import pickle
+import struct
+from multiprocessing import Lock
+from settings import *
+
+# Header of each record: length of the pickled payload that follows,
+# monotonic timestamp and kind of the record
+RECORD_HEADER = struct.Struct("<Qd8s")
+
+class sessionRecorder():
+    """
+    Records the frames, commands, serial traffic and tracker outputs of a
+    session to an append-only file. Each record is a header (payload length,
+    monotonic timestamp and kind) followed by the pickled payload. The
+    recorder is shared by the application processes, a lock keeps their
+    records whole. When disabled, recording costs a single attribute check.
+    """
+    def __init__(self, path = SESSION_RECORD_PATH):
+        """
+        Initialise the recorder.
+
+        Args:
+            path (str, optional): Path of the session file, appended to.
+            None disables recording.
+        """
+        self.path = path
+        self.enabled = path is not None
+        self.lock = Lock()
+
+        # File of the current process, opened on its first record
+        self.file = None
+        self.pid = None
+
+    def __getstate__(self):
+        """
+        Pickle the recorder without the file of the current process (each
+        process opens the file itself).
+        """
+        state = dict(self.__dict__)
+        state['file'] = None
+        state['pid'] = None
+        return state
+
+    def record(self, kind, payload):
+        """
+        Append a record to the session file.
+
+        Args:
+            kind (str): Kind of the record (e.g. "frame" or "command"), at
+            most 8 characters.
+            payload (object): Picklable contents of the record.
+        """
+        if(not self.enabled):
+            return
+
+        data = pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            if(self.pid != os.getpid()):
+                self.file = open(self.path, "ab")
+                self.pid = os.getpid()
+
+            # Timestamped under the lock, so records are in timestamp order
+            self.file.write(RECORD_HEADER.pack(len(data), time.monotonic(),
+                kind.encode()) + data)
+            self.file.flush()
+
+def read_session(path, kinds = None):
+    """ Read the records of a session file in order. Payloads of other kinds
+    are skipped without being unpickled. A record truncated by an
+    interrupted session ends the file.
+
+    Args:
+        path (str): Path of the session file.
+        kinds (tuple, optional): Kinds of record to read. Defaults to None
+        (every record).
+
+    Yields:
+        float, str, object: Timestamp, kind and payload of each record.
+    """
+    with open(path, "rb") as session:
+        while(True):
+            header = session.read(RECORD_HEADER.size)
+            if(len(header) < RECORD_HEADER.size):
+                return
+            length, timestamp, kind = RECORD_HEADER.unpack(header)
+            kind = kind.rstrip(b"\0").decode()
+
+            if((kinds is not None) and (kind not in kinds)):
+                session.seek(length, os.SEEK_CUR)
+                continue
+
+            data = session.read(length)
+            if(len(data) < length):
+                return
+            yield timestamp, kind, pickle.loads(data)
+
+class sessionPacer():
+    """
+    Paces replayed records to their recorded timestamps, scaled by a speed.
+    """
+    def __init__(self, speed = SESSION_REPLAY_SPEED):
+        """
+        Initialise the pacer.
+
+        Args:
+            speed (float, optional): Replay speed (1 for real time). None
+            replays as fast as possible.
+        """
+        self.speed = speed
+        self.start = None
+
+    def wait(self, timestamp):
+        """
+        Block until a record is due.
+
+        Args:
+            timestamp (float): Recorded timestamp of the record.
+        """
+        if(self.speed is None):
+            return
+        if(self.start is None):
+            self.start = (time.monotonic(), timestamp)
+
+        due = self.start[0] + (timestamp - self.start[1])/self.speed
+        time.sleep(max(due - time.monotonic(), 0))
+
+class recordingSerial():
+    """
+    Serial device wrapper recording the packets written to and read from
+    the device (including acknowledgements).
+    """
+    def __init__(self, ser, recorder):
+        """
+        Initialise the wrapper.
+
+        Args:
+            ser (Serial): Serial device (or emulator) to wrap.
+            recorder (sessionRecorder): Recorder of the session.
+        """
+        self.ser = ser
+        self.recorder = recorder
+
+    def write(self, transmitted):
+        self.recorder.record("write", transmitted)
+        return self.ser.write(transmitted)
+
+    def readline(self):
+        packet = self.ser.readline()
+        self.recorder.record("read", packet)
+        return packet
+
+    def __getattr__(self, name):
+        # Remaining methods are those of the wrapped device
+        return getattr(self.ser, name)
+
+class replayCapture():
+    """
+    Capture device replaying the frames of a recorded session, in place of
+    the capture emulator.
+    """
+    def __init__(self, path, speed = SESSION_REPLAY_SPEED):
+        """
+        Initialise the capture.
+
+        Args:
+            path (str): Path of the session file.
+            speed (float, optional): Replay speed (1 for real time). None
+            replays as fast as possible.
+        """
+        self.path = path
+        self.pacer = sessionPacer(speed)
+        self.frames = None
+
+    def empty(self):
+        """
+        Declare empty method to reflect true Capture devices.
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    def read(self):
+        """
+        Read the next recorded frame.
+
+        Returns:
+            bool, nd.array: True iff a frame remained, and the frame.
+        """
+        # Records are read in the process reading the frames
+        if(self.frames is None):
+            self.frames = read_session(self.path, ("frame",))
+
+        for timestamp, kind, (frameTime, sensitivity, frame) in self.frames:
+            self.pacer.wait(timestamp)
+            return True, frame
+        return False, None
+
+class replaySerial():
+    """
+    Serial device replaying the packets read in a recorded session, in place
+    of the serial emulator. Each write is answered with the packets read
+    after the matching write of the recording, so acknowledgements (and
+    missing acknowledgements) follow the recording. Writes differing from
+    the recording are reported.
+    """
+    def __init__(self, path):
+        """
+        Initialise the device.
+
+        Args:
+            path (str): Path of the session file.
+        """
+        self.path = path
+        self.exchanges = None
+        self.pending = []
+        self.mismatches = 0
+
+    def load_exchanges(self):
+        """
+        Read the recorded serial traffic as exchanges of a write and the
+        packets read after it.
+
+        Returns:
+            List: [write, [packets read]] of each recorded write.
+        """
+        exchanges = []
+        for timestamp, kind, packet in read_session(self.path,
+            ("write", "read")):
+            if(kind == "write"):
+                exchanges.append([packet, []])
+            elif(exchanges):
+                exchanges[-1][1].append(packet)
+        return exchanges
+
+    def write(self, transmitted):
+        """
+        Write a packet, making the recorded response available.
+
+        Args:
+            transmitted (bytes): Encoded packet.
+
+        Returns:
+            int: 1, indicating successful transmission
+        """
+        # Traffic is read in the process writing to the device
+        if(self.exchanges is None):
+            self.exchanges = self.load_exchanges()
+
+        # Writes beyond the recording are left unanswered
+        recorded, self.pending = [None, []]
+        if(self.exchanges):
+            recorded, self.pending = self.exchanges.pop(0)
+
+        if(recorded != transmitted):
+            self.mismatches += 1
+            print("> Replay: wrote %s, recorded %s"%(repr(transmitted),
+                repr(recorded)))
+        return 1
+
+    def inWaiting(self):
+        """
+        Check if a recorded packet is waiting to be read.
+
+        Returns:
+            bool: True iff a packet is waiting. Otherwise, False.
+        """
+        return bool(self.pending)
+
+    def readline(self):
+        """
+        Read the next recorded packet.
+
+        Returns:
+            bytes: Encoded packet.
+        """
+        return self.pending.pop(0)
+
+    def close(self):
+        """
+        Close the device.
+        """
+        return
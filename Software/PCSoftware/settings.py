@@ -16,3 +16,20 @@ STEPS_PER_MICRON = STEPS_PER_REV/MICRON_PER_REV
 
 GRAVITY = 9.8
 
+CHANNEL_WAIT_TIMEOUT = 0.5
+
+FRAME_CHANNEL_MAXSIZE = 2
+
+PIX_CHANNEL_POLICY = "LATEST"
+
+CAPTURE_REQUEST_CHANNEL_POLICY = "LATEST"
+
+CAPTURE_CHANNEL_POLICY = "LATEST"
+
+CHANNEL_REPORT_INTERVAL = 10
+
+SESSION_RECORD_PATH = None
+
+SESSION_REPLAY_PATH = None
+
+SESSION_REPLAY_SPEED = 1
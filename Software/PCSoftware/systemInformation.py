@@ -1,10 +1,14 @@
 from math import *
 import cv2
-import copy
+import struct
 import numpy as np
 from settings import *
 import time
 from enum import Enum
+from ComputerVision.SoftwareDrivers.line_detection_driver import *
+from ComputerVision.SoftwareDrivers.frame_context_driver import *
+from ComputerVision.SoftwareDrivers.motion_prediction_driver import *
+from ComputerVision.SoftwareDrivers.profiling_driver import profiler
 
 class basic_track_state(Enum):
     """ Initialise valid states for all trackers
@@ -41,6 +45,23 @@ class basicTracker():
 
         self.mu_grad = 0
         self.mu_offset = 0
+        self.edgeSpread = None
+
+        # Band detection (edge detection around the last known edges)
+        self.bandDetection = False
+        self.bandMargin = 0
+        self.bandHit = False
+        self.bandStats = dict(frames = 0, attempts = 0, hits = 0)
+
+        # Motion prediction (search around the predicted track position,
+        # reacquiring lost tracks at the predicted position)
+        self.predictor = motionPredictor()
+        self.motionPrediction = False
+        self.predictionSigmas = 0
+        self.predictionMargin = 0
+        self.reacquireFrames = 0
+        self.predictionStats = dict(frames = 0, attempts = 0, hits = 0,
+            reacquired = 0)
 
         self.trackState = basic_track_state.NO_ACTIVE_TRACK
 
@@ -107,8 +128,9 @@ class basicTracker():
             self.lostTrack = False
         
         if(position is None):
-            # Clear the position and state of the tracker
+            # Clear the position, state and motion of the tracker
             self.trackPosition = [position, position]
+            self.predictor.reset()
             self.stationaryFrames = 0
             self.set_state(basic_track_state.NO_ACTIVE_TRACK)
             return
@@ -139,7 +161,8 @@ class basicTracker():
         """ Update Basic tracker position.
 
         Args:
-            img (numpy.ndarray): 3 by 2D array representing RGB image
+            img (FrameContext or numpy.ndarray): Frame context or 3 by 2D
+            array representing RGB image
             thresh (int): Threshold required for an edge between pixels
             startPos (int): Starting position for tracker search
             step (int): Step taken per one iteration
@@ -147,119 +170,324 @@ class basicTracker():
         Returns:
             list: Updated Basic Tracker position. None if no position is found.
         """
-        # Convert the frame to grayscale and display grayscale frame
-        gray_frame = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        # Get the grayscale frame (shared by all trackers this frame)
+        frame = frame_context(img)
+        gray_frame = frame.gray()
 
-        # Apply canny edge detection, display edge detected frame
-        cannyFrame = cv2.Canny(gray_frame, 20, 60)
+        # Find the top and bottom pipette edges
+        edges = self.find_edges(frame)
+        if edges is None:
+            return
+        mu_grad, mu_offset, min_offset, max_offset = edges
 
-        # Apply the Hough transform to the frame (finding prominent lines)
-        hough_lines = cv2.HoughLinesP(cannyFrame,1,np.pi/180, 50, None, 50, 5)
+        # Find the pipette tip along the centreline
+        with profiler.stage("tip scan"):
+            tipX = self.locate_predicted_tip(gray_frame, mu_grad, mu_offset,
+                thresh, startPos, step)
 
-        if hough_lines is None:
+        if(tipX is None):
             return
+        return [tipX, int(tipX * mu_grad + min_offset), 0, max_offset - min_offset]
 
-        # Iterate over the lines, noting the frequency of rho
-        lineAngles = dict()
-        for i in range(len(hough_lines)):
-            # Display the line in the hough frame
-            line = hough_lines[i][0]
+    def find_edges(self, frame, level = 0):
+        """ Find the top and bottom pipette edges, first in a band around the
+        last known edges then, failing that, over the full frame. The edge
+        lines found are stored as the trackers centreline.
 
-            if(line[2] - line[0] == 0):
-                continue
+        Args:
+            frame (FrameContext): Context of the current frame
+            level (int, optional): Pyramid level to detect the edge lines on.
+            Defaults to 0 (full resolution).
 
-            rho = str(round(float((line[3] - line[1])/(line[2] - line[0])),1))
+        Returns:
+            tuple: Gradient and offset of the pipette centreline, followed by
+            the offsets of the minimum and maximum edges (in frame
+            coordinates). None if no edges are found.
+        """
+        # Attempt to find the pipette edges in a band around the last known
+        # edges, falling back to the full frame
+        edgeLines = None
+        self.bandHit = False
+        self.bandStats['frames'] += 1
+        if(self.bandDetection and (self.edgeSpread is not None)):
+            self.bandStats['attempts'] += 1
+            edgeLines = self.detect_band_edge_lines(frame, level)
+            if(edgeLines is not None):
+                self.bandHit = True
+                self.bandStats['hits'] += 1
+
+        if(edgeLines is None):
+            edgeLines = self.detect_edge_lines(frame, 0,
+                frame.img.shape[0], level)
+
+        if edgeLines is None:
+            return
+        max_freq_angle, min_line, max_line = edgeLines
 
-            if rho in lineAngles.keys():
-                lineAngles[rho] = lineAngles[rho] + 1
-            else:
-                lineAngles[rho] = 1
+        # Create line functions that represent the top and bottom pipette edges
+        mu_grad = max_freq_angle
+        max_offset = max_line[3] - max_line[2] * mu_grad
+        min_offset = min_line[3] - min_line[2] * mu_grad
+        mu_offset = int((max_offset + min_offset)/2)
 
-        # Find the most frequent rho in the image
-        maxFrequency = -1
-        max_freq_angle = 0
-        for key in lineAngles.keys():
-            if(maxFrequency < lineAngles[key]):
-                maxFrequency = lineAngles[key]
-                max_freq_angle = float(key)
+        self.mu_grad = mu_grad
+        self.mu_offset = mu_offset
+        self.edgeSpread = max_offset - min_offset
 
-        # Find the max/min (Y coordinate) lines that have the most frequent angle
-        max_line = [None, None, None, None]
-        min_line = [None, None, None, None]
+        return mu_grad, mu_offset, min_offset, max_offset
 
-        for line in hough_lines:
-            line = line[0]
+    def detect_edge_lines(self, frame, top, bottom, level = 0):
+        """ Detect the pipette edge lines within a horizontal band of rows.
 
-            if(line[2] - line[0] == 0):
-                continue
+        Args:
+            frame (FrameContext): Context of the current frame
+            top (int): First row of the band
+            bottom (int): Row after the last row of the band
+            level (int, optional): Pyramid level to detect the edge lines on.
+            Defaults to 0 (full resolution).
 
-            rho = round(float((line[3] - line[1])/(line[2] - line[0])),1)
+        Returns:
+            tuple: Most frequent gradient, minimum and maximum edge line (in
+            frame coordinates). None if no edge lines are found.
+        """
+        # Apply canny edge detection to the band (at the pyramid level)
+        scale = 2**level
+        top = top//scale
+        cannyFrame = frame.canny(20, 60, top, -(-bottom//scale), level)
 
-            # Ensure the line matches the most frequent angle
-            if rho != max_freq_angle:
-                continue
+        # Apply the Hough transform to the frame (finding prominent lines).
+        # Line lengths and votes shrink with the pyramid level
+        with profiler.stage("hough"):
+            hough_lines = cv2.HoughLinesP(cannyFrame, 1, np.pi/180,
+                max(50//scale, 10), None, 50/scale, max(5/scale, 1))
 
-            maxY = max(line[1], line[3])
-            minY = min(line[1], line[3])
-            # Set to max line if greater Y than current maxline
-            if (None in max_line) or (max_line[1] < maxY):
-                max_line = line
+        if hough_lines is None:
+            return
+
+        # Shift the lines from band to frame coordinates
+        hough_lines = hough_lines.reshape(-1, 4)
+        hough_lines[:, [1, 3]] += top
+        hough_lines *= scale
 
-            # Set to min line if smaller Y than current minline
-            if (None in min_line) or (minY < min_line[1]):
-                min_line = line
+        # Find the most frequent line gradient and the pipette edge lines
+        return dominant_edge_lines(hough_lines)
+
+    def detect_band_edge_lines(self, frame, level = 0):
+        """ Detect the pipette edge lines only within a band around the last
+        known pipette edges (plus a margin). The result is rejected when the
+        detection is not consistent with the last known edges.
+
+        Args:
+            frame (FrameContext): Context of the current frame
+            level (int, optional): Pyramid level to detect the edge lines on.
+            Defaults to 0 (full resolution).
 
-        if (None in max_line) or (None in min_line):
+        Returns:
+            tuple: Most frequent gradient, minimum and maximum edge line (in
+            frame coordinates). None if the band detection failed.
+        """
+        height, width = frame.img.shape[:2]
+
+        # Rows covered by the last known edges across the frame width
+        centreY = [self.mu_offset, (width - 1) * self.mu_grad + self.mu_offset]
+        halfBand = abs(self.edgeSpread)/2 + self.bandMargin
+        top = max(int(min(centreY) - halfBand), 0)
+        bottom = min(int(max(centreY) + halfBand) + 1, height)
+
+        # Nothing to gain if the band covers the full frame
+        if((top == 0) and (bottom == height)):
             return
 
-        # Create line functions that represent the top and bottom pipette edges
-        mu_grad = max_freq_angle
-        max_offset = max_line[3] - max_line[2] * mu_grad
-        min_offset = min_line[3] - min_line[2] * mu_grad
-        mu_offset = int((max_offset + min_offset)/2)
+        edgeLines = self.detect_edge_lines(frame, top, bottom, level)
+        if(edgeLines is None):
+            return
+        mu_grad, min_line, max_line = edgeLines
 
-        self.mu_grad = mu_grad
-        self.mu_offset = mu_offset
+        # The gradient must not change by more than one bin
+        if(GRADIENT_BINS_PER_UNIT * abs(mu_grad - self.mu_grad) > 1.5):
+            return
 
-        # Iterate horizontally to find the pipette tip
-        tipX = None
-        x = startPos
-        COMP_DIST = 5
-        maxThresh = -1
-
-        while ((x + COMP_DIST) > 0) and ((x + COMP_DIST) < img.shape[1]):
-            x1 = x
-            x2 = x + COMP_DIST
-            y1 = x1 * mu_grad + mu_offset
-            y2 = x2 * mu_grad + mu_offset
-            if (y1 < 0) or (img.shape[0] <= y1):
-                x = x + step
-                continue
+        # Both edges must be found with a similar spread to the last edges
+        edgeSpread = ((max_line[3] - max_line[2] * mu_grad)
+            - (min_line[3] - min_line[2] * mu_grad))
+        if(abs(edgeSpread - self.edgeSpread) > self.bandMargin):
+            return
 
-            if (y2 < 0) or (img.shape[0] <= y2):
-                x = x + step
-                continue
+        return edgeLines
 
-            currentPixel = int(gray_frame[int(y1), x1])
-            compPixel = int(gray_frame[int(y2), x2])
-            
-            # If the edge is sufficient, this is the pipette tip
-            if(maxThresh < abs(currentPixel - compPixel)):
-                tipX = int(x + COMP_DIST/2)
-                maxThresh = abs(currentPixel - compPixel)
-
-                if(thresh < maxThresh):
-                    break
-            x = x + step
-        
-        if(tipX is None):
-            return 
-        return [tipX, int(tipX * mu_grad + min_offset), 0, max_offset - min_offset]
+    def get_band_stats(self):
+        """ Getter method for band detection statistics.
+
+        Returns:
+            dict: Number of frames, band attempts, band hits and the hit rate
+            (hits per frame) of band detection.
+        """
+        stats = dict(self.bandStats)
+        stats['hitRate'] = stats['hits']/max(stats['frames'], 1)
+        return stats
+
+    def locate_predicted_tip(self, gray_frame, mu_grad, mu_offset, thresh,
+    startPos, step, compDist = 5, stopPos = None, scale = 1):
+        """ Locate the pipette tip along the pipette centreline, first only
+        within the range the tip is predicted to be in. If no edge exceeds
+        the threshold within the range, the full centreline is searched.
+
+        Args:
+            gray_frame (numpy.ndarray): 2D array representing grayscale image
+            mu_grad (float): Gradient of the pipette centreline
+            mu_offset (int): Offset of the pipette centreline
+            thresh (int): Threshold required for an edge between pixels
+            startPos (int): Starting position for tracker search
+            step (int): Step taken per one iteration
+            compDist (int, optional): Distance between compared pixels
+            stopPos (int, optional): Position to end the search at. Defaults
+            to the frame border.
+            scale (int, optional): Downscaling of the frame (pyramid levels).
+            Defaults to 1.
+
+        Returns:
+            int: X coordinate of the pipette tip. None if no tip is found.
+        """
+        window = self.prediction_window(0)
+        if(window is not None):
+            self.predictionStats['attempts'] += 1
+            window = [window[0]//scale, -(-window[1]//scale)]
+
+            # Search the predicted range in the search direction
+            if(step > 0):
+                start, stop = max(window[0], startPos), window[1]
+                if(stopPos is not None):
+                    stop = min(stop, stopPos)
+            else:
+                start, stop = min(window[1], startPos), window[0]
+                if(stopPos is not None):
+                    stop = max(stop, stopPos)
+
+            tipX = self.locate_tip(gray_frame, mu_grad, mu_offset, thresh,
+                start, step, compDist, stop, requireEdge = True)
+            if(tipX is not None):
+                self.predictionStats['hits'] += 1
+                return tipX
+
+        return self.locate_tip(gray_frame, mu_grad, mu_offset, thresh,
+            startPos, step, compDist, stopPos)
+
+    def locate_tip(self, gray_frame, mu_grad, mu_offset, thresh, startPos,
+    step, compDist = 5, stopPos = None, requireEdge = False):
+        """ Locate the pipette tip along the pipette centreline. Every pixel
+        along the centreline is compared to the pixel compDist further along.
+        The tip is the first comparison exceeding the threshold or, if no
+        comparison exceeds it, the first strongest comparison.
+
+        Args:
+            gray_frame (numpy.ndarray): 2D array representing grayscale image
+            mu_grad (float): Gradient of the pipette centreline
+            mu_offset (int): Offset of the pipette centreline
+            thresh (int): Threshold required for an edge between pixels
+            startPos (int): Starting position for tracker search
+            step (int): Step taken per one iteration
+            compDist (int, optional): Distance between compared pixels
+            stopPos (int, optional): Position to end the search at. Defaults
+            to the frame border.
+            requireEdge (bool, optional): True iff a comparison must exceed
+            the threshold for a tip to be found. Defaults to False.
+
+        Returns:
+            int: X coordinate of the pipette tip. None if no tip is found.
+        """
+        height, width = gray_frame.shape[:2]
+
+        # X coordinates where both compared pixels lie within the frame width
+        if not (0 < startPos + compDist < width):
+            return
+        stop = width - compDist if step > 0 else -compDist
+        if(stopPos is not None):
+            stop = min(stop, stopPos) if step > 0 else max(stop, stopPos)
+        x1 = np.arange(startPos, stop, step)
+        x2 = x1 + compDist
+
+        # Keep only comparisons where both pixels lie within the frame height
+        y1 = x1 * mu_grad + mu_offset
+        y2 = x2 * mu_grad + mu_offset
+        valid = (0 <= y1) & (y1 < height) & (0 <= y2) & (y2 < height)
+
+        if not valid.any():
+            return
+
+        # Gather both pixel sets and compute the edge strength
+        x1 = x1[valid]
+        edgeStrength = np.abs(
+            gray_frame[y1[valid].astype(np.intp), x1].astype(np.int32)
+            - gray_frame[y2[valid].astype(np.intp), x2[valid]])
+
+        # Stop at the first edge exceeding the threshold, otherwise use the
+        # first maximum edge
+        exceeded = thresh < edgeStrength
+        if exceeded.any():
+            tip = np.argmax(exceeded)
+        elif requireEdge:
+            return
+        else:
+            tip = np.argmax(edgeStrength)
+
+        return int(x1[tip] + compDist/2)
 
     def kill_track(self):
         """ Kill the current track, clearning position and state.
         """
         self.trackPosition = [None, None]
+        self.predictor.reset()
+
+    def predict_motion(self):
+        """ Advance the motion prediction to the current frame. Called once
+        per frame before the track is searched for.
+        """
+        if(self.motionPrediction):
+            self.predictionStats['frames'] += 1
+            self.predictor.predict()
+
+    def correct_motion(self, position):
+        """ Correct the motion prediction with the position measured in the
+        current frame.
+
+        Args:
+            position (List): Measured position [X, Y, W, H]. None if the
+            track was not found.
+        """
+        if(not self.motionPrediction):
+            return
+        if(position is None):
+            self.predictor.miss()
+        else:
+            self.predictor.correct([position[0] + position[2]/2,
+                position[1] + position[3]/2])
+
+    def prediction_window(self, axis):
+        """ Range of the frame the track centre is predicted to be within.
+
+        Args:
+            axis (int): Axis of the range (0 for X, 1 for Y).
+
+        Returns:
+            List: [Start, end] of the range. None if no prediction is
+            available.
+        """
+        if(not self.motionPrediction):
+            return
+        return self.predictor.search_range(axis, self.predictionSigmas,
+            self.predictionMargin)
+
+    def get_prediction_stats(self):
+        """ Getter method for motion prediction statistics.
+
+        Returns:
+            dict: Number of frames, predicted searches, predicted searches
+            finding the track, reacquired tracks and the hit rate (hits per
+            predicted search) of motion prediction.
+        """
+        stats = dict(self.predictionStats)
+        stats['hitRate'] = stats['hits']/max(stats['attempts'], 1)
+        return stats
 
     def moving_track(self):
         """ Check if the Basic Tracker position has moved in previous 50 frames.
@@ -310,14 +538,20 @@ class basicTracker():
         changeY = pow(abs((pos[1] + pos[3]/2) - (currPos[1] + currPos[3]/2)), 2)
         return sqrt(changeX + changeY)
 
-    def toBasic(self):
-        """ Converts the tracker to a "BasicTracker" form.
+    def snapshot(self, trackId = -1):
+        """ Take an immutable snapshot of the tracker state, to pass to other
+        processes in place of the tracker.
+
+        Args:
+            trackId (int, optional): Identifier of the track (e.g. the Cell
+            ID). Defaults to -1.
 
         Returns:
-            BasicTracker: Copied instance of the tracker in the BasicTracker
-            class to ensure contents are picklable.
+            trackerSnapshot: Snapshot of the tracker state.
         """
-        return self
+        return trackerSnapshot(trackId, self.get_state(),
+            self.get_track_range(), self.moving_track(), self.lost_track(),
+            self.mu_grad, self.mu_offset, self.predictor.get_velocity())
 
 class MOSSETracker(basicTracker):
     """ MOSSE tracker used in accessing OpenCV MOSSE tracker library.
@@ -338,13 +572,16 @@ class MOSSETracker(basicTracker):
         box. 
 
         Args:
-            img (numpy.ndarray): 3 by 2D array representing RGB image
+            img (FrameContext or numpy.ndarray): Frame context or 3 by 2D
+            array representing RGB image
             boundBox (List): Bounding box in 2D space of the form [X, Y, W, H]
 
         Returns:
             bool: True iff an instance of the MOSSE tracker was sucessfully
             initialised.
         """
+        img = frame_context(img).img
+
         # Attempt to initialise MOSSE tracker
         for n in range(5):
             self.MOSSETrack = cv2.TrackerMOSSE_create()
@@ -379,23 +616,60 @@ class MOSSETracker(basicTracker):
         """ Update the current MOSSE tracker for a new frame.
 
         Args:
-            img (numpy.ndarray): 3 by 2D array representing RGB image
+            img (FrameContext or numpy.ndarray): Frame context or 3 by 2D
+            array representing RGB image
 
         Returns:
             bool: True iff the MOSSE tracker was successfully updated.
         """
         if(self.MOSSETrack is None):
             return
+        self.predict_motion()
+
         # Attempt to update the tracker
-        success, cellBox = self.MOSSETrack.update(img)
+        with profiler.stage("mosse"):
+            success, cellBox = self.MOSSETrack.update(frame_context(img).img)
+
+        # If not successful, attempt to reacquire at the predicted position
+        if((not success) and self.reacquire_mosse_track(img)):
+            return True
+
         # If not successful, clear position
         if(not success):
             self.set_track_position(None)
         else:
+            self.correct_motion(cellBox)
             self.set_track_position(cellBox)
         
         return success
 
+    def reacquire_mosse_track(self, img):
+        """ Reinitialise the MOSSE tracker at the predicted track position,
+        for at most reacquireFrames consecutive frames.
+
+        Args:
+            img (FrameContext or numpy.ndarray): Frame context or 3 by 2D
+            array representing RGB image
+
+        Returns:
+            bool: True iff the MOSSE tracker was reinitialised.
+        """
+        if((not self.motionPrediction) or (not self.predictor.ready()) or
+            (self.predictor.misses >= self.reacquireFrames) or
+            (not self.active_track())):
+            return False
+        self.predictor.miss()
+
+        # Centre the last bounding box on the predicted centre
+        centre = self.predictor.get_position()
+        w, h = int(self.trackPosition[2]), int(self.trackPosition[3])
+        if(not self.create_mosse_track(img,
+            (int(centre[0] - w/2), int(centre[1] - h/2), w, h))):
+            return False
+
+        self.predictionStats['reacquired'] += 1
+        return True
+
     def active_mosse_track(self):
         """ Getter method for the state of a trackers MOSSE tracker.
 
@@ -406,18 +680,157 @@ class MOSSETracker(basicTracker):
             return True
         return False
 
-    def toBasic(self):
-        """ Converts the tracker to a "BasicTracker" form.
+class trackerSnapshot():
+    """ Immutable snapshot of a tracker state for a single frame. Holds the
+    track position, state, moving and lost flags and pipette line parameters
+    in a fixed binary layout, which is all that is pickled.
+    """
+    __slots__ = ('trackId', 'state', 'position', 'moving', 'lost', 'mu_grad',
+        'mu_offset', 'velocity')
+
+    # Track ID, state code, moving, lost, [X, Y, W, H], gradient, offset and
+    # [VX, VY]
+    LAYOUT = struct.Struct("<iB??8d")
+
+    # Tracker states and their codes in the binary layout
+    STATES = (basic_track_state.NO_ACTIVE_TRACK,
+        basic_track_state.ACTIVE_TRACK, asp_track_state.ACTIVE_ASP_TRACK,
+        asp_track_state.ACTIVE_FULL_ASP_TRACK)
+
+    def __init__(self, trackId, state, position, moving, lost, mu_grad = 0,
+    mu_offset = 0, velocity = None):
+        """ Initialise the snapshot.
+
+        Args:
+            trackId (int): Identifier of the track, -1 if not applicable.
+            state (enum): Tracker state.
+            position (List): Track position [X, Y, W, H], unknown values are
+            None.
+            moving (bool): True iff the track is moving.
+            lost (bool): True iff the track was lost this frame.
+            mu_grad (float, optional): Gradient of the pipette line.
+            mu_offset (float, optional): Offset of the pipette line.
+            velocity (List, optional): Predicted velocity [VX, VY] of the
+            track centre (px/frame). None if not predicted.
+        """
+        position = tuple(position) + (None,)*(4 - len(position))
+        object.__setattr__(self, 'trackId', int(trackId))
+        object.__setattr__(self, 'state', state)
+        object.__setattr__(self, 'position', position)
+        object.__setattr__(self, 'moving', bool(moving))
+        object.__setattr__(self, 'lost', bool(lost))
+        object.__setattr__(self, 'mu_grad', float(mu_grad))
+        object.__setattr__(self, 'mu_offset', float(mu_offset))
+        object.__setattr__(self, 'velocity', None if velocity is None else
+            (float(velocity[0]), float(velocity[1])))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("trackerSnapshot is immutable")
+
+    def __reduce__(self):
+        return (trackerSnapshot.decode, (self.encode(),))
+
+    def encode(self):
+        """ Encode the snapshot in its binary layout.
+
+        Returns:
+            bytes: Encoded snapshot.
+        """
+        return self.LAYOUT.pack(self.trackId, self.STATES.index(self.state),
+            self.moving, self.lost, *[nan if p is None else p
+            for p in self.position], self.mu_grad, self.mu_offset,
+            *(self.velocity or (nan, nan)))
+
+    @classmethod
+    def decode(cls, data):
+        """ Decode a snapshot from its binary layout.
+
+        Args:
+            data (bytes): Encoded snapshot.
+
+        Returns:
+            trackerSnapshot: Decoded snapshot.
+        """
+        trackId, state, moving, lost, *values = cls.LAYOUT.unpack(data)
+        position = [None if isnan(p) else p for p in values[:4]]
+        velocity = None if isnan(values[6]) else values[6:8]
+        return cls(trackId, cls.STATES[state], position, moving, lost,
+            values[4], values[5], velocity)
+
+    def active_track(self):
+        """ Check if the tracker was active.
 
         Returns:
-            BasicTracker: Copied instance of the tracker in the BasicTracker
-            class to ensure contents are picklable.
+            bool: True iff the tracker was active. False otherwise.
         """
-        # Create copy that is picklable and return basicTracker
-        basic = copy.copy(self)
-        basic.MOSSETrack = None
-        basic.__class__ = basicTracker
-        return basic
+        return (self.position[0] is not None) and \
+            (self.position[1] is not None)
+
+    def get_state(self):
+        """ Getter method for the tracker state.
+
+        Returns:
+            enum: Tracker state
+        """
+        return self.state
+
+    def get_track_center(self):
+        """ Getter method for the track centre.
+
+        Returns:
+            list: Centre position of the tracker [X, Y].
+        """
+        return [int(self.position[0] + self.position[2]/2),
+                int(self.position[1] + self.position[3]/2)]
+
+    def get_track_range(self):
+        """ Getter method for the track range.
+
+        Returns:
+            list: Track range [X, Y, W, H].
+        """
+        return list(self.position)
+
+    def moving_track(self):
+        """ Check if the tracker was moving.
+
+        Returns:
+            bool: True iff the tracker was moving. Otherwise, False.
+        """
+        return self.moving
+
+    def lost_track(self):
+        """ Getter method for whether the track was lost during this frame.
+
+        Returns:
+            bool: True iff the tracker was lost during this frame. Otherwise
+            False.
+        """
+        return self.lost
+
+    def get_velocity(self):
+        """ Getter method for the predicted velocity of the track centre.
+
+        Returns:
+            List: Velocity [VX, VY] (px/frame). None if not predicted.
+        """
+        return None if self.velocity is None else list(self.velocity)
+
+    def get_predicted_center(self, frames = 1):
+        """ Predict the track centre a number of frames ahead, assuming
+        constant velocity.
+
+        Args:
+            frames (float, optional): Number of frames ahead. Defaults to 1.
+
+        Returns:
+            list: Predicted centre position of the tracker [X, Y].
+        """
+        centre = self.get_track_center()
+        if(self.velocity is None):
+            return centre
+        return [int(centre[0] + frames*self.velocity[0]),
+                int(centre[1] + frames*self.velocity[1])]
 
 class systemInformation():
 
@@ -429,18 +842,39 @@ class systemInformation():
         self.cellTracker = None
         self.aspTracker = None
 
+        # Compact state of all cell trackers, a row [ID, state, X, Y, W, H]
+        # per cell tracker
+        self.cellStates = np.zeros((0, 6), dtype = np.float32)
+
     def set_trackers(self, pipetteTracker, cellTracker, aspTracker):
         """ Update the tracker instances for a new frame
 
         Args:
-            pipetteTracker (basicTracker): New pipette tracker instance
-            cellTracker (basicTracker): New cell tracker instance
-            aspTracker (basicTracker): New aspiration tracker instance
+            pipetteTracker (trackerSnapshot): New pipette tracker snapshot
+            cellTracker (trackerSnapshot): New cell tracker snapshot
+            aspTracker (trackerSnapshot): New aspiration tracker snapshot
         """
         self.pipetteTracker = pipetteTracker
         self.cellTracker = cellTracker
         self.aspTracker = aspTracker
 
+    def set_cell_states(self, cellStates):
+        """ Update the state of all cell trackers for a new frame
+
+        Args:
+            cellStates (numpy.ndarray): Row [ID, state, X, Y, W, H] per cell
+            tracker, unknown positions are NaN
+        """
+        self.cellStates = cellStates
+
+    def get_cell_states(self):
+        """ Getter method for the state of all cell trackers
+
+        Returns:
+            numpy.ndarray: Row [ID, state, X, Y, W, H] per cell tracker
+        """
+        return self.cellStates
+
     def observed_pipette_position(self, factor):
         """ Compute the observed pipette position for the given config.
 